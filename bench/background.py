@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+背景切り替えベンチ：StageBackground.show() が1フレームに使う時間を計る
+- 3枚のステージテクスチャを常駐させ、毎フレーム切り替える
+- 即時切り替え / クロスフェード中のフレームの両方を計り、ms で表示して終了する
+- 目標：どちらも 1ms 未満（ファイル読み込み・ウィジェット生成が無いこと）
+- テクスチャを作るのでウィンドウ（GL）が必要
+
+使い方：
+    python -m bench.background --switches 300
+"""
+import argparse
+from time import perf_counter
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
+
+from utils.background import StageBackground
+
+NAMES = ("stage1_bg.png", "stage2_bg.png", "stage3_bg.png")
+
+def _solid(size, rgb):
+    tex = Texture.create(size=size, colorfmt="rgb")
+    tex.blit_buffer(bytes(rgb) * (size[0] * size[1]), colorfmt="rgb", bufferfmt="ubyte")
+    return tex
+
+def _report(name, samples):
+    s = sorted(samples)
+    p50 = s[len(s) // 2] * 1000
+    p99 = s[min(len(s) - 1, int(len(s) * 0.99))] * 1000
+    print(f"{name:12s} n={len(s):4d}  p50={p50:.4f} ms  p99={p99:.4f} ms  max={s[-1]*1000:.4f} ms")
+
+class BackgroundBench(App):
+    def __init__(self, switches, **kwargs):
+        super().__init__(**kwargs)
+        self.switches = switches
+        self.instant, self.fade, self.fade_frames = [], [], []
+        self.i = 0
+
+    def build(self):
+        self.bg = StageBackground(size=(1920, 1080))
+        for k, name in enumerate(NAMES):
+            self.bg.add(name, _solid((1920, 1080), (40 * k, 80, 120)))
+        self.bg.show(NAMES[0])
+        Clock.schedule_interval(self._tick, 0)
+        return self.bg
+
+    def _tick(self, dt):
+        name = NAMES[self.i % len(NAMES)]
+        self.i += 1
+        t0 = perf_counter()
+        if self.i <= self.switches:
+            self.bg.show(name)
+            self.instant.append(perf_counter() - t0)
+        elif self.i <= 2 * self.switches:
+            if self.bg._fade_ev is None:
+                self.bg.show(name, fade=0.1)
+                self.fade.append(perf_counter() - t0)
+            else:
+                self.bg._fade_step(dt)
+                self.fade_frames.append(perf_counter() - t0)
+        else:
+            _report("instant", self.instant)
+            _report("fade start", self.fade)
+            _report("fade frame", self.fade_frames)
+            self.stop()
+            return False
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--switches", type=int, default=300)
+    args = ap.parse_args()
+    BackgroundBench(args.switches).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+当たり判定ベンチ：全件スキャン（旧 PlayField.update）と LaneIndex を比べる
+- naive   : 全障害物について o.rect() を作って aabb_overlap
+- rebuild : LaneIndex.rebuild + first_hit（毎ステップ作り直したときのコスト。比較用）
+- indexed : World と同じ1ステップ分（scroll_by + cull + first_hit。生成時の add は1個ずつなので含めない）
+
+使い方：
+    python -m bench.collision --repeat 2000
+"""
+import argparse
+import random
+from time import perf_counter
+
+import config
+from game.collision import LaneIndex, aabb_overlap
+from game.obstacle import Obstacle
+from game.player import Player
+
+def _field(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    obs = []
+    for _ in range(n):
+        lane = rng.randrange(config.LANES)
+        obs.append(Obstacle(lane=lane, x=config.lane_x(lane), y=rng.uniform(-config.PLAYER_H, config.HEIGHT)))
+    # 実際のゲームと同じく生成順（古いものほど下）＝y 昇順に並べる
+    obs.sort(key=lambda o: o.y)
+    return obs
+
+def naive(prect, obstacles):
+    for o in obstacles:
+        if aabb_overlap(prect, o.rect()):
+            return o
+    return None
+
+def _time(fn, repeat: int) -> float:
+    t0 = perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (perf_counter() - t0) * 1e6 / repeat
+
+def run(sizes=(10, 100, 1000), repeat: int = 2000):
+    prect = Player().rect()
+    rows = []
+    for n in sizes:
+        obs = _field(n)
+        index = LaneIndex()
+
+        def rebuild():
+            index.rebuild(obs)
+            return index.first_hit(prect)
+
+        def indexed():
+            index.scroll_by(0.0)
+            index.cull()
+            return index.first_hit(prect)
+
+        index.rebuild(obs)
+        assert (naive(prect, obs) is None) == (index.first_hit(prect) is None)
+        rows.append(dict(
+            n=n,
+            naive_us=_time(lambda: naive(prect, obs), repeat),
+            rebuild_us=_time(rebuild, repeat),
+            indexed_us=_time(indexed, repeat),
+        ))
+    return rows
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=2000)
+    args = ap.parse_args()
+    print(f"{'n':>6} {'naive':>10} {'rebuild':>10} {'indexed':>10}   (us/step)")
+    for r in run(repeat=args.repeat):
+        print(f"{r['n']:>6} {r['naive_us']:>10.2f} {r['rebuild_us']:>10.2f} {r['indexed_us']:>10.2f}")
+
+if __name__ == "__main__":
+    main()
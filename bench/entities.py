@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+エンティティのベンチ：__slots__ 付きの dataclass と、同じフィールドの普通の dataclass を比べる
+- 対象：FuguWorld の Box / Fugu / Boss（どれも @dataclass(slots=True)）
+- 比較用の「普通の版」はその場で make_dataclass で作る（フィールド・メソッドは同じで __dict__ あり）
+- 計るもの：
+    bytes/obj : tracemalloc で見た1個あたりの確保量（N 個作って割る）
+    ns/obj    : 障害物ループと同じ「x を動かして右端を見る」を全個体に行う1個あたりの時間
+- Kivy もディスプレイも使わない
+
+使い方（リポジトリ直下で）：
+    python -m bench.entities
+    python -m bench.entities --count 200000 --json entities.json
+"""
+import argparse
+import dataclasses
+import json
+import tracemalloc
+from time import perf_counter
+
+from game.fugu_world import Box, Fugu, Boss
+
+ENTITIES = dict(
+    Box=(Box, lambda i: (float(i), 0.0, 100.0, 100.0)),
+    Fugu=(Fugu, lambda i: ()),
+    Boss=(Boss, lambda i: (float(i), 0.0, 0.0, 0.0)),
+)
+
+
+def unslotted(cls):
+    """cls と同じフィールド・メソッドを持つ、__slots__ 無しの dataclass。"""
+    names = {f.name for f in dataclasses.fields(cls)}
+    ns = {k: v for k, v in vars(cls).items()
+          if k not in names and (not k.startswith("__") or k == "__post_init__")}
+    fields = [(f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+              for f in dataclasses.fields(cls)]
+    return dataclasses.make_dataclass(cls.__name__, fields, namespace=ns)
+
+
+def _bytes_per_obj(cls, args, count: int) -> float:
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    objs = [cls(*args(i)) for i in range(count)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # リスト本体の分は引いておく
+    return (used - base - objs.__sizeof__()) / count
+
+
+def _ns_per_obj(cls, args, count: int, rounds: int) -> float:
+    objs = [cls(*args(i)) for i in range(count)]
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = perf_counter()
+        off = 0
+        for o in objs:
+            o.x -= 5.0
+            if o.x + o.w < 0:
+                off += 1
+        best = min(best, perf_counter() - t0)
+    return 1e9 * best / count
+
+
+def bench(count: int, rounds: int) -> dict:
+    results = {}
+    for name, (cls, args) in ENTITIES.items():
+        plain = unslotted(cls)
+        results[name] = dict(
+            fields=len(dataclasses.fields(cls)),
+            slots_bytes=_bytes_per_obj(cls, args, count),
+            dict_bytes=_bytes_per_obj(plain, args, count),
+            slots_ns=_ns_per_obj(cls, args, count, rounds),
+            dict_ns=_ns_per_obj(plain, args, count, rounds),
+        )
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--count", type=int, default=100_000)
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--json", help="結果を保存する")
+    args = ap.parse_args()
+
+    results = bench(args.count, args.rounds)
+    print(f"{'entity':<6} {'fields':>6} {'bytes/obj slots':>16} {'dict':>7} {'ns/obj slots':>13} {'dict':>7}")
+    for name, r in results.items():
+        print(f"{name:<6} {r['fields']:>6} {r['slots_bytes']:>16.0f} {r['dict_bytes']:>7.0f}"
+              f" {r['slots_ns']:>13.1f} {r['dict_ns']:>7.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(dict(count=args.count, entities=results), f, ensure_ascii=False, indent=1)
+        print(f"saved {args.json}")
+
+
+if __name__ == "__main__":
+    main()
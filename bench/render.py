@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+描画ベンチ：毎フレーム作り直す方式（旧 _draw）と PlayRenderer を比べる
+- World をヘッドレスで進めながら、描画命令の作成にかかる時間を計る
+- GL には描かない（命令オブジェクトの生成/更新コストだけを見る）
+
+使い方：
+    python -m bench.render --frames 3000 --obstacles 200
+"""
+import argparse
+from time import perf_counter
+
+from kivy.graphics import Canvas, Color, Rectangle
+
+import config
+from game.obstacle import Obstacle
+from game.world import World
+from ui.renderer import PlayRenderer
+
+def draw_immediate(canvas, world) -> int:
+    """旧 PlayField._draw と同じ処理。作った命令の数を返す。"""
+    n = 0
+    canvas.clear()
+    with canvas:
+        Color(0.05, 0.06, 0.10, 1.0); Rectangle(pos=(0, 0), size=(config.WIDTH, config.HEIGHT)); n += 2
+        Color(0.18, 0.20, 0.30, 1.0); n += 1
+        for i in range(config.LANES):
+            Rectangle(pos=(config.lane_x(i) - 2, 0), size=(4, config.HEIGHT)); n += 1
+        Color(0.12, 0.14, 0.22, 1.0); n += 1
+        Rectangle(pos=(0, 0), size=(config.WIDTH, config.PLAYER_GROUND_Y - 8)); n += 1
+        p = world.player
+        Color(0.90, 0.95, 1.0, 0.4 if world.is_invincible() else 1.0); n += 1
+        Rectangle(pos=(p.x - p.w/2, p.y - p.h/2), size=(p.w, p.h)); n += 1
+        Color(0.95, 0.35, 0.45, 1.0); n += 1
+        for o in world.obstacles:
+            Rectangle(pos=(o.x - o.w/2, o.y - o.h/2), size=(o.w, o.h)); n += 1
+    return n
+
+def _make_world(obstacles: int) -> World:
+    w = World()
+    w.player.hp = 10**9   # ベンチ中は死なない
+    step = config.HEIGHT / max(1, obstacles)
+    for i in range(obstacles):
+        lane = i % config.LANES
+        w.add_obstacle(Obstacle(lane=lane, x=config.lane_x(lane), y=i * step))
+    return w
+
+def _refill(world: World, obstacles: int):
+    # 画面外に出た分を上から補充して、障害物数をほぼ一定に保つ
+    while len(world.obstacles) < obstacles:
+        lane = len(world.obstacles) % config.LANES
+        world.add_obstacle(Obstacle(lane=lane, x=config.lane_x(lane), y=config.HEIGHT + config.PLAYER_H))
+
+def run(frames: int, obstacles: int) -> dict:
+    out = {}
+
+    world = _make_world(obstacles)
+    canvas = Canvas()
+    allocs = 0
+    t0 = perf_counter()
+    for _ in range(frames):
+        world.step(); _refill(world, obstacles)
+        allocs += draw_immediate(canvas, world)
+    out["immediate"] = dict(ms_per_frame=(perf_counter() - t0) * 1000 / frames, allocs_per_frame=allocs / frames)
+
+    world = _make_world(obstacles)
+    canvas = Canvas()
+    r = PlayRenderer(canvas)
+    r.sync(world)
+    base = r.allocated
+    t0 = perf_counter()
+    for _ in range(frames):
+        world.step(); _refill(world, obstacles)
+        r.sync(world)
+    out["retained"] = dict(ms_per_frame=(perf_counter() - t0) * 1000 / frames,
+                           allocs_per_frame=(r.allocated - base) / frames)
+    return out
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=3000)
+    ap.add_argument("--obstacles", type=int, default=200)
+    args = ap.parse_args()
+    res = run(args.frames, args.obstacles)
+    for name, r in res.items():
+        print(f"{name:10s} {r['ms_per_frame']:.3f} ms/frame  {r['allocs_per_frame']:.2f} instr/frame")
+
+if __name__ == "__main__":
+    main()
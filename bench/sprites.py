@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+スプライトの負荷テスト：2000 個の障害物・ブロックを動かして、描き方ごとの FPS を見る
+- batch   : SpriteBatch（utils/sprite_batch.py）。レイヤー1つ = Mesh 1つ = 描画命令1つ
+- widgets : 1個 = Image ウィジェット1個（以前の hugu.py と同じ）
+- 動き（はね返り・回転・色）は NumPy でまとめて計算し、描き方だけを変える
+- 画面左上に FPS・1フレームの更新時間（CPU 側）・描画命令の数を出す
+- 終了時に平均を表示する（--seconds 秒で自動終了）
+
+使い方（リポジトリ直下で。ディスプレイが必要）：
+    python -m bench.sprites --count 2000 --mode batch
+    python -m bench.sprites --count 2000 --mode widgets
+"""
+import argparse
+import os
+from time import perf_counter
+
+# Kivy に --count などのオプションを横取りさせない（kivy を import する前に設定）
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+import numpy as np
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.image import Image as CoreImage
+from kivy.core.window import Window
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+
+from utils.atlas import SPRITE_DIR, sprite_texture
+from utils.sprite_batch import sprite_layers
+
+REGIONS = ("bom.png", "block.png")
+
+
+def _texture(name):
+    return sprite_texture(name) or CoreImage(str(SPRITE_DIR / name)).texture
+
+
+class Swarm:
+    """count 個の箱をはね返らせる（描画とは無関係の配列だけ）。"""
+
+    def __init__(self, count: int, width: float, height: float, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.width, self.height = width, height
+        self.size = rng.uniform(24, 64, count).astype(np.float32)
+        self.x = rng.uniform(0, width, count).astype(np.float32)
+        self.y = rng.uniform(0, height, count).astype(np.float32)
+        self.vx = rng.uniform(-4, 4, count).astype(np.float32)
+        self.vy = rng.uniform(-4, 4, count).astype(np.float32)
+        self.angle = rng.uniform(0, 360, count).astype(np.float32)
+        self.av = rng.uniform(-6, 6, count).astype(np.float32)
+        self.tint = rng.uniform(0.5, 1.0, (count, 4)).astype(np.float32)
+        self.tint[:, 3] = 1.0
+        self.region = (np.arange(count) % 3 == 2).astype(np.int8)   # 3個に1個はブロック
+
+    def step(self):
+        self.x += self.vx
+        self.y += self.vy
+        self.angle += self.av
+        out_x = (self.x < 0) | (self.x + self.size > self.width)
+        out_y = (self.y < 0) | (self.y + self.size > self.height)
+        self.vx[out_x] *= -1
+        self.vy[out_y] *= -1
+
+
+class BatchView(Widget):
+    def __init__(self, swarm: Swarm, **kwargs):
+        super().__init__(**kwargs)
+        self.swarm = swarm
+        self.layers = sprite_layers(self.canvas, {name: _texture(name) for name in REGIONS},
+                                    capacity=len(swarm.x))
+        self.batches = list(dict.fromkeys(self.layers.values()))
+        self.masks = [swarm.region == i for i in range(len(REGIONS))]
+
+    @property
+    def instructions(self) -> int:
+        return len(self.batches)
+
+    def sync(self):
+        s = self.swarm
+        for batch in self.batches: batch.begin()
+        for name, m in zip(REGIONS, self.masks):
+            self.layers[name].draw_many(name, s.x[m], s.y[m], s.size[m], s.size[m],
+                                        angles=s.angle[m], tints=s.tint[m])
+        for batch in self.batches: batch.end()
+
+
+class WidgetView(Widget):
+    def __init__(self, swarm: Swarm, **kwargs):
+        super().__init__(**kwargs)
+        self.swarm = swarm
+        tex = [_texture(name) for name in REGIONS]
+        self.images = []
+        for i in range(len(swarm.x)):
+            img = Image(texture=tex[swarm.region[i]], size_hint=(None, None),
+                        size=(float(swarm.size[i]),) * 2, color=tuple(swarm.tint[i]))
+            self.add_widget(img)
+            self.images.append(img)
+
+    @property
+    def instructions(self) -> int:
+        return len(self.images)
+
+    def sync(self):
+        # 回転は付けない（ウィジェット方式で回すと Rotate 命令がさらに増える）
+        s = self.swarm
+        for img, x, y in zip(self.images, s.x.tolist(), s.y.tolist()):
+            img.pos = (x, y)
+
+
+class StressApp(App):
+    def __init__(self, args, **kwargs):
+        super().__init__(**kwargs)
+        self.args = args
+        self.frames = 0
+        self.cpu = 0.0
+        self.t0 = None
+
+    def build(self):
+        root = Widget()
+        self.swarm = Swarm(self.args.count, Window.width, Window.height)
+        view_cls = BatchView if self.args.mode == "batch" else WidgetView
+        self.view = view_cls(self.swarm)
+        root.add_widget(self.view)
+        self.label = Label(pos=(10, Window.height - 60), size=(400, 50), halign="left")
+        root.add_widget(self.label)
+        Clock.schedule_interval(self.tick, 0)
+        Clock.schedule_interval(self.report, 0.5)
+        if self.args.seconds > 0:
+            Clock.schedule_once(lambda dt: self.stop(), self.args.seconds)
+        return root
+
+    def tick(self, dt):
+        t = perf_counter()
+        if self.t0 is None:
+            self.t0 = t
+        self.swarm.step()
+        self.view.sync()
+        self.cpu += perf_counter() - t
+        self.frames += 1
+
+    def report(self, dt):
+        if self.frames:
+            self.label.text = (f"{self.args.mode}  {self.args.count} sprites  {Clock.get_fps():.0f} fps  "
+                               f"update {1000 * self.cpu / self.frames:.2f} ms  "
+                               f"draw instructions {self.view.instructions}")
+
+    def on_stop(self):
+        if self.frames and self.t0 is not None:
+            wall = perf_counter() - self.t0
+            print(f"{self.args.mode}: {self.args.count} sprites, {self.frames / wall:.1f} fps, "
+                  f"update {1000 * self.cpu / self.frames:.2f} ms/frame, "
+                  f"{self.view.instructions} draw instructions")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--count", type=int, default=2000)
+    ap.add_argument("--mode", choices=("batch", "widgets"), default="batch")
+    ap.add_argument("--seconds", type=float, default=20.0, help="0 なら閉じるまで")
+    args = ap.parse_args()
+    StressApp(args).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+ステップベンチ一式：FuguWorld（描画なし）を決まった場面で回し、1ステップの中身を計る
+- 場面（seed 固定なので毎回同じ。スコアは数えるがフィーバー・ボスには移らない）：
+    empty  : 何も無い画面（ステップの固定費）
+    normal : Normal の定常状態（Normal の出現間隔ぶんの間隔で障害物・ブロックが流れ続ける）
+    hard   : Hard のピーク（間隔を詰めて画面いっぱい）
+    boss   : ボス戦・切り身 50 個が常に飛んでいる
+    fever  : フィーバー中・吹き飛び演出 40 個
+    particles : 粒子 3000 個（命中の火花を出し続ける）
+- 区間ごとの時間（fugu / timers / boss / projectiles / effects / collision / obstacles）
+- 1秒あたりのステップ数（ops/s）と、tracemalloc で見たメモリ確保（1ステップあたりの
+  増えたブロック数 = リークの目安、区間中のピーク KiB = 一時確保の目安）
+- ベンチ中はゲームオーバーにしない（当たり判定の計算はそのまま行う）
+- 障害物・切り身などの数は refill で一定に保ち、計測の3回（区間・素の時間・メモリ）は
+  それぞれ新しい場面で行う。終わったときの数が場面の想定と違えば AssertionError
+- 結果は JSON に保存でき、--compare で前のコミットの結果と比べられる
+- Kivy もディスプレイも使わない
+
+使い方（リポジトリ直下で）：
+    python -m bench.suite --steps 5000 --json bench_before.json
+    python -m bench.suite --steps 5000 --compare bench_before.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import tracemalloc
+from time import perf_counter
+
+from game.fugu_world import FuguWorld, MODE_PRESETS, Box, BASE_HZ, GROUND_Y, SCROLL, STEP_SECTIONS
+from utils.profiler import FrameProfiler
+
+SEED = 1234
+
+
+def _pinned(w: FuguWorld) -> FuguWorld:
+    # 当たり判定は行うが、当たっても終わらない
+    w.game_over = lambda: None
+    # スコアは数えるが、フィーバー・ボスには移らない（場面が途中で変わらないように）
+    def add_score(p):
+        w.score += p
+    w._add_score = add_score
+    # 出現はタイマーではなく各場面の refill で行う（数を一定にする）
+    w._spawn_timer.cancel()
+    return w
+
+
+def _stream(w: FuguWorld, gap: float):
+    """
+    障害物を間隔 gap、ブロックを間隔 3 * gap で画面いっぱいに並べる。
+    左に消えた分を右に足して数を一定に保つ refill と、その数 (障害物, ブロック) を返す。
+    """
+    span = w.width + 100
+    n_obs, n_blk = int(span // gap) + 1, int(span // (3 * gap)) + 1
+    w.obstacles[:0] = [Box(w.width - i * gap, GROUND_Y, 100, 100) for i in reversed(range(n_obs))]
+    w.blocks[:0] = [Box(w.width - (3 * i + 0.5) * gap, 150 + (i * 37) % 150, w.block_width, 50, kind="block")
+                    for i in reversed(range(n_blk))]
+
+    def refill(w):
+        while len(w.obstacles) < n_obs:
+            x = max(w.width, w.obstacles[-1].x + gap) if w.obstacles else w.width
+            w.obstacles.append(Box(x, GROUND_Y, 100, 100))
+        while len(w.blocks) < n_blk:
+            x = max(w.width, w.blocks[-1].x + 3 * gap) if w.blocks else w.width
+            w.blocks.append(Box(x, 150 + (len(w.blocks) * 37) % 150, w.block_width, 50, kind="block"))
+    return refill, n_obs, n_blk
+
+
+def scene_empty():
+    w = _pinned(FuguWorld(*MODE_PRESETS["Normal"], seed=SEED))
+    return w, None, dict(obstacles=0, blocks=0, projectiles=0, boss=False, fever=False)
+
+
+def scene_normal():
+    spawn, g, b = MODE_PRESETS["Normal"]
+    w = _pinned(FuguWorld(spawn, g, b, seed=SEED))
+    refill, n_obs, n_blk = _stream(w, spawn * BASE_HZ * SCROLL)
+    return w, refill, dict(obstacles=n_obs, blocks=n_blk, projectiles=0, boss=False, fever=False)
+
+
+def scene_hard():
+    w = _pinned(FuguWorld(*MODE_PRESETS["Hard"], seed=SEED))
+    refill, n_obs, n_blk = _stream(w, 40)
+    return w, refill, dict(obstacles=n_obs, blocks=n_blk, projectiles=0, boss=False, fever=False)
+
+
+def scene_boss():
+    w = _pinned(FuguWorld(*MODE_PRESETS["Normal"], seed=SEED))
+    w.spawn_boss()
+    w.boss_hp = 10**9
+    cx, cy = w.fugu.center
+
+    def refill(w):
+        # 切り身を常に 50 個飛ばしておく（遠くを狙わせて長く残す）
+        while len(w.projectiles) < 50:
+            i = len(w.projectiles)
+            w.projectiles.add(cx, cy, w.width * (0.3 + 0.014 * i), w.height + 2000)
+    refill(w)
+    return w, refill, dict(obstacles=0, blocks=0, projectiles=50, boss=True, fever=False)
+
+
+def scene_fever():
+    w = _pinned(FuguWorld(*MODE_PRESETS["Normal"], seed=SEED))
+    w.start_fever()
+    stream, n_obs, n_blk = _stream(w, 90)
+
+    def refill(w):
+        if not w.is_fever:
+            w.start_fever()
+        while len(w.particles) < 40:
+            i = len(w.particles)
+            w.particles.blast(w.fugu.x + 10 * i, w.height * 0.5 + 5 * i, 100)
+        stream(w)   # ハンマーで飛ばした分も足す
+    refill(w)
+    return w, refill, dict(obstacles=n_obs, blocks=n_blk, projectiles=0, boss=False, fever=True)
+
+
+def scene_particles():
+    w = _pinned(FuguWorld(*MODE_PRESETS["Normal"], seed=SEED))
+
+    def refill(w):
+        short = 3000 - len(w.particles)
+        if short > 0:
+            w.particles.hit(w.width / 2, w.height / 2, n=short)
+    refill(w)
+    return w, refill, dict(obstacles=0, blocks=0, projectiles=0, boss=False, fever=False, particles=3000)
+
+
+def _entities(w: FuguWorld) -> dict:
+    return dict(obstacles=len(w.obstacles), blocks=len(w.blocks), projectiles=len(w.projectiles),
+                particles=len(w.particles), boss=w.boss is not None, fever=w.is_fever)
+
+
+def _check(name: str, w: FuguWorld, refill, expect: dict):
+    """計測のあと、場面が想定のままか（ボス戦に移っていないか・数が減っていないか）を確かめる。"""
+    if refill: refill(w)
+    got = _entities(w)
+    bad = {k: (got[k], v) for k, v in expect.items() if got[k] != v}
+    assert not bad, f"{name}: 場面が変わっています " + ", ".join(f"{k}={g} (想定 {v})" for k, (g, v) in bad.items())
+
+
+SCENES = dict(empty=scene_empty, normal=scene_normal, hard=scene_hard, boss=scene_boss, fever=scene_fever,
+              particles=scene_particles)
+
+
+def bench(name: str, steps: int) -> dict:
+    prof = FrameProfiler(capacity=steps, sections=STEP_SECTIONS)
+
+    # 1) 時間：区間ごと（profiler あり）と、素のステップ（profiler なし）。どれも新しい場面で
+    w, refill, expect = SCENES[name]()
+    w.profiler = prof
+    for _ in range(steps):
+        if refill: refill(w)
+        prof.begin_frame()
+        w.step()
+        prof.end_frame()
+    w.profiler = None
+    _check(name, w, refill, expect)
+
+    w, refill, expect = SCENES[name]()
+    t = 0.0
+    for _ in range(steps):
+        if refill: refill(w)
+        t0 = perf_counter()
+        w.step()
+        t += perf_counter() - t0
+    _check(name, w, refill, expect)
+
+    # 2) メモリ確保
+    w, refill, expect = SCENES[name]()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    for _ in range(steps):
+        if refill: refill(w)
+        w.step()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in after.compare_to(before, "filename"))
+    _check(name, w, refill, expect)
+
+    sections = {}
+    for s in STEP_SECTIONS:
+        col = prof.column(s)
+        sections[s] = dict(mean_us=1000.0 * sum(col) / len(col), p99_us=1000.0 * prof.percentiles(s)[2])
+    return dict(
+        steps=steps,
+        ops_per_s=steps / t if t > 0 else 0.0,
+        step_us=1e6 * t / steps,
+        sections=sections,
+        alloc_blocks_per_step=blocks / steps,
+        alloc_peak_kib=(peak - base) / 1024.0,
+        entities=_entities(w),
+    )
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--steps", type=int, default=3000)
+    ap.add_argument("--scenes", nargs="+", default=list(SCENES), choices=list(SCENES))
+    ap.add_argument("--json", help="結果を保存する")
+    ap.add_argument("--compare", help="前に保存した JSON と比べる")
+    args = ap.parse_args()
+
+    results = {name: bench(name, args.steps) for name in args.scenes}
+    old = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)["scenes"]
+
+    print(f"{'scene':<8} {'ops/s':>10} {'us/step':>8} {'blocks/step':>12} {'peak KiB':>9}   "
+          + " ".join(f"{s[:8]:>8}" for s in STEP_SECTIONS) + "  (mean us)")
+    for name, r in results.items():
+        line = (f"{name:<8} {r['ops_per_s']:>10,.0f} {r['step_us']:>8.2f} {r['alloc_blocks_per_step']:>12.3f}"
+                f" {r['alloc_peak_kib']:>9.1f}   "
+                + " ".join(f"{r['sections'][s]['mean_us']:>8.2f}" for s in STEP_SECTIONS))
+        if name in old:
+            line += f"  ({(r['step_us'] / old[name]['step_us'] - 1):+.1%} vs {args.compare})"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(dict(commit=_commit(), python=platform.python_version(), steps=args.steps, scenes=results),
+                      f, ensure_ascii=False, indent=1)
+        print(f"saved {args.json}")
+
+
+if __name__ == "__main__":
+    main()
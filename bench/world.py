@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+World のヘッドレス実行（スモークテスト兼ベンチ）：Kivy なしで World を回し、リプレイで再現できるか確かめる
+- 障害物をよけるボット（入力用の乱数は World とは別）で seconds 秒ぶん step する
+- 記録した Replay を JSON に往復させて replay_world で再生し、最後の状態が一致するかを比べる
+- リスト版と vectorized（ObstacleArray）版の両方。1秒の実時間で何秒ぶん進むか（ボットの分も込み）を表示する
+- 一致しなければ終了コード 1（CI 用）
+
+使い方：
+    python -m bench.world
+    python -m bench.world --seconds 600 --seed 7
+"""
+import argparse
+import random
+import sys
+from time import perf_counter
+
+import config
+from game.replay import Replay, replay_world
+from game.world import World
+
+def _state(w: World):
+    p = w.player
+    obs = [w.obstacles.get(i) for i in range(len(w.obstacles))] if w.vectorized else list(w.obstacles)
+    return (w.steps, round(w.score, 6), p.hp, round(p.inv_until, 6), p.lane, round(p.y, 6),
+            [(o.lane, round(o.y, 6)) for o in obs])
+
+def _danger(w: World, lane: int, ahead: float) -> bool:
+    """lane で、プレイヤーの少し下〜ahead 秒先に届く高さまでに障害物があるか。"""
+    lo = w.player.y - config.PLAYER_H
+    hi = w.player.y + config.PLAYER_H + w.speed * ahead
+    for i in range(len(w.obstacles)):
+        o = w.obstacles.get(i) if w.vectorized else w.obstacles[i]
+        if o.lane == lane and lo <= o.y <= hi:
+            return True
+    return False
+
+def play(seconds: float, seed: int, vectorized: bool = False) -> World:
+    """
+    ボットで遊ぶ：自分のレーンに障害物が迫ったら空いているレーンへよけ、安全なときはたまに跳ぶ。
+    入力が盤面しだいなので、再生がどこかでずれれば被弾や最後の状態も変わる。
+    """
+    w = World(seed=seed, vectorized=vectorized)
+    bot = random.Random(seed ^ 0x5EED)
+    for _ in range(int(round(seconds / w.dt))):
+        lane = w.player.lane
+        if _danger(w, lane, 0.4):
+            safe = [i for i in range(config.LANES) if not _danger(w, i, 0.6)]
+            if safe:
+                target = min(safe, key=lambda i: (abs(i - lane), bot.random()))
+                if target < lane:
+                    w.move_left()
+                elif target > lane:
+                    w.move_right()
+        elif bot.random() < 0.01 and not _danger(w, lane, 1.5):
+            w.jump()
+        w.step()
+    return w
+
+def check(seconds: float, seed: int, vectorized: bool) -> dict:
+    t0 = perf_counter()
+    w = play(seconds, seed, vectorized)
+    elapsed = perf_counter() - t0
+    replay = Replay.loads(w.replay.dumps())
+    r = replay_world(replay, vectorized)
+    return dict(steps=w.steps, inputs=len(replay.events), hp=w.player.hp, sim_per_sec=w.t / elapsed,
+                match=_state(w) == _state(r))
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seconds", type=float, default=300.0, help="シミュレーション上の秒数")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    ok = True
+    for vectorized in (False, True):
+        r = check(args.seconds, args.seed, vectorized)
+        ok &= r["match"]
+        print(f"{'vectorized' if vectorized else 'list':10s} steps={r['steps']}  inputs={r['inputs']}  hp={r['hp']}  "
+              f"{r['sim_per_sec']:.0f} sim-s/s  replay={'ok' if r['match'] else 'MISMATCH'}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,50 @@
 # -*- coding: utf-8 -*-
+import math
+
 WIDTH, HEIGHT = 960, 540
 GROUND_Y = 120          # 地面の高さ（下からのオフセット）
 SPEED = 4.0             # スクロール速度（Day1では一定）
 JUMP_VEL = 11.5         # 初速（重力はGRAVITYで毎フレーム加算）
 GRAVITY = 0.55
 BG = (0.05, 0.06, 0.08, 1.0)
+
+# --- レーン制ランナー（game/ ・ scenes/play.py）用：こちらは「秒」単位 ---
+FPS = 60                # 固定ステップ（game/world.py の FIXED_DT = 1/FPS）
+LANES = 3
+PLAYER_W, PLAYER_H = 56, 56
+PLAYER_GROUND_Y = GROUND_Y + PLAYER_H * 0.5   # プレイヤー中心の地上での y
+PLAYER_GRAVITY = GRAVITY * FPS * FPS          # px/s^2（Day1〜の GRAVITY は 1フレームあたり）
+JUMP_VELOCITY = JUMP_VEL * FPS                # px/s
+START_HP = 3
+INVULN_TIME = 1.0       # 被弾後の無敵時間（秒）
+HUD_DEFAULT_VISIBLE = True
+
+# 生成間隔（game/spawner.py）
+SPAWN_MODE = "periodic"         # "periodic"（一定＋揺らぎ） / "poisson"
+SPAWN_BASE_INTERVAL = 0.9
+SPAWN_RANDOM_JITTER = 0.25
+SPAWN_MIN_INTERVAL = 0.35
+
+# 速度カーブ（障害物が落ちてくる速さ px/s）
+BASE_SPEED = SPEED * FPS
+MAX_SPEED = BASE_SPEED * 3.0
+SPEED_CURVE = "linear"          # "linear" / "step" / "ease"
+SPEED_GAIN = 6.0                # linear: 1秒ごとに増える速さ
+SPEED_STEP, SPEED_STEP_EVERY = 60.0, 15.0   # step: 15秒ごとに +60
+SPEED_EASE_TAU = 60.0           # ease: MAX_SPEED に近づく速さ（秒）
+
+
+def lane_x(lane: int) -> float:
+    """レーン番号 0..LANES-1 → レーン中心の x（画面を LANES+1 等分）"""
+    return WIDTH * (lane + 1) / (LANES + 1)
+
+
+def speed_curve(t: float) -> float:
+    """経過時間 t（秒）→ 速さ。SPEED_CURVE で形を切り替える。"""
+    if SPEED_CURVE == "step":
+        v = BASE_SPEED + SPEED_STEP * int(t // SPEED_STEP_EVERY)
+    elif SPEED_CURVE == "ease":
+        v = MAX_SPEED - (MAX_SPEED - BASE_SPEED) * math.exp(-t / SPEED_EASE_TAU)
+    else:
+        v = BASE_SPEED + SPEED_GAIN * t
+    return min(v, MAX_SPEED)
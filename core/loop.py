@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+ゲームループ（Kivy 非依存）：1つの時計で「固定ステップのシミュレーション」と「タイマー」を回す
+目的：
+- 描画のフレーム時間がバラバラでも、シミュレーションは常に同じ dt で進める（アキュムレータ）
+  → 30Hz / 60Hz / 144Hz のどのディスプレイでも同じ結果になる
+- 出現間隔・フィーバー終了などの「○秒後」はシミュレーション時間の Timers で管理する
+  （Clock.schedule_once を別々に持たない → 一時停止やリプレイでもズレない）
+- 描画側は alpha（0〜1）で前ステップと今ステップの間を補間して滑らかに見せる
+- 1フレームで回すステップ数に上限を付け、追いつけない分は捨てて数える（dropped / overruns）
+
+使い方（例）：
+    loop = FixedStepLoop(world.step, dt=1/60)
+    Clock.schedule_interval(lambda dt: (loop.advance(dt), view.sync(loop.alpha)), 0)
+"""
+
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Callable, List, Optional, Tuple
+
+DEFAULT_DT = 1.0 / 60.0
+MAX_STEPS_PER_FRAME = 5   # 処理落ち時に追いつこうとして固まらないための上限
+
+
+class Timer:
+    """Timers.after / every が返す予約。cancel() で取り消せる。"""
+
+    __slots__ = ("due", "interval", "fn", "cancelled")
+
+    def __init__(self, due: float, interval: Optional[float], fn: Callable[[], None]):
+        self.due = due
+        self.interval = interval
+        self.fn = fn
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Timers:
+    """シミュレーション時間で動くタイマー。update(dt) はステップごとに呼ぶ。"""
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._seq = count()   # 同じ時刻なら登録順
+
+    def after(self, delay: float, fn: Callable[[], None]) -> Timer:
+        return self._push(Timer(self.now + delay, None, fn))
+
+    def every(self, interval: float, fn: Callable[[], None]) -> Timer:
+        return self._push(Timer(self.now + interval, interval, fn))
+
+    def _push(self, t: Timer) -> Timer:
+        heapq.heappush(self._heap, (t.due, next(self._seq), t))
+        return t
+
+    def update(self, dt: float):
+        self.now += dt
+        heap = self._heap
+        while heap and heap[0][0] <= self.now:
+            _, _, t = heapq.heappop(heap)
+            if t.cancelled:
+                continue
+            t.fn()
+            if t.interval is not None and not t.cancelled:
+                t.due += t.interval
+                self._push(t)
+
+    def clear(self):
+        self._heap.clear()
+        self.now = 0.0
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, t in self._heap if not t.cancelled)
+
+
+class FixedStepLoop:
+    def __init__(self, step: Callable[[], None], dt: float = DEFAULT_DT,
+                 max_steps: int = MAX_STEPS_PER_FRAME):
+        """step: 1ステップ（dt 秒）進める関数。dt はシミュレーション側と同じ値にする。"""
+        self.step = step
+        self.dt = dt
+        self.max_steps = max_steps
+        self._acc = 0.0
+        self.steps = 0       # 実行したステップ数
+        self.frames = 0      # advance を呼んだ回数
+        self.dropped = 0     # 追いつけずに捨てたステップ数
+        self.overruns = 0    # 上限に当たったフレーム数
+
+    def advance(self, frame_dt: float) -> int:
+        """フレーム時間を貯め、固定 dt で何ステップ進めたかを返す。"""
+        self._acc += frame_dt
+        n = 0
+        while self._acc >= self.dt:
+            if n == self.max_steps:
+                # 追いつけない分は捨てる（スパイラル防止）。端数は補間用に残す
+                lost = int(self._acc / self.dt)
+                self.dropped += lost
+                self.overruns += 1
+                self._acc -= lost * self.dt
+                break
+            self.step()
+            self._acc -= self.dt
+            n += 1
+        self.steps += n
+        self.frames += 1
+        return n
+
+    @property
+    def alpha(self) -> float:
+        """前ステップ→今ステップの間のどこを描くか（0〜1）。"""
+        return self._acc / self.dt
+
+    def reset(self):
+        self._acc = 0.0
+        self.steps = self.frames = self.dropped = self.overruns = 0
+
+    def stats(self) -> dict:
+        return dict(steps=self.steps, frames=self.frames, dropped=self.dropped, overruns=self.overruns)
+
+
+def lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+[D] Collision: 当たり判定
+- aabb_overlap: 矩形 (left, bottom, right, top) 同士の重なり
+- LaneIndex: 障害物をレーンごとのバケツに分けておく（broad-phase）
+  → プレイヤーのレーン（と、はみ出しうる隣レーン）の y 範囲だけを調べればよい
+- バケツは毎ステップ作り直さない：生成時に add、流れた分は scroll_by、消えたら cull
+  全部同じ速さで流れるので、y の順番は変わらない。y の代わりに「y + それまでに流れた量」
+  （障害物ごとに一定）をキーにすれば、キーは生成順に増えていくだけで並べ直しも要らない
+"""
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+import config
+from game.obstacle import Obstacle
+
+Rect = Tuple[float, float, float, float]
+
+def aabb_overlap(a: Rect, b: Rect) -> bool:
+    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+# キーと実際の y の誤差（浮動小数の足し算の順番の違い）を吸収する余白
+_EPS = 1.0
+
+class LaneIndex:
+    def __init__(self, lanes: int = config.LANES):
+        self.lanes = lanes
+        self.buckets: List[List[Obstacle]] = [[] for _ in range(lanes)]
+        self.keys: List[List[float]] = [[] for _ in range(lanes)]   # y + scroll（昇順）
+        self.scroll = 0.0     # これまでに流れた量
+        self.max_hw = 0.0
+        self.max_hh = 0.0
+
+    def clear(self):
+        for b in self.buckets:
+            b.clear()
+        for k in self.keys:
+            k.clear()
+        self.scroll = 0.0
+        self.max_hw = self.max_hh = 0.0
+
+    def add(self, o: Obstacle):
+        """生成した障害物を入れる。上から出てくるので、ふつうは末尾に足すだけ。"""
+        b, keys = self.buckets[o.lane], self.keys[o.lane]
+        key = o.y + self.scroll
+        if keys and key < keys[-1]:
+            i = bisect_right(keys, key)
+            keys.insert(i, key)
+            b.insert(i, o)
+        else:
+            keys.append(key)
+            b.append(o)
+        if o.w * 0.5 > self.max_hw: self.max_hw = o.w * 0.5
+        if o.h * 0.5 > self.max_hh: self.max_hh = o.h * 0.5
+
+    def scroll_by(self, dy: float):
+        """全部の障害物が dy だけ下に流れた（Obstacle.update と同じ量を渡す）。"""
+        self.scroll += dy
+
+    def cull(self):
+        """先頭（いちばん下）から、消えた障害物を落とす。途中で当たって消えたものは先頭に来たときに落ちる。"""
+        for b, keys in zip(self.buckets, self.keys):
+            n = 0
+            while n < len(b) and not b[n].alive:
+                n += 1
+            if n:
+                del b[:n]
+                del keys[:n]
+
+    def rebuild(self, obstacles: List[Obstacle]):
+        """まとめて入れ直す（ベンチや、途中から作るとき用）。"""
+        self.clear()
+        for o in obstacles:
+            if o.alive:
+                self.add(o)
+
+    def _lanes_for(self, r: Rect):
+        # 障害物の中心 x がこの範囲にあるレーンだけが重なりうる
+        lo, hi = r[0] - self.max_hw, r[2] + self.max_hw
+        for i in range(self.lanes):
+            lx = config.lane_x(i)
+            if lo <= lx <= hi:
+                yield i
+
+    def query(self, r: Rect) -> List[Obstacle]:
+        """r と重なる可能性がある障害物（broad-phase の候補）。"""
+        out: List[Obstacle] = []
+        for i in self._lanes_for(r):
+            keys = self.keys[i]
+            a = bisect_left(keys, r[1] - self.max_hh - _EPS + self.scroll)
+            b = bisect_right(keys, r[3] + self.max_hh + _EPS + self.scroll)
+            out.extend(self.buckets[i][a:b])
+        return out
+
+    def first_hit(self, r: Rect) -> Optional[Obstacle]:
+        for o in self.query(r):
+            if o.alive and aabb_overlap(r, o.rect()):
+                return o
+        return None
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+"""
+FuguWorld: hugu.py（フグ・ランナー）のゲームロジックを描画なしで動かす
+- Kivy を import しない → ウィンドウ無しでバランス調整・一括シミュレーションができる
+- 1ステップ = dt 秒（既定 1/60）。速度・重力は元の「60Hz の1フレームあたり」の値のまま持ち、
+  dt * 60 倍して使う → どのリフレッシュレートでも同じ動きになる
+- 出現間隔・フィーバー終了・特殊演出は self.timers（シミュレーション時間）で管理
+- 乱数は seed から作った self.rng だけ。入力は self.replay に記録（ステップ番号つき）。
+  管理パネルからの add_score / trigger_special も記録する（記録しないと再生で結果が変わる）
+- 見た目・音に関わる出来事は self.events に積む → 描画側（hugu.py の Game）が drain() で受け取る
+- 各エンティティは前ステップの位置 (px, py) も持つ → 描画側で補間できる
+- 切り身は ProjectileArray（NumPy）でまとめて動かし、ボスとの当たり判定も一括で行う
+- 吹き飛び・命中の火花・フィーバーのキラキラは ParticleSystem（game/particles.py）。
+  見た目だけなので effects=False で止められる（一括シミュレーション用。結果は変わらない）
+- self.profiler に FrameProfiler(sections=STEP_SECTIONS) を入れると区間ごとの時間を計る（bench/suite.py）
+
+座標・大きさは hugu.py と同じ（左下原点、幅 width / 高さ height のウィンドウ）。
+hugu.py と同じくリポジトリ直下から実行する前提（`game.` / `core.` で import）。
+"""
+import random
+from dataclasses import dataclass, field
+from itertools import count
+from typing import List, Optional, Sequence, Tuple
+
+from core.loop import Timers
+from game.replay import Replay, JUMP, TOUCH, ADD_SCORE, TRIGGER_SPECIAL
+from game.projectile_array import ProjectileArray
+from game.particles import ParticleSystem
+
+BASE_HZ = 60.0          # 下の速度は「60Hz の1フレームあたり」の値
+GROUND_Y = 100
+SCROLL = 8              # 障害物・ブロックの左移動
+JUMP_VY = 15
+KIRIMI_SPEED = 20
+BOSS_HP = 100
+FEVER_SCORES = (10, 20)
+FEVER_TIME = 8.0
+FEVER_SPAWN_INTERVAL = 0.3
+BOSS_SCORE = 30
+SPECIAL_GRAVITY = -2.0
+SPECIAL_TIME = 2.0
+SPARKLE_EVERY = 4       # フィーバー中、何ステップごとにキラキラを出すか
+
+# 難易度プリセット: [出現間隔(秒), 重力, ブロック幅]（tools/sweep.py で調整する）
+MODE_PRESETS = {
+    "Easy": [2.5, -0.25, 250],
+    "Normal": [1.8, -0.35, 180],
+    "Hard": [1.2, -0.50, 120]
+}
+
+# self.events に積む出来事（name, 値）
+SCORE, FEVER_START, FEVER_END, BOSS, BOSS_HIT, SPECIAL, SPECIAL2, GAME_OVER, CLEAR = (
+    "score", "fever_start", "fever_end", "boss", "boss_hit", "special", "special2", "game_over", "clear")
+
+# step() の計測区間（profiler.lap の名前）
+STEP_SECTIONS = ("fugu", "timers", "boss", "projectiles", "effects", "collision", "obstacles")
+
+_ids = count(1)
+
+
+# エンティティは __slots__ 付き（インスタンスごとの __dict__ を持たない → 小さく、属性アクセスも速い）
+@dataclass(slots=True)
+class Box:
+    """障害物（bom）・ブロックの共通の箱。kind で見た目を分ける。"""
+    x: float
+    y: float
+    w: float
+    h: float
+    kind: str = "bom"          # "bom" / "block"
+    passed: bool = False
+    px: float = 0.0
+    py: float = 0.0
+    id: int = field(default_factory=lambda: next(_ids))
+
+    def __post_init__(self):
+        self.px, self.py = self.x, self.y
+
+    @property
+    def right(self) -> float:
+        return self.x + self.w
+
+    @property
+    def top(self) -> float:
+        return self.y + self.h
+
+
+@dataclass(slots=True)
+class Fugu:
+    x: float = 100
+    y: float = GROUND_Y
+    w: float = 110
+    h: float = 110
+    vy: float = 0.0
+    on_ground: bool = True
+    invincible: bool = False
+    angle: float = 0.0
+    px: float = 100
+    py: float = GROUND_Y
+
+    @property
+    def right(self) -> float:
+        return self.x + self.w
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.x + self.w / 2, self.y + self.h / 2)
+
+    def hammer(self) -> Box:
+        # フィーバー中のハンマー（当たり判定用。80x80）
+        return Box(self.right - 20, self.y + 15, 80, 80, kind="hammer", id=0)
+
+
+@dataclass(slots=True)
+class Boss:
+    x: float
+    y: float
+    tx: float
+    ty: float
+    w: float = 400
+    h: float = 400
+    px: float = 0.0
+    py: float = 0.0
+
+    def __post_init__(self):
+        self.px, self.py = self.x, self.y
+
+
+def overlap(a, b) -> bool:
+    """Widget.collide_widget と同じ判定（端が接していても当たり）。"""
+    return not (a.x + a.w < b.x or a.x > b.x + b.w or a.y + a.h < b.y or a.y > b.y + b.h)
+
+
+class FuguWorld:
+    def __init__(self, spawn_interval: float = 2.5, gravity: float = -0.25, block_width: float = 250,
+                 width: int = 1280, height: int = 720, seed: Optional[int] = None, dt: float = 1 / 60.0,
+                 effects: bool = True):
+        self.spawn_interval, self.gravity, self.block_width = spawn_interval, gravity, block_width
+        self.width, self.height = width, height
+        self.dt = dt
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.replay = Replay(seed=self.seed, dt=dt, meta=dict(
+            spawn_interval=spawn_interval, gravity=gravity, block_width=block_width, width=width, height=height))
+        self.timers = Timers()
+        self.events: List[tuple] = []
+
+        self.fugu = Fugu()
+        self.obstacles: List[Box] = []
+        self.blocks: List[Box] = []
+        self.effects = effects
+        self.particles = ParticleSystem(seed=self.seed)
+        self.projectiles = ProjectileArray()
+        self.boss: Optional[Boss] = None
+        self.boss_hp = BOSS_HP
+
+        self.score = 0
+        self.steps = 0
+        self.t = 0.0
+        self.is_game_over = self.is_cleared = self.is_fever = self.boss_spawned = False
+        self._spawn_timer = self.timers.after(self.spawn_interval, self._spawn)
+        self.profiler = None
+
+    @classmethod
+    def from_settings(cls, settings: Sequence[float], **kwargs) -> "FuguWorld":
+        """hugu.py の settings（[出現間隔, 重力, ブロック幅, ...]）から作る。"""
+        return cls(settings[0], settings[1], settings[2], **kwargs)
+
+    # --- 入力 ---
+    def jump(self):
+        self.replay.record(self.steps, JUMP)
+        self._jump()
+
+    def touch(self, x: float, y: float):
+        if self.is_over():
+            return
+        self.replay.record(self.steps, TOUCH, x, y)
+        # ボス戦中は切り身を発射
+        if self.boss_spawned:
+            cx, cy = self.fugu.center
+            self.projectiles.add(cx, cy, x, y)
+        self._jump()
+
+    def _jump(self):
+        if self.fugu.on_ground:
+            self.fugu.vy = JUMP_VY
+
+    # --- 状態 ---
+    def is_over(self) -> bool:
+        return self.is_game_over or self.is_cleared
+
+    def drain(self) -> List[tuple]:
+        ev, self.events = self.events, []
+        return ev
+
+    @property
+    def stage(self) -> int:
+        return 3 if self.score >= 20 else 2 if self.score >= 10 else 1
+
+    # --- スコア・イベント ---
+    def add_score(self, p: int):
+        """外から（管理パネル）のスコア加算。入力として記録する。"""
+        self.replay.record(self.steps, ADD_SCORE, p)
+        self._add_score(p)
+
+    def _add_score(self, p: int):
+        if self.boss_spawned or self.is_cleared:
+            return
+        self.score += p
+        self.events.append((SCORE, self.score))
+        # フィーバー条件: 10, 20
+        if self.score in FEVER_SCORES and not self.is_fever:
+            self.start_fever()
+        # ボス出現条件: 30
+        if self.score >= BOSS_SCORE and not self.boss_spawned:
+            self.spawn_boss()
+
+    def start_fever(self):
+        self.is_fever = True
+        self.fugu.invincible = True
+        self.events.append((FEVER_START, None))
+        self.timers.after(FEVER_TIME, self.stop_fever)
+
+    def stop_fever(self):
+        self.is_fever = False
+        self.fugu.invincible = False
+        self.events.append((FEVER_END, None))
+
+    def spawn_boss(self):
+        self.boss_spawned = True
+        self._spawn_timer.cancel()
+        self.obstacles.clear()
+        self.blocks.clear()
+        self.boss = Boss(self.width, self.height / 2, self.width - 450, self.height / 2)
+        self.events.append((BOSS, self.boss_hp))
+
+    def trigger_special(self):
+        self.replay.record(self.steps, TRIGGER_SPECIAL)
+        self._trigger_special()
+
+    def _trigger_special(self):
+        self.gravity = SPECIAL_GRAVITY
+        self.obstacles.append(Box(self.width, 0, 800, 800))
+        self.events.append((SPECIAL, None))
+        self.timers.after(SPECIAL_TIME, self._special2)
+
+    def _special2(self):
+        self.events.append((SPECIAL2, None))
+        self.game_over()
+
+    def game_over(self):
+        if self.is_game_over:
+            return
+        self.is_game_over = True
+        self._finish()
+        self.events.append((GAME_OVER, self.score))
+
+    def win(self):
+        self.is_cleared = True
+        self.boss = None
+        self._finish()
+        self.events.append((CLEAR, self.score))
+
+    def _finish(self):
+        self.replay.steps = self.steps
+
+    def _spawn(self):
+        if self.is_game_over or self.boss_spawned:
+            return
+        if self.rng.random() < 0.6:
+            self.obstacles.append(Box(self.width, GROUND_Y, 100, 100))
+        else:
+            self.blocks.append(Box(self.width, 150 + self.rng.randint(0, 150), self.block_width, 50, kind="block"))
+        self._spawn_timer = self.timers.after(
+            FEVER_SPAWN_INTERVAL if self.is_fever else self.spawn_interval, self._spawn)
+
+    # --- 進行 ---
+    def run(self, seconds: float) -> int:
+        """入力なしで seconds 分だけ（または終わるまで）進める。"""
+        n = int(round(seconds / self.dt))
+        for _ in range(n):
+            if self.is_over():
+                break
+            self.step()
+        return self.steps
+
+    def step(self):
+        if self.is_over():
+            return
+        dt = self.dt
+        f = dt * BASE_HZ
+        prof = self.profiler
+        self.t += dt
+        self.steps += 1
+        self._save_prev()
+
+        self._update_fugu(f)
+        if prof: prof.lap("fugu")
+        self.timers.update(dt)   # 生成・フィーバー終了など
+        if prof: prof.lap("timers")
+
+        boss = self.boss
+        if self.boss_spawned and boss is not None:
+            # ボスのランダム移動（目標に近づいたら次の目標）
+            if abs(boss.y - boss.ty) < 5 and abs(boss.x - boss.tx) < 5:
+                boss.ty = self.rng.randint(100, int(self.height) - 400)
+                boss.tx = self.rng.randint(int(self.width) // 2, int(self.width) - 450)
+            k = 1.0 - (1.0 - 0.05) ** f
+            boss.y += (boss.ty - boss.y) * k
+            boss.x += (boss.tx - boss.x) * k
+        if prof: prof.lap("boss")
+
+        # 切り身（全弾まとめて動かし、ボスに当たった数だけ HP を減らす）
+        pr = self.projectiles
+        if pr.n:
+            pr.update(KIRIMI_SPEED * f)
+            if self.boss is not None:
+                hit = pr.hits(self.boss)
+                k = int(hit.sum())
+                if k:
+                    n = pr.n
+                    if self.effects: self.particles.hit(pr.x[:n][hit] + pr.w / 2, pr.y[:n][hit] + pr.h / 2)
+                    pr.remove(hit)
+                    self.boss_hp -= k
+                    self.events.append((BOSS_HIT, max(0, self.boss_hp)))
+                    if self.boss_hp <= 0:
+                        self.win()
+                        return
+        if prof: prof.lap("projectiles")
+
+        # 吹き飛び演出・火花・キラキラ
+        if self.effects and self.is_fever and self.steps % SPARKLE_EVERY == 0:
+            cx, cy = self.fugu.center
+            self.particles.sparkle(cx, cy, self.fugu.w * 0.7)
+        self.particles.update(dt)
+        if prof: prof.lap("effects")
+
+        # 通過スコア・ハンマー・当たり判定（動かす前の位置で見る）
+        fugu = self.fugu
+        hammer = fugu.hammer() if self.is_fever else None
+        for o in list(self.obstacles):
+            if not o.passed and o.right < fugu.x:
+                o.passed = True
+                self._add_score(1)
+            if hammer is not None and o.w < 500 and overlap(o, hammer):
+                self.obstacles.remove(o)
+                if self.effects: self.particles.blast(o.x, o.y, o.w)
+                self._add_score(1)
+                continue
+            if not fugu.invincible and overlap(o, fugu):
+                self.game_over()
+        if prof: prof.lap("collision")
+
+        # 移動と画面外の削除
+        d = SCROLL * f
+        for o in self.obstacles:
+            o.x -= d
+        for b in self.blocks:
+            b.x -= d
+        # 幅がまちまち（特殊演出の 800 幅など）なので、先頭だけでなく全部見る
+        self.obstacles = [o for o in self.obstacles if o.right >= 0]
+        self.blocks = [b for b in self.blocks if b.right >= 0]
+        if prof: prof.lap("obstacles")
+
+    def _save_prev(self):
+        self.fugu.px, self.fugu.py = self.fugu.x, self.fugu.y
+        if self.boss is not None:
+            self.boss.px, self.boss.py = self.boss.x, self.boss.y
+        for group in (self.obstacles, self.blocks):
+            for e in group:
+                e.px, e.py = e.x, e.y
+
+    def _update_fugu(self, f: float):
+        fugu = self.fugu
+        fugu.y += fugu.vy * f
+        fugu.vy += self.gravity * f
+        fugu.angle = (fugu.angle + 25 * f) % 360 if fugu.invincible else 0.0
+
+        for b in self.blocks:
+            if (fugu.right > b.x and fugu.x < b.right and
+                    b.top - 30 < fugu.y <= b.top and fugu.vy < 0):
+                fugu.y, fugu.vy, fugu.on_ground = b.top, 0.0, True
+                return
+        if fugu.y <= GROUND_Y:
+            fugu.y, fugu.vy, fugu.on_ground = GROUND_Y, 0.0, True
+            return
+        fugu.on_ground = False
+
+
+def replay_fugu(replay: Replay) -> FuguWorld:
+    """記録どおりに入力して FuguWorld を最後まで進める（ヘッドレス）。"""
+    m = replay.meta
+    w = FuguWorld(m["spawn_interval"], m["gravity"], m["block_width"], m["width"], m["height"],
+                  seed=replay.seed, dt=replay.dt)
+    events = iter(replay.events)
+    ev = next(events, None)
+    while w.steps < replay.steps and not w.is_over():
+        while ev is not None and ev[0] <= w.steps:
+            if ev[1] == TOUCH:
+                w.touch(ev[2], ev[3])
+            elif ev[1] == JUMP:
+                w.jump()
+            elif ev[1] == ADD_SCORE:
+                w.add_score(ev[2])
+            elif ev[1] == TRIGGER_SPECIAL:
+                w.trigger_special()
+            ev = next(events, None)
+        w.step()
+    return w
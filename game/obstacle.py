@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
 from typing import Tuple
-from src import config
+import config
 
-@dataclass
+@dataclass(slots=True)
 class Obstacle:
     lane: int
     x: float
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+ObstacleArray: 障害物を「1個ずつのオブジェクト」ではなく「列ごとの配列」で持つ
+- lane/x/y/w/h/alive を NumPy の連続配列で保持（struct of arrays）
+- update(dt, speed): 全部まとめて1回の配列演算で動かす
+- compact(): alive=False の行をマスクで詰める（リスト内包の代わり）
+- rect(i) は Obstacle.rect と同じ (left, bottom, right, top) を返す
+- append(Obstacle) できるので Spawner はそのまま使える
+数百個の障害物を出すストレスモード用。
+"""
+from typing import Tuple
+
+import numpy as np
+
+import config
+from game.obstacle import Obstacle
+
+class ObstacleArray:
+    def __init__(self, capacity: int = 64):
+        self.n = 0
+        self._alloc(max(1, capacity))
+
+    def _alloc(self, cap: int):
+        old = getattr(self, "lane", None)
+        lane = np.zeros(cap, dtype=np.int32)
+        x = np.zeros(cap, dtype=np.float64)
+        y = np.zeros(cap, dtype=np.float64)
+        w = np.zeros(cap, dtype=np.float64)
+        h = np.zeros(cap, dtype=np.float64)
+        alive = np.zeros(cap, dtype=bool)
+        if old is not None:
+            n = self.n
+            lane[:n] = self.lane[:n]; x[:n] = self.x[:n]; y[:n] = self.y[:n]
+            w[:n] = self.w[:n]; h[:n] = self.h[:n]; alive[:n] = self.alive[:n]
+        self.lane, self.x, self.y, self.w, self.h, self.alive = lane, x, y, w, h, alive
+
+    def __len__(self) -> int:
+        return self.n
+
+    # --- 追加 ---
+    def add(self, lane: int, x: float, y: float,
+            w: float = config.PLAYER_W, h: float = config.PLAYER_H, alive: bool = True):
+        if self.n == len(self.lane):
+            self._alloc(len(self.lane) * 2)
+        i = self.n
+        self.lane[i] = lane; self.x[i] = x; self.y[i] = y
+        self.w[i] = w; self.h[i] = h; self.alive[i] = alive
+        self.n += 1
+
+    def append(self, o: Obstacle):
+        self.add(o.lane, o.x, o.y, o.w, o.h, o.alive)
+
+    def clear(self):
+        self.n = 0
+
+    # --- 取り出し ---
+    def get(self, i: int) -> Obstacle:
+        return Obstacle(lane=int(self.lane[i]), x=float(self.x[i]), y=float(self.y[i]),
+                        w=float(self.w[i]), h=float(self.h[i]), alive=bool(self.alive[i]))
+
+    def rect(self, i: int) -> Tuple[float, float, float, float]:
+        hw, hh = self.w[i]*0.5, self.h[i]*0.5
+        return (float(self.x[i] - hw), float(self.y[i] - hh), float(self.x[i] + hw), float(self.y[i] + hh))
+
+    def rects(self) -> np.ndarray:
+        """(n, 4) の配列で全 rect をまとめて返す。"""
+        n = self.n
+        hw, hh = self.w[:n]*0.5, self.h[:n]*0.5
+        x, y = self.x[:n], self.y[:n]
+        return np.stack((x - hw, y - hh, x + hw, y + hh), axis=1)
+
+    def boxes(self):
+        """描画用：(left, bottom, w, h) のリスト。"""
+        n = self.n
+        w, h = self.w[:n], self.h[:n]
+        return np.stack((self.x[:n] - w*0.5, self.y[:n] - h*0.5, w, h), axis=1).tolist()
+
+    # --- 更新 ---
+    def update(self, dt: float, speed: float):
+        n = self.n
+        y = self.y[:n]
+        y -= speed * dt
+        self.alive[:n] &= ~(y < -self.h[:n])
+
+    def compact(self):
+        n = self.n
+        mask = self.alive[:n]
+        k = int(np.count_nonzero(mask))
+        if k == n:
+            return
+        for arr in (self.lane, self.x, self.y, self.w, self.h, self.alive):
+            arr[:k] = arr[:n][mask]
+        self.n = k
+
+    def kill(self, i: int):
+        self.alive[i] = False
+
+    # --- 衝突 ---
+    def first_overlap(self, r: Tuple[float, float, float, float]) -> int:
+        """r と重なる最初の生存中の障害物の番号。なければ -1。"""
+        n = self.n
+        if n == 0:
+            return -1
+        hw, hh = self.w[:n]*0.5, self.h[:n]*0.5
+        x, y = self.x[:n], self.y[:n]
+        hit = self.alive[:n] & ~((r[2] < x - hw) | (r[0] > x + hw) | (r[3] < y - hh) | (r[1] > y + hh))
+        idx = np.flatnonzero(hit)
+        return int(idx[0]) if len(idx) else -1
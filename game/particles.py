@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+ParticleSystem: 吹き飛び演出・ボスへの命中・フィーバーのキラキラをまとめて動かす
+- 位置・速度・角度・角速度・重力・寿命・大きさ・種類を NumPy の固定長配列で持つ（最初に確保したきり）
+- いっぱいのときに出そうとした分は捨てて数える（dropped）→ 何が起きてもメモリは増えない
+- update(dt): 全粒子を1回の配列演算で動かし、寿命切れ・画面外を消す
+- 見た目用の乱数は自分の rng だけを使う（ゲーム本体の rng の並びを変えない）
+- 描画側は kind ごとに QuadBatch（Mesh 1つ）で描く → 粒子ごとのウィジェットは作らない
+
+速度などは FuguWorld と同じく「60Hz の1フレームあたり」の値で持ち、dt * 60 倍して使う。
+"""
+import numpy as np
+
+BASE_HZ = 60.0
+BLAST, HIT, SPARKLE = 0, 1, 2
+KINDS = (BLAST, HIT, SPARKLE)
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = 4096, seed: int = 0):
+        self.capacity = capacity
+        self.n = 0
+        self.dropped = 0
+        self.rng = np.random.default_rng(seed)
+        f = lambda: np.zeros(capacity, dtype=np.float64)
+        self.x, self.y, self.px, self.py = f(), f(), f(), f()
+        self.vx, self.vy, self.g = f(), f(), f()
+        self.ang, self.pang, self.av = f(), f(), f()
+        self.life, self.size = f(), f()
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self._cols = (self.x, self.y, self.px, self.py, self.vx, self.vy, self.g,
+                      self.ang, self.pang, self.av, self.life, self.size, self.kind)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    # --- 追加 ---
+    def emit(self, kind: int, x, y, vx, vy, g=0.0, av=0.0, life=1.0, size=10.0, ang=0.0) -> int:
+        """スカラーでも配列でも渡せる（配列なら個数分まとめて出す）。出せた数を返す。"""
+        count = max(np.size(a) for a in (x, y, vx, vy, g, av, life, size, ang))
+        k = min(count, self.capacity - self.n)
+        self.dropped += count - k
+        if k <= 0:
+            return 0
+        s = slice(self.n, self.n + k)
+        for arr, v in ((self.x, x), (self.y, y), (self.vx, vx), (self.vy, vy), (self.g, g),
+                       (self.av, av), (self.life, life), (self.size, size), (self.ang, ang)):
+            arr[s] = v[:k] if np.ndim(v) else v
+        self.px[s], self.py[s], self.pang[s] = self.x[s], self.y[s], self.ang[s]
+        self.kind[s] = kind
+        self.n += k
+        return k
+
+    # --- エミッタ ---
+    def blast(self, x: float, y: float, size: float):
+        """はね飛ばした障害物（左下 x, y）。右上へ飛んで回りながら落ちる（旧 dead_effects と同じ動き）。"""
+        self.emit(BLAST, x, y, 5.0, 15.0, g=0.5, av=15.0, life=10.0, size=size)
+
+    def hit(self, cx, cy, n: int = 8):
+        """ボスへの命中（中心 cx, cy）。火花を全方向に散らす。配列なら命中ごとに n 個。"""
+        cx, cy = np.repeat(np.atleast_1d(cx), n), np.repeat(np.atleast_1d(cy), n)
+        a, sp, av, life = self.rng.random((4, len(cx)))   # 乱数は1回でまとめて引く
+        a *= 2 * np.pi
+        sp = 3 + 6 * sp
+        size = 12.0
+        self.emit(HIT, cx - size / 2, cy - size / 2, np.cos(a) * sp, np.sin(a) * sp,
+                  g=0.2, av=40 * av - 20, life=0.25 + 0.25 * life, size=size)
+
+    def sparkle(self, cx: float, cy: float, radius: float, n: int = 8):
+        """フィーバー中のキラキラ（中心のまわりにふわっと出て上に消える）。"""
+        a, r, size, vx, vy, life = self.rng.random((6, n))
+        a *= 2 * np.pi
+        r *= radius
+        size = 6 + 8 * size
+        self.emit(SPARKLE, cx + np.cos(a) * r - size / 2, cy + np.sin(a) * r - size / 2,
+                  2 * vx - 1, 0.5 + 1.5 * vy, av=8.0, life=0.3 + 0.4 * life, size=size)
+
+    # --- 更新 ---
+    def update(self, dt: float):
+        n = self.n
+        if n == 0:
+            return
+        f = dt * BASE_HZ
+        x, y, vy, ang = self.x[:n], self.y[:n], self.vy[:n], self.ang[:n]
+        self.px[:n] = x
+        self.py[:n] = y
+        self.pang[:n] = ang
+        x += self.vx[:n] * f
+        y += vy * f
+        vy -= self.g[:n] * f
+        ang += self.av[:n] * f
+        life = self.life[:n]
+        life -= dt
+        keep = (life > 0) & (y + self.size[:n] >= 0)
+        k = int(np.count_nonzero(keep))
+        if k < n:
+            for arr in self._cols:
+                arr[:k] = arr[:n][keep]
+            self.n = k
+
+    # --- 描画用 ---
+    def quads(self, kind: int, alpha: float = 1.0):
+        """kind の粒子の (xs, ys, size, angle)。前ステップとの間を alpha で補間する。"""
+        n = self.n
+        sel = self.kind[:n] == kind
+        px, py, pa = self.px[:n][sel], self.py[:n][sel], self.pang[:n][sel]
+        return (px + (self.x[:n][sel] - px) * alpha, py + (self.y[:n][sel] - py) * alpha,
+                self.size[:n][sel], pa + (self.ang[:n][sel] - pa) * alpha)
@@ -9,9 +9,9 @@ from dataclasses import dataclass
 from typing import Tuple
 from time import monotonic
 
-from src import config
+import config
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     lane: int = 1
     x: float = config.lane_x(1)
@@ -49,7 +49,7 @@ class Player:
 
     # --- 更新 ---
     def update(self, dt: float):
-        self.vy -= config.GRAVITY * dt
+        self.vy -= config.PLAYER_GRAVITY * dt
         self.y += self.vy * dt
         if self.y < config.PLAYER_GROUND_Y:
             self.y = config.PLAYER_GROUND_Y
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+ProjectileArray: ボス戦の切り身（Kirimi）を配列でまとめて持つ
+- x/y（左下）・前ステップの px/py・単位ベクトル ux/uy・目標までの残り距離 rem を NumPy の連続配列で保持
+- 目標は固定なので、向き（sqrt）は発射時に1回だけ計算する
+- update(step_len): 到着した弾を消し、残りを1回の配列演算で動かす
+- hits(box): ボスの当たり判定を全弾まとめて行い、当たった弾のマスクを返す
+ObstacleArray（game/obstacle_array.py）と同じ struct of arrays の形。
+"""
+import numpy as np
+
+ARRIVE_DIST = 10.0   # 目標までこれ以下になったら消える
+
+
+class ProjectileArray:
+    def __init__(self, capacity: int = 64, w: float = 80, h: float = 80):
+        self.w, self.h = w, h
+        self.n = 0
+        self._alloc(max(1, capacity))
+
+    def _alloc(self, cap: int):
+        cols = ("x", "y", "px", "py", "ux", "uy", "rem")
+        old = {c: getattr(self, c, None) for c in cols}
+        for c in cols:
+            a = np.zeros(cap, dtype=np.float64)
+            if old[c] is not None:
+                a[:self.n] = old[c][:self.n]
+            setattr(self, c, a)
+
+    def __len__(self) -> int:
+        return self.n
+
+    # --- 追加 ---
+    def add(self, x: float, y: float, tx: float, ty: float):
+        """左下 (x, y) から、弾の中心が (tx, ty) に向かうように撃つ。"""
+        if self.n == len(self.x):
+            self._alloc(len(self.x) * 2)
+        dx, dy = tx - (x + self.w / 2), ty - (y + self.h / 2)
+        dist = (dx * dx + dy * dy) ** 0.5
+        i = self.n
+        self.x[i] = self.px[i] = x
+        self.y[i] = self.py[i] = y
+        self.ux[i], self.uy[i] = (dx / dist, dy / dist) if dist > 0 else (0.0, 0.0)
+        self.rem[i] = dist
+        self.n += 1
+
+    def clear(self):
+        self.n = 0
+
+    # --- 更新 ---
+    def update(self, step_len: float):
+        n = self.n
+        # 着いた弾（行き過ぎた分も含む）を消してから進める
+        self._keep(np.abs(self.rem[:n]) > ARRIVE_DIST)
+        n = self.n
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+        self.x[:n] += self.ux[:n] * step_len
+        self.y[:n] += self.uy[:n] * step_len
+        self.rem[:n] -= step_len
+
+    def _keep(self, mask: np.ndarray):
+        n = self.n
+        k = int(np.count_nonzero(mask))
+        if k == n:
+            return
+        for arr in (self.x, self.y, self.px, self.py, self.ux, self.uy, self.rem):
+            arr[:k] = arr[:n][mask]
+        self.n = k
+
+    def remove(self, mask: np.ndarray):
+        self._keep(~mask)
+
+    # --- 衝突 ---
+    def hits(self, box) -> np.ndarray:
+        """box（x, y, w, h を持つもの）と重なっている弾のマスク。端が接していても当たり。"""
+        n = self.n
+        x, y = self.x[:n], self.y[:n]
+        return ~((x + self.w < box.x) | (x > box.x + box.w) | (y + self.h < box.y) | (y > box.y + box.h))
+
+    # --- 描画用 ---
+    def positions(self, alpha: float = 1.0):
+        """前ステップとの間を alpha で補間した左下座標 (xs, ys)。"""
+        n = self.n
+        px, py = self.px[:n], self.py[:n]
+        return px + (self.x[:n] - px) * alpha, py + (self.y[:n] - py) * alpha
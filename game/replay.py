@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Replay: 1回のプレイを「seed + 入力の列」として記録する
+- 乱数は seed から作った random.Random だけを使うので、入力が同じなら結果も同じ
+- 時刻は「何ステップ目の前に入った入力か」（step）で持つ → 固定 dt なら完全に再現できる
+- 保存形式は小さな JSON：
+    {"v": 1, "seed": 123, "dt": 0.0166.., "steps": 3600,
+     "events": [[12, "J"], [40, "L"], [95, "T", 512.0, 300.0], ...]}
+  コード：J=ジャンプ L=左 R=右 T=タッチ(x, y)
+        S=スコア加算(p) X=特殊演出（どちらも FuguWorld の管理パネルから。再生に必要なので入力と同じく記録する）
+- meta: 再現に必要な設定（FuguWorld の出現間隔・重力・画面サイズなど）。空なら書き出さない
+"""
+import json
+from dataclasses import dataclass, field
+from typing import List
+
+JUMP, LEFT, RIGHT, TOUCH = "J", "L", "R", "T"
+ADD_SCORE, TRIGGER_SPECIAL = "S", "X"
+
+@dataclass
+class Replay:
+    seed: int
+    dt: float
+    events: List[list] = field(default_factory=list)
+    steps: int = 0   # 記録を閉じたときの総ステップ数
+    meta: dict = field(default_factory=dict)
+
+    def record(self, step: int, code: str, *args):
+        self.events.append([step, code, *args])
+
+    def dumps(self) -> str:
+        d = dict(v=1, seed=self.seed, dt=self.dt, steps=self.steps, events=self.events)
+        if self.meta:
+            d["meta"] = self.meta
+        return json.dumps(d, separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def loads(cls, text: str) -> "Replay":
+        d = json.loads(text)
+        return cls(seed=d["seed"], dt=d["dt"], events=d["events"], steps=d["steps"], meta=d.get("meta", {}))
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, encoding="utf-8") as f:
+            return cls.loads(f.read())
+
+def replay_world(replay: Replay, vectorized: bool = False):
+    """World をヘッドレスで作り直し、記録どおりに入力して最後まで進める。"""
+    from game.world import World
+
+    w = World(dt=replay.dt, seed=replay.seed, vectorized=vectorized)
+    actions = {JUMP: w.jump, LEFT: w.move_left, RIGHT: w.move_right}
+    events = iter(replay.events)
+    ev = next(events, None)
+    while w.steps < replay.steps:
+        while ev is not None and ev[0] <= w.steps:
+            actions[ev[1]]()
+            ev = next(events, None)
+        w.step()
+    return w
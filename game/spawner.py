@@ -2,27 +2,29 @@
 """
 [C] Spawner: 生成間隔を設計する
 - periodic+jitter（既定）/ poisson（STEP）/ speed連動（STEP）
+- 乱数は渡された rng（random.Random）だけを使う → seed が同じなら同じ出方になる
 """
 import random, math
-from typing import List
-from src import config
-from src.game.obstacle import Obstacle
+from typing import List, Optional
+import config
+from game.obstacle import Obstacle
 
 class Spawner:
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random.Random()
         self.timer = 0.0
         self.next_interval = self._next_interval()
 
     def _poisson(self, lam: float) -> float:
         # Poisson 乱数の待ち時間（指数分布）: -ln(1-U)/lam
-        u = 1.0 - random.random()
+        u = 1.0 - self.rng.random()
         return -math.log(u) / lam
 
     def _next_interval(self) -> float:
         if config.SPAWN_MODE == "poisson":
             iv = self._poisson(lam=1.0/max(0.001, config.SPAWN_BASE_INTERVAL))
         else:
-            jitter = random.uniform(-config.SPAWN_RANDOM_JITTER, config.SPAWN_RANDOM_JITTER)
+            jitter = self.rng.uniform(-config.SPAWN_RANDOM_JITTER, config.SPAWN_RANDOM_JITTER)
             iv = config.SPAWN_BASE_INTERVAL + jitter
         return max(config.SPAWN_MIN_INTERVAL, iv)
 
@@ -34,9 +36,9 @@ class Spawner:
             self.next_interval = self._next_interval()
 
             # 1～2個を出す（揺らぎ）
-            count = 1 if random.random() < 0.7 else 2
+            count = 1 if self.rng.random() < 0.7 else 2
             lanes = list(range(config.LANES))
-            random.shuffle(lanes)
+            self.rng.shuffle(lanes)
             for i in range(count):
                 lane = lanes[i % config.LANES]
                 x = config.lane_x(lane)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+World: 描画なしで進むゲーム本体（ヘッドレス）
+- Kivy を import しない → ウィンドウ無しでテスト・バランス調整ができる
+- step(dt): 固定 dt で1ステップ進める（速度カーブ→プレイヤー→生成→更新→衝突）
+- advance(frame_dt): フレーム時間を貯めて固定 dt 単位で step を回す（core/loop.py の FixedStepLoop）
+- 無敵時間は monotonic() ではなく World 内の時刻 t で判定する（再現性のため）
+- vectorized=True で障害物を ObstacleArray（NumPy）に持たせる（ストレスモード用）
+- 乱数は seed から作った self.rng だけ。入力は self.replay に記録される（game/replay.py）
+- self.profiler に FrameProfiler を入れると step/spawn/collision の時間を計る
+"""
+import random
+from typing import List, Optional
+
+import config
+from game.player import Player
+from game.obstacle import Obstacle
+from game.spawner import Spawner
+from game.collision import LaneIndex
+from game.replay import Replay, JUMP, LEFT, RIGHT
+from core.loop import FixedStepLoop, MAX_STEPS_PER_FRAME
+
+FIXED_DT = 1.0 / config.FPS
+
+class World:
+    def __init__(self, dt: float = FIXED_DT, vectorized: bool = False, seed: Optional[int] = None):
+        self.dt = dt
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.replay = Replay(seed=self.seed, dt=dt)
+        self.player = Player(lane=1, x=config.lane_x(1), y=config.PLAYER_GROUND_Y)
+        self.vectorized = vectorized
+        if vectorized:
+            # NumPy は使うときだけ読み込む
+            from game.obstacle_array import ObstacleArray
+            self.obstacles = ObstacleArray()
+        else:
+            self.obstacles: List[Obstacle] = []
+            self.index = LaneIndex()
+        self.spawner = Spawner(self.rng)
+
+        self.t = 0.0
+        self.speed = config.BASE_SPEED
+        self.score = 0.0
+        self.steps = 0
+        self.loop = FixedStepLoop(self.step, dt, MAX_STEPS_PER_FRAME)
+        self.prev_y = self.player.y   # 補間描画用：1ステップ前のプレイヤー y
+        self.profiler = None
+
+    # --- 入力（PlayField / ボットから呼ぶ） ---
+    def move_left(self):
+        self.replay.record(self.steps, LEFT)
+        self.player.move_left()
+
+    def move_right(self):
+        self.replay.record(self.steps, RIGHT)
+        self.player.move_right()
+
+    def jump(self):
+        self.replay.record(self.steps, JUMP)
+        self.player.try_jump()
+
+    def add_obstacle(self, o: Obstacle):
+        """Spawner を通さずに障害物を置く（ベンチ・ストレスモード用）。当たり判定のバケツにも入れる。"""
+        self.obstacles.append(o)
+        if not self.vectorized:
+            self.index.add(o)
+
+    # --- 状態 ---
+    def is_invincible(self) -> bool:
+        return not self.player.can_damage(self.t)
+
+    def is_over(self) -> bool:
+        return self.player.hp <= 0
+
+    # --- 進行 ---
+    def advance(self, frame_dt: float) -> int:
+        """フレーム時間を貯め、固定 dt で何ステップ進めたかを返す。"""
+        return self.loop.advance(frame_dt)
+
+    def run(self, seconds: float) -> int:
+        """ヘッドレス用：seconds 分だけ一気に進める。"""
+        n = int(round(seconds / self.dt))
+        for _ in range(n):
+            if self.is_over():
+                break
+            self.step()
+        return self.steps
+
+    def step(self):
+        dt = self.dt
+        prof = self.profiler
+
+        # [B] 速度カーブ（linear/step/ease 切替可）
+        self.t += dt
+        self.speed = config.speed_curve(self.t)
+
+        # スコア（簡易式）
+        self.score += self.speed * dt * 0.1  # [E] 改造歓迎：コンボ/連続回避ボーナス等
+
+        # プレイヤー
+        self.prev_y = self.player.y
+        self.player.update(dt)
+        if prof: prof.lap("step")
+
+        # 生成・更新
+        n = len(self.obstacles)
+        self.spawner.update(dt, self.obstacles, self.speed)
+        if self.vectorized:
+            self.obstacles.update(dt, self.speed)
+            self.obstacles.compact()
+        else:
+            # 当たり判定のバケツは作り直さない：新しいものを入れ、流れた量を足し、消えたものを落とす
+            for o in self.obstacles[n:]:
+                self.index.add(o)
+            for o in self.obstacles:
+                o.update(dt, self.speed)
+            self.index.scroll_by(self.speed * dt)
+            self.obstacles = [o for o in self.obstacles if o.alive]
+            self.index.cull()
+        if prof: prof.lap("spawn")
+
+        # [D] 衝突判定 + 無敵
+        now_s = self.t
+        if self.player.can_damage(now_s):
+            prect = self.player.rect()
+            if self.vectorized:
+                i = self.obstacles.first_overlap(prect)
+                if i >= 0:
+                    self.player.on_hit(now_s)
+                    self.obstacles.kill(i)
+            else:
+                o = self.index.first_hit(prect)
+                if o is not None:
+                    self.player.on_hit(now_s)
+                    o.alive = False
+
+        if prof: prof.lap("collision")
+
+        self.steps += 1
+        self.replay.steps = self.steps
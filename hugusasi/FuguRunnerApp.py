@@ -1,20 +1,32 @@
+from time import perf_counter
+T0 = perf_counter()  # 起動時間の計測の起点（最初のフレームまでの時間をログに出す）
+
 from kivy.app import App
+from kivy.logger import Logger
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.properties import NumericProperty, ListProperty, StringProperty
+from kivy.properties import NumericProperty, StringProperty
 from kivy.core.audio import SoundLoader
 from kivy.uix.label import Label
 from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.slider import Slider
 from kivy.uix.button import Button
 from kivy.graphics import Color, Rectangle
-from kivy.uix.video import Video
+from kivy.core.image import Image as CoreImage
+# kivy.uix.video（動画プロバイダの読み込み）と Slider は、使う画面を初めて作るときに読む
 import os, random, sys
+from dataclasses import dataclass
 from pathlib import Path
 
+# リポジトリ直下の utils/ を使う（効果音は utils/sound.py、障害物の Mesh は utils/quad_batch.py、動画は utils/video.py）
+if not getattr(sys, 'frozen', False):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sound import SoundBank
+from utils.quad_batch import QuadBatch
+from utils.video import VideoBackground
+
 # --- 画面サイズ ---
 Window.size = (1000, 600)
 
@@ -37,23 +49,59 @@ def safe_asset(path):
     """アセットの存在をチェックし、なければ空文字列を返す"""
     return path if os.path.exists(path) else ""
 
+# ====================================================================
+# --- 起動：最初のフレームのあとに回す処理 ---
+# ====================================================================
+
+_first_frame_shown = False
+_after_first_frame = []
+
+def after_first_frame(callback):
+    """最初のフレームが画面に出たあとで callback を呼ぶ（もう出ていれば次のフレームで）。"""
+    if _first_frame_shown:
+        Clock.schedule_once(lambda _dt: callback(), 0)
+    else:
+        _after_first_frame.append(callback)
+
+def _on_first_flip(window):
+    global _first_frame_shown
+    window.unbind(on_flip=_on_first_flip)
+    _first_frame_shown = True
+    Logger.info(f"Startup: first frame {1000 * (perf_counter() - T0):.0f} ms")
+    pending = _after_first_frame[:]
+    _after_first_frame.clear()
+    Clock.schedule_once(lambda _dt: [cb() for cb in pending], 0)
+
+# ====================================================================
+# --- 効果音バンク ---
+# ====================================================================
+
+# 効果音は utils/sound.py の SoundBank（起動時に1回だけ読み込み、音ごとに数本のボイスを使い回す）
+SFX_FILES = ["hit.ogg", "GB__.ogg", "叫ぶ.ogg", "meme.ogg", "clear.ogg", "boss_appear.ogg"]
+
 # ====================================================================
 # --- ゲームオブジェクト ---
 # ====================================================================
 
-class Fugu(Image):
-    velocity_y = NumericProperty(0)
-    gravity = NumericProperty(-0.5)
-    jump_power = 10 
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.source = safe_asset(assets_path("fugu.png"))
-        self.size = (80, 80) # ★修正: Fuguのサイズを大きく (80, 80) に変更
-        self.pos = (100, 120) # ★修正: Fuguの初期位置をY=120に変更
-        self.is_jumping = False
-        
-    def update(self, blocks):
+# 位置・速度などの状態は __slots__ 付きの軽いクラスに持たせる（Kivy のプロパティは使わない）
+# ウィジェットは sync() で状態を写すだけの見た目
+
+def overlap(a, b):
+    """Widget.collide_widget と同じ判定（端が接していても当たり）。"""
+    return not (a.x + a.w < b.x or a.x > b.x + b.w or a.y + a.h < b.y or a.y > b.y + b.h)
+
+@dataclass(slots=True, eq=False)
+class FuguState:
+    x: float = 100
+    y: float = 120       # ★修正: Fuguの初期位置をY=120に変更
+    w: float = 80        # ★修正: Fuguのサイズを大きく (80, 80) に変更
+    h: float = 80
+    velocity_y: float = 0.0
+    gravity: float = -0.5
+    is_jumping: bool = False
+    jump_power = 10
+
+    def update(self, blocks, ceiling):
         self.velocity_y += self.gravity
         self.y += self.velocity_y
         
@@ -65,25 +113,26 @@ class Fugu(Image):
             
         # ブロックとの衝突
         for block in blocks:
-            if self.collide_widget(block):
+            if overlap(self, block):
                 # ブロックの上に乗る判定を調整。Fuguがブロックの上面にいるか、
                 # かつ下降中（またはほぼ停止中）の場合に足場とする。
+                top = block.y + block.h
                 fugu_on_top_of_block = (
-                    self.y >= block.top - 5 and # Fuguの底がブロックの上面より少し上にある
-                    self.y < block.top + 15 and # Fuguの底がブロックの上面から少し上まで
+                    self.y >= top - 5 and # Fuguの底がブロックの上面より少し上にある
+                    self.y < top + 15 and # Fuguの底がブロックの上面から少し上まで
                     self.velocity_y <= 0 # 下降中または停止中
                 )
                 
                 if fugu_on_top_of_block:
-                    self.y = block.top 
+                    self.y = top
                     self.velocity_y = 0
                     self.is_jumping = False
                     return
                 # ブロックの横や下との衝突はここでは無視（通常の横スクロールアクションの挙動に合わせる）
                 
         # 天井との衝突
-        if self.y > Window.height - self.size[1]:
-            self.y = Window.height - self.size[1]
+        if self.y > ceiling - self.h:
+            self.y = ceiling - self.h
             self.velocity_y = 0
 
     def jump(self):
@@ -91,17 +140,17 @@ class Fugu(Image):
             self.velocity_y = self.jump_power
             self.is_jumping = True
 
-    def check_hit(self, other_widget):
-        if not self.collide_widget(other_widget):
+    def check_hit(self, other):
+        if not overlap(self, other):
             return "MISS"
             
-        fugu_bottom = self.y + self.size[1] * 0.2 
-        fugu_top = self.y + self.size[1] * 0.8
+        fugu_bottom = self.y + self.h * 0.2
+        fugu_top = self.y + self.h * 0.8
         
-        other_top = other_widget.top
-        other_y = other_widget.y
+        other_top = other.y + other.h
+        other_y = other.y
 
-        if isinstance(other_widget, Boss):
+        if isinstance(other, BossState):
             # ボスの頭上に着地（踏みつけ）判定
             if (fugu_bottom > other_top - 20) and (fugu_bottom < other_top + 10) and (self.velocity_y < 0):
                 self.velocity_y = self.jump_power * 0.7 # 再ジャンプ
@@ -112,46 +161,50 @@ class Fugu(Image):
                 return "GAME_OVER"
             return "MISS"
 
-        if isinstance(other_widget, Obstacle):
+        if isinstance(other, ObstacleState):
             return "GAME_OVER"
             
         return "MISS" 
 
-class Obstacle(Image):
-    speed = NumericProperty(5) 
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.source = safe_asset(assets_path(random.choice(["block.png", "bom.png"])))
-        self.size = (80, 80)
+@dataclass(slots=True, eq=False)
+class ObstacleState:
+    x: float
+    y: float
+    source: str
+    w: float = 80
+    h: float = 80
+    speed: float = 5
+
+    @classmethod
+    def spawn(cls, width):
+        source = random.choice(["block.png", "bom.png"])
         # ★修正: Y座標を地面付近に限定 (0〜10)
-        self.pos = (Window.width, random.randint(0, 10)) 
-        
+        return cls(width, random.randint(0, 10), source)
+
     def update(self, dt):
         self.x -= self.speed
-        if self.right < 0:
-            if self.parent:
-                self.parent.remove_widget(self)
-            
-class Boss(Image):
-    speed = NumericProperty(2) 
+
+@dataclass(slots=True, eq=False)
+class BossState:
+    x: float
+    y: float
+    target_x: float
+    w: float = 150
+    h: float = 150
+    speed: float = 2
+    current_hits: int = 0
+    is_moving: bool = True
     hits_required = 5
-    current_hits = 0
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.source = safe_asset(assets_path("boss.png"))
-        self.size = (150, 150)
-        self.y = Window.height / 2 - self.size[1] / 2
-        self.x = Window.width + 10 
-        self.target_x = Window.width - 200
-        self.is_moving = True
+
+    @classmethod
+    def spawn(cls, width, height):
+        return cls(width + 10, height / 2 - 150 / 2, width - 200)
 
     def update(self, dt):
         if self.current_hits >= self.hits_required:
             # ボス撃破後の消滅
             self.x -= self.speed * 5 # より速く画面外へ
-            if self.right < 0:
+            if self.x + self.w < 0:
                 return "CLEARED" 
 
         if self.is_moving:
@@ -170,46 +223,45 @@ class Boss(Image):
             
         return "CONTINUE"
 
-class Block(Widget):
-    speed = NumericProperty(5) 
-    
-    def __init__(self, block_width, **kwargs):
-        super().__init__(**kwargs)
-        self.size_hint = (None, None)
-        self.width = block_width 
-        self.height = 30 # ★修正: ブロックの高さを 30 に減らす
-        
+@dataclass(slots=True, eq=False)
+class BlockState:
+    x: float
+    y: float
+    w: float
+    h: float = 30 # ★修正: ブロックの高さを 30 に減らす
+    speed: float = 5
+
+    @classmethod
+    def spawn(cls, width, height, block_width):
         # ブロックのy座標をランダムに設定
         min_y = 50 
-        max_y = Window.height / 2 - self.height 
-        self.y = random.randint(min_y, int(max_y))
-        
-        self.x = Window.width 
+        max_y = height / 2 - 30
+        return cls(width, random.randint(min_y, int(max_y)), block_width)
 
-        with self.canvas:
-            Color(0.5, 0.5, 0.5, 1)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-
-        self.bind(pos=self._update_rect, size=self._update_rect)
-
-    def _update_rect(self, *args):
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-        
     def update(self, dt):
         self.x -= self.speed
-        if self.right < 0:
-            if self.parent:
-                self.parent.remove_widget(self)
+
+# --- 見た目（ウィジェット）---
+
+class SpriteView(Image):
+    """状態（x, y, w, h を持つもの）を写す画像。"""
+    def __init__(self, state, source, **kwargs):
+        super().__init__(**kwargs)
+        self.source = safe_asset(assets_path(source))
+        self.size = (state.w, state.h)
+        self.sync(state)
+
+    def sync(self, state):
+        self.pos = (state.x, state.y)
+
+def load_texture(filename):
+    path = safe_asset(assets_path(filename))
+    return CoreImage(path).texture if path else None
 
 # ====================================================================
 # --- ゲーム本体 (Game) ---
 # ====================================================================
 class Game(Widget):
-    obstacles = ListProperty([])
-    blocks = ListProperty([])
-    bosses = ListProperty([])
-    
     is_game_over = False
     BOSS_SCORE_THRESHOLD = 10
     is_boss_time = False 
@@ -228,6 +280,12 @@ class Game(Widget):
         self.bgm = None 
         self.final_score_value = 0 # ゲームオーバー/クリア時のスコアを保持するための変数
 
+        # ゲームの状態（障害物・ブロック・ボス）と、それぞれの見た目
+        self.obstacles = []
+        self.blocks = []
+        self.bosses = []
+        self.views = {}  # 状態 -> ウィジェット（ボス）
+
         # 背景
         self.background = Image(
             source=safe_asset(assets_path("game.png")),
@@ -238,10 +296,17 @@ class Game(Widget):
         )
         self.add_widget(self.background)
 
+        # 障害物・ブロックはウィジェットを作らず、絵柄ごとに Mesh 1つで描く（背景のすぐ上）
+        self.obstacle_layers = {
+            name: QuadBatch(self.background.canvas.after, load_texture(name))
+            for name in ("block.png", "bom.png")
+        }
+        self.block_layer = QuadBatch(self.background.canvas.after, None, color=(0.5, 0.5, 0.5, 1))
+
         # プレイヤー
-        self.fugu = Fugu()
-        self.fugu.gravity = self.gravity 
-        self.add_widget(self.fugu)
+        self.fugu = FuguState(gravity=self.gravity)
+        self.fugu_view = SpriteView(self.fugu, "fugu.png")
+        self.add_widget(self.fugu_view)
 
         # スコア
         self.score = 0
@@ -281,26 +346,26 @@ class Game(Widget):
         Clock.schedule_interval(self.update, 1/60.0)
         self.schedule_next_item()
 
-    def _load_sfx(self, filename):
-        path = assets_path(filename)
-        if not os.path.exists(path):
-            return None
-        snd = SoundLoader.load(path)
-        if snd:
-            try:
-                snd.volume = self.sfx_volume 
-            except Exception:
-                pass
-        return snd
+    def _add(self, items, state, view=None):
+        items.append(state)
+        if view is not None:
+            self.views[state] = view
+            self.add_widget(view)
+
+    def _remove(self, items, state):
+        items.remove(state)
+        view = self.views.pop(state, None)
+        if view is not None and view.parent:
+            view.parent.remove_widget(view)
+
+    def _clear(self, *lists):
+        for items in lists:
+            for state in list(items):
+                self._remove(items, state)
 
     def play_sfx(self, filename):
-        if self.sfx_volume > 0.0:
-            snd = self._load_sfx(filename)
-            if snd:
-                try:
-                    snd.play()
-                except Exception:
-                    pass
+        # 効果音はアプリ起動時に読み込み済み（ここではディスクを読まない）
+        App.get_running_app().sfx_bank.play(filename, self.sfx_volume)
 
     def stop_all(self):
         if self.is_game_over: return
@@ -315,12 +380,8 @@ class Game(Widget):
                 pass
 
         # 全てのゲームオブジェクトを削除
-        for o in list(self.obstacles) + list(self.blocks) + list(self.bosses):
-            if o.parent:
-                o.parent.remove_widget(o)
-        self.obstacles.clear()
-        self.blocks.clear()
-        self.bosses.clear()
+        self._clear(self.obstacles, self.blocks, self.bosses)
+        self.sync()
         self.boss_hit_label.text = ""
         
         # スコアを確定
@@ -329,7 +390,7 @@ class Game(Widget):
     def update(self, dt):
         if self.is_game_over: return
 
-        self.fugu.update(self.blocks)
+        self.fugu.update(self.blocks, Window.height)
         
         # 障害物・ブロックの更新と衝突判定
         for obs in list(self.obstacles):
@@ -337,10 +398,9 @@ class Game(Widget):
             if self.fugu.check_hit(obs) == "GAME_OVER":
                 self.game_over_sequence()
                 return
-            if obs.right < 0:
+            if obs.x + obs.w < 0:
                 if obs in self.obstacles:
-                    self.obstacles.remove(obs)
-                    self.remove_widget(obs)
+                    self._remove(self.obstacles, obs)
                     # ボス戦中でない、かつクリア済みでない場合のみスコア加算
                     if not self.is_boss_time and not self.boss_cleared:
                         self.score += 1
@@ -348,10 +408,9 @@ class Game(Widget):
         
         for block in list(self.blocks):
             block.update(dt)
-            if block.right < 0:
+            if block.x + block.w < 0:
                 if block in self.blocks:
-                    self.blocks.remove(block)
-                    self.remove_widget(block)
+                    self._remove(self.blocks, block)
 
 
         # ボスの更新と衝突判定
@@ -361,15 +420,13 @@ class Game(Widget):
             if update_result == "FAILED":
                 # ボスが逃げ切った場合
                 self.game_over_sequence() 
-                if boss.parent: boss.parent.remove_widget(boss)
-                self.bosses.remove(boss)
+                if boss in self.bosses: self._remove(self.bosses, boss)
                 return
             
             if update_result == "CLEARED":
                 # ボス撃破後の画面外退場
                 self.game_clear_sequence() 
-                if boss.parent: boss.parent.remove_widget(boss)
-                self.bosses.remove(boss)
+                if boss in self.bosses: self._remove(self.bosses, boss)
                 return # ゲームクリアシーケンスへ移行したのでここでreturn
             
             hit_result = self.fugu.check_hit(boss)
@@ -393,6 +450,17 @@ class Game(Widget):
         if not self.is_boss_time and not self.boss_cleared and self.score >= self.BOSS_SCORE_THRESHOLD:
             self.start_boss_sequence()
 
+        self.sync()
+
+    def sync(self):
+        # 状態をウィジェットに写す（ウィジェットの位置はここでしか変えない）
+        self.fugu_view.sync(self.fugu)
+        for state, view in self.views.items():
+            view.sync(state)
+        for name, layer in self.obstacle_layers.items():
+            layer.update_rects([(o.x, o.y, o.w, o.h) for o in self.obstacles if o.source == name])
+        self.block_layer.update_rects([(b.x, b.y, b.w, b.h) for b in self.blocks])
+
 
     def game_over_sequence(self):
         if self.is_game_over: return
@@ -430,11 +498,7 @@ class Game(Widget):
         Clock.unschedule(self.spawn_item) # アイテム出現を停止
         
         # 画面上の障害物・ブロックを全て削除
-        for o in list(self.obstacles) + list(self.blocks):
-            if o.parent:
-                o.parent.remove_widget(o)
-        self.obstacles.clear()
-        self.blocks.clear()
+        self._clear(self.obstacles, self.blocks)
         
         Clock.schedule_once(self._spawn_boss, 1.0) # 1秒後にボス出現
         
@@ -447,9 +511,8 @@ class Game(Widget):
         if len(self.bosses) > 0: 
             return
 
-        boss = Boss()
-        self.bosses.append(boss)
-        self.add_widget(boss)
+        boss = BossState.spawn(Window.width, Window.height)
+        self._add(self.bosses, boss, SpriteView(boss, "boss.png"))
         
         self.play_sfx("boss_appear.ogg")
         
@@ -465,13 +528,12 @@ class Game(Widget):
         
         # アイテム出現ロジック（ランダムに障害物かブロックを生成）
         if random.random() < 0.7: 
-            item = Obstacle()
-            self.obstacles.append(item)
+            item = ObstacleState.spawn(Window.width)
+            self._add(self.obstacles, item)
         else: 
-            item = Block(block_width=self.block_width) 
-            self.blocks.append(item)
+            item = BlockState.spawn(Window.width, Window.height, self.block_width)
+            self._add(self.blocks, item)
         
-        self.add_widget(item)
         self.schedule_next_item()
 
 
@@ -489,27 +551,20 @@ class Game(Widget):
 # --- スクリーン管理 ---
 # ====================================================================
 
-class VideoBackground(Video):
+class LazyScreenManager(ScreenManager):
+    """register した画面は、初めて開く（get_screen される）ときに作る。"""
     def __init__(self, **kwargs):
+        self.factories = {}
         super().__init__(**kwargs)
-        self.state = 'play'
-        self.options = {'loop': True}
-        self.allow_stretch = True
-        self.keep_ratio = False # 縦横比を維持しない
-        self.size_hint = (1, 1)
-        self.pos = (0, 0)
-        
-        if 'source' in kwargs:
-             self.source = kwargs['source']
-        
-    def play_video(self):
-        # sourceが設定されていることを確認してから再生
-        if self.source and self.state != 'play':
-            self.state = 'play'
 
-    def stop_video(self):
-        if self.state != 'stop':
-            self.state = 'stop'
+    def register(self, name, factory):
+        self.factories[name] = factory
+
+    def get_screen(self, name):
+        # current を変えたときも Kivy はここを通る
+        if name in self.factories and not self.has_screen(name):
+            self.add_widget(self.factories[name](name=name))
+        return super().get_screen(name)
 
 # --- HomeScreen（ホーム画面） --- 
 class HomeScreen(Screen):
@@ -528,9 +583,8 @@ class HomeScreen(Screen):
 
         # --- 背景のセットアップ ---
         if self.video_source:
-            # 動画ファイルを背景として使用
-            self.video_bg = VideoBackground(source=self.video_source)
-            self.add_widget(self.video_bg)
+            # 動画ファイルを背景として使用（動画の読み込みは最初のフレームを出してから）
+            after_first_frame(self._add_video_bg)
         else:
             # 動画ファイルがない場合、画像を使用
             self.image_bg = Image(
@@ -589,6 +643,13 @@ class HomeScreen(Screen):
         # UI要素を最前面に表示するため、rootウィジェットを最後に加える
         self.add_widget(root)
 
+    def _add_video_bg(self):
+        self.video_bg = VideoBackground(self.video_source, volume=1.0, size_hint=(1, 1), pos=(0, 0))
+        # メニューUIの後ろに入れる
+        self.add_widget(self.video_bg, index=len(self.children))
+        if not self.manager or self.manager.current == self.name:
+            self.video_bg.play()
+
     def _update_root_rect(self, instance, value):
         self.root_rect.pos = instance.pos
         self.root_rect.size = instance.size
@@ -605,12 +666,12 @@ class HomeScreen(Screen):
     def on_pre_enter(self, *args):
         # 動画再生を再開
         if self.video_bg:
-            self.video_bg.play_video()
+            self.video_bg.play()
 
     def on_leave(self, *args):
         # 動画再生を停止
         if self.video_bg:
-            self.video_bg.stop_video()
+            self.video_bg.stop()
             
     def start_game(self, *args):
         self.stop_menu_bgm() 
@@ -618,16 +679,8 @@ class HomeScreen(Screen):
         app = App.get_running_app()
         sm = app.sm
         
-        # オプション画面から最新の設定値を取得
-        option_screen = sm.get_screen("options")
-        
-        spawn_min = float(option_screen.spawn_min_slider.value)
-        spawn_max = float(option_screen.spawn_max_slider.value)
-        gravity = float(option_screen.gravity_slider.value)
-        block_width = float(option_screen.block_width_slider.value)
-        
-        if spawn_min > spawn_max:
-            spawn_min, spawn_max = spawn_max, spawn_min 
+        # 最新の設定値（オプション画面のスライダーと同じ値をアプリが持っている）
+        spawn_min, spawn_max, gravity, block_width = app.game_settings()
 
         bgm_volume = app.bgm_volume
         sfx_volume = app.sfx_volume
@@ -735,15 +788,8 @@ class GameOverScreen(Screen):
             
         sm = app.sm
         
-        # オプション画面から最新の設定値を取得
-        option_screen = sm.get_screen("options")
-        spawn_min = float(option_screen.spawn_min_slider.value)
-        spawn_max = float(option_screen.spawn_max_slider.value)
-        gravity = float(option_screen.gravity_slider.value)
-        block_width = float(option_screen.block_width_slider.value)
-        
-        if spawn_min > spawn_max:
-            spawn_min, spawn_max = spawn_max, spawn_min 
+        # 最新の設定値（オプション画面のスライダーと同じ値をアプリが持っている）
+        spawn_min, spawn_max, gravity, block_width = app.game_settings()
         
         bgm_volume = app.bgm_volume
         sfx_volume = app.sfx_volume
@@ -768,6 +814,7 @@ class OptionScreen(Screen):
     HOME_IMAGE_FILENAME = "game.png"
 
     def __init__(self, **kwargs):
+        from kivy.uix.slider import Slider
         super().__init__(**kwargs)
         font_path = get_font_path()
         app = App.get_running_app()
@@ -780,7 +827,7 @@ class OptionScreen(Screen):
         
         # 背景のセットアップ (HomeScreenと同じロジック) 
         if self.video_source:
-            self.video_bg = VideoBackground(source=self.video_source)
+            self.video_bg = VideoBackground(self.video_source, volume=1.0, size_hint=(1, 1), pos=(0, 0))
             self.add_widget(self.video_bg)
         else:
             self.image_bg = Image(
@@ -823,28 +870,32 @@ class OptionScreen(Screen):
         # 敵の出現間隔 最小
         self.spawn_min_label = Label(text=f"👾 敵の出現間隔 最小(秒): {1.0:.1f}", font_size=25, font_name=font_path, size_hint=(1, None), height=30, color=(1, 1, 1, 1))
         root.add_widget(self.spawn_min_label)
-        self.spawn_min_slider = Slider(min=0.2, max=5.0, value=1.0, step=0.1)
+        self.spawn_min_slider = Slider(min=0.2, max=5.0, value=app.spawn_min, step=0.1)
+        self.spawn_min_slider.bind(value=app.setter('spawn_min'))
         self.spawn_min_slider.bind(value=lambda instance, value: self._update_label_text(self.spawn_min_label, "👾 敵の出現間隔 最小(秒)", value))
         root.add_widget(self.spawn_min_slider)
 
         # 敵の出現間隔 最大
         self.spawn_max_label = Label(text=f"👾 敵の出現間隔 最大(秒): {3.0:.1f}", font_size=25, font_name=font_path, size_hint=(1, None), height=30, color=(1, 1, 1, 1))
         root.add_widget(self.spawn_max_label)
-        self.spawn_max_slider = Slider(min=0.5, max=8.0, value=3.0, step=0.1)
+        self.spawn_max_slider = Slider(min=0.5, max=8.0, value=app.spawn_max, step=0.1)
+        self.spawn_max_slider.bind(value=app.setter('spawn_max'))
         self.spawn_max_slider.bind(value=lambda instance, value: self._update_label_text(self.spawn_max_label, "👾 敵の出現間隔 最大(秒)", value))
         root.add_widget(self.spawn_max_slider)
 
         # 重力
         self.gravity_label = Label(text=f"⬇️ 重力: {-0.5:.1f}", font_size=25, font_name=font_path, size_hint=(1, None), height=30, color=(1, 1, 1, 1))
         root.add_widget(self.gravity_label)
-        self.gravity_slider = Slider(min=-2.0, max=-0.1, value=-0.5, step=0.1)
+        self.gravity_slider = Slider(min=-2.0, max=-0.1, value=app.gravity, step=0.1)
+        self.gravity_slider.bind(value=app.setter('gravity'))
         self.gravity_slider.bind(value=lambda instance, value: self._update_label_text(self.gravity_label, "⬇️ 重力", value))
         root.add_widget(self.gravity_slider)
         
         # ブロックの幅
         self.block_width_label = Label(text=f"🧱 ブロックの幅 (ピクセル): {150:.0f}", font_size=25, font_name=font_path, size_hint=(1, None), height=30, color=(1, 1, 1, 1))
         root.add_widget(self.block_width_label)
-        self.block_width_slider = Slider(min=50, max=300, value=150, step=10)
+        self.block_width_slider = Slider(min=50, max=300, value=app.block_width, step=10)
+        self.block_width_slider.bind(value=app.setter('block_width'))
         self.block_width_slider.bind(value=lambda instance, value: self._update_label_text(self.block_width_label, "🧱 ブロックの幅 (ピクセル)", value, is_int=True))
         root.add_widget(self.block_width_slider)
         
@@ -950,7 +1001,7 @@ class OptionScreen(Screen):
         
         # 動画再生を再開
         if self.video_bg:
-            self.video_bg.play_video()
+            self.video_bg.play()
 
         # ラベルの初期値をスライダーの値で更新する（on_pre_enterで再設定）
         self.update_bgm_volume(self.bgm_volume_slider, self.bgm_volume_slider.value) 
@@ -965,7 +1016,7 @@ class OptionScreen(Screen):
     def on_leave(self, *args):
         # 動画再生を停止
         if self.video_bg:
-            self.video_bg.stop_video()
+            self.video_bg.stop()
 
 
     def start_game(self, *args):
@@ -1012,19 +1063,35 @@ class FuguRunnerApp(App):
     # BGM音量の初期値を 0.5 に変更し、音が鳴るようにする 
     bgm_volume = NumericProperty(0.5) 
     sfx_volume = NumericProperty(0.5) 
+    # ゲーム設定（オプション画面のスライダーと連動。オプション画面を開く前から使える）
+    spawn_min = NumericProperty(1.0)
+    spawn_max = NumericProperty(3.0)
+    gravity = NumericProperty(-0.5)
+    block_width = NumericProperty(150)
 
     def build(self):
-        self.sm = ScreenManager(transition=NoTransition())
+        self.sfx_bank = SoundBank(lambda name: safe_asset(assets_path(name)), voices=3)
+
+        self.sm = LazyScreenManager(transition=NoTransition())
         
-        # オプション画面を最初に作成し、他の画面が参照できるようにする
-        self.sm.add_widget(OptionScreen(name="options"))
+        # 起動時はホーム画面だけ作る。オプション・ゲームオーバーは初めて開くときに作る
         self.sm.add_widget(HomeScreen(name="home"))
-        self.sm.add_widget(GameOverScreen(name="gameover"))
+        self.sm.register("options", OptionScreen)
+        self.sm.register("gameover", GameOverScreen)
 
         self.sm.current = "home"
         Window.bind(on_key_down=self.on_key_down)
+        Window.bind(on_flip=_on_first_flip)
+        # 効果音の読み込みは最初のフレームを出してから
+        after_first_frame(lambda: self.sfx_bank.preload(SFX_FILES))
         return self.sm
 
+    def game_settings(self):
+        spawn_min, spawn_max = float(self.spawn_min), float(self.spawn_max)
+        if spawn_min > spawn_max:
+            spawn_min, spawn_max = spawn_max, spawn_min
+        return spawn_min, spawn_max, float(self.gravity), float(self.block_width)
+
     def on_key_down(self, window, key, scancode, codepoint, modifiers):
         if self.sm.current == "game" and key == 32: # Spaceキー
             gs = self.sm.get_screen("game")
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+hugu.py の画面で共通に使うもの（タイトル画面でも使うので軽いものだけ）
+- 定数・アセットのパス/テクスチャ/音の取り出し・動画背景つきの画面ベース
+- 重いもの（CoreImage・SoundLoader・動画）は関数の中で、使うときに import する
+"""
+import os
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.screenmanager import Screen
+
+from utils.atlas import sprite_source, sprite_texture
+from utils.assetpack import asset_pack, content_hash, packed_path
+from utils.paths import resolve_asset
+from utils.texture_cache import decode_image, texture_cache
+
+# --- 定数 ---
+ORANGE_COLOR = (1, 0.5, 0, 1)
+
+# 起動時に読み込んでおく効果音
+SFX_FILES = ["特殊演出.ogg", "特殊演出2.ogg", "GB__.ogg"]
+# タイトル画面のうちに別スレッドで先読みする画像と音
+STAGE_BGS = ["stage1_bg.png", "stage2_bg.png", "stage3_bg.png"]
+PRELOAD_IMAGES = STAGE_BGS + ["fugu.png", "hammer.png", "Kirimi.png", "bom.png"]
+PRELOAD_SOUNDS = ["bgm.ogg", "fever_bg.mp3"]
+# 低スペック機では背景動画の代わりに連番画像（background_frames/）を流す
+LOW_END_VIDEO = os.environ.get("FUGU_LOW_END") == "1"
+
+def get_path(filename):
+    # assets/ → 直下 → asset/ の順（起動時に1回だけ作る目録を引く。呼ぶたびに exists しない）
+    # ばらのファイルが無ければアセットパック（assets.fpk）から書き出したもの
+    return resolve_asset(filename) or packed_path(filename) or filename
+
+def open_cached_image(filename):
+    # デコード済みの画像（utils/texture_cache.py）。2回目以降の起動は PNG をデコードせず mmap から GPU へ
+    # キーは中身のハッシュ：ばらのファイルは読んでハッシュを取る、アセットパックは索引のハッシュをそのまま使う
+    path = resolve_asset(filename)
+    if path is not None:
+        with open(path, "rb") as f: data = f.read()
+        return texture_cache().load(filename, content_hash(data), lambda: decode_image(filename, data))
+    pack = asset_pack()
+    if pack is None or filename not in pack: return None
+    return texture_cache().load(filename, pack.entry(filename).hash,
+                                lambda: pack.image_loader(filename, keep_data=True))
+
+def get_sprite(filename):
+    # assets/sprites.atlas にあればそこから切り出す（テクスチャ1枚で済む）
+    return sprite_source(filename) or get_path(filename)
+
+def set_image(img, filename):
+    # 先読み済みならテクスチャを差し替えるだけ（ファイルを読み直さない）
+    tex = App.get_running_app().preloader.texture(filename)
+    if tex is not None: img.texture = tex
+    else: img.source = get_sprite(filename)
+
+def load_texture(filename):
+    # 先読みに無かった画像用（1回だけ読んで StageBackground が持ち続ける）
+    from kivy.core.image import Image as CoreImage
+    src = sprite_source(filename)
+    if src is None:
+        img = open_cached_image(filename)
+        if img is not None: return img.texture
+    return CoreImage(src or get_path(filename)).texture
+
+def entity_texture(filename):
+    # バッチ描画用：atlas の領域なら全部同じテクスチャなので1つの Mesh にまとめられる
+    return (sprite_texture(filename) or App.get_running_app().preloader.texture(filename)
+            or load_texture(filename))
+
+def load_sound(filename):
+    from kivy.core.audio import SoundLoader
+    return App.get_running_app().preloader.sound(filename) or SoundLoader.load(get_path(filename))
+
+def get_font():
+    f = get_path("GenShinGothic-Regular.ttf")
+    # ファイルが存在すればそのパスを返し、なければNoneではなく空文字を返す
+    if os.path.exists(f):
+        return f
+    return "" # Noneを返すとLabelがエラーを吐くので、空文字にする
+
+# --- 画面ベース ---
+class VideoBGScreen(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bg_video = None
+        Window.bind(on_size=self._update_rect)
+
+    def on_enter(self):
+        src = get_path("background.mp4")
+        if os.path.exists(src):
+            # 動画まわり（ffpyplayer）は初めて動画を出すときに読む
+            from utils.video import VideoBackground
+            # デコードは別スレッド。メインスレッドは最新フレームを貼るだけ
+            self.bg_video = VideoBackground(src, low_end=LOW_END_VIDEO, volume=1.0,
+                                            size=Window.size, pos=(0,0))
+            self.add_widget(self.bg_video, index=1000)
+            self.bg_video.play()
+
+    def _update_rect(self, *args):
+        if self.bg_video: 
+            self.bg_video.size = Window.size
+            self.bg_video.pos = (0,0)
+
+    def on_leave(self):
+        if self.bg_video:
+            self.bg_video.stop(); self.remove_widget(self.bg_video); self.bg_video = None
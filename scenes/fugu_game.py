@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+hugu.py のゲーム画面（Game / GameScreen / GameOverScreen）
+- 「開始」を押したときに初めて import される（NumPy・FuguWorld・バッチ描画もそのときに読む）
+"""
+import os
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import PushMatrix, PopMatrix, Rotate
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.widget import Widget
+
+from utils.quad_batch import QuadBatch
+from utils.sprite_batch import sprite_layers
+from utils.background import StageBackground
+from core.loop import FixedStepLoop, lerp
+from game.particles import BLAST, HIT, SPARKLE
+from game.fugu_world import (FuguWorld, SCORE, FEVER_START, FEVER_END, BOSS, BOSS_HIT,
+                             SPECIAL, SPECIAL2, GAME_OVER, CLEAR)
+from scenes.fugu_common import (ORANGE_COLOR, STAGE_BGS, get_sprite, set_image, load_texture, entity_texture,
+                                load_sound, get_font)
+
+# --- オブジェクト ---
+class Fugu(Image):
+    # 見た目だけ（位置・回転・ハンマー）。動きと当たり判定は FuguWorld
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        set_image(self, "fugu.png")
+        self.size = (110, 110)
+        self.size_hint = (None, None)
+        self.hammer = Image(size=(80, 80), size_hint=(None, None), opacity=0)
+        set_image(self.hammer, "hammer.png")
+        with self.canvas.before:
+            PushMatrix()
+            self.rot = Rotate(angle=0, origin=self.center)
+        with self.canvas.after:
+            PopMatrix()
+
+    def sync(self, f, alpha, fever):
+        self.pos = (lerp(f.px, f.x, alpha), lerp(f.py, f.y, alpha))
+        self.rot.angle = f.angle
+        self.rot.origin = self.center
+        if f.invincible: self.hammer.pos = (self.right - 20, self.y + 15)
+        self.hammer.opacity = 1 if fever and f.invincible else 0
+
+    def reset(self, pos=(100, 100)):
+        # リトライ用：見た目だけ初期化（テクスチャはそのまま）
+        self.pos = pos
+        self.rot.angle = 0; self.rot.origin = self.center
+        self.hammer.opacity = 0
+
+# --- ゲーム本体 ---
+class Game(Widget):
+    # 描画と音だけを担当する。動き・当たり判定・タイマーは FuguWorld（game/fugu_world.py）
+    def __init__(self, settings, seed=None, **kwargs):
+        super().__init__(**kwargs)
+        # ここではウィジェット・音など「1回だけ作るもの」を用意し、プレイ状態は reset() で作る
+        self.world = self.loop = None
+        self.boss = None
+        self.tick_event = self._end_ev = None
+
+        # 背景画像 (リサイズ対応)
+        # 背景（ステージ画像は全部テクスチャで常駐。切り替えは差し替えのみ）
+        self.bg = StageBackground(load=load_texture, size=Window.size, pos=(0,0))
+        for name in STAGE_BGS: self.bg.add(name, App.get_running_app().preloader.texture(name))
+        self.add_widget(self.bg)
+        Window.bind(on_size=self._on_resize)
+        # 障害物・ブロックはウィジェットを作らず、レイヤーごとに Mesh 1つで描く（背景のすぐ上）
+        # atlas があれば両方とも同じテクスチャなので Mesh も1つになる
+        self.entity_layers = sprite_layers(self.bg.canvas.after, {"bom": entity_texture("bom.png"),
+                                                                  "block": entity_texture("block.png")})
+        self.entity_batches = list(dict.fromkeys(self.entity_layers.values()))
+
+        # キャラクター
+        self.fugu = Fugu(pos=(100, 100))
+        self.add_widget(self.fugu)
+        self.add_widget(self.fugu.hammer)
+        
+        # スコア表示 (左端)
+        self.score_label = Label(text="Score: 0", font_size=45, font_name=get_font(), color=ORANGE_COLOR)
+        self.add_widget(self.score_label)
+        
+        # ボスHP表示 (中央上)
+        self.hp_label = Label(text="", font_size=40, font_name=get_font(), color=(1,0,0,1))
+        self.add_widget(self.hp_label)
+
+        self._update_ui_pos()
+
+        # 切り身は何個あっても Mesh 1つで描く（ウィジェットを作らない）
+        kirimi_tex = App.get_running_app().preloader.texture("Kirimi.png") or load_texture("Kirimi.png")
+        self.kirimi_batch = QuadBatch(self.canvas.after, kirimi_tex)
+        # 吹き飛び・命中の火花・キラキラも種類ごとに Mesh 1つ（粒子ごとのウィジェットは作らない）
+        bom_tex = App.get_running_app().preloader.texture("bom.png") or load_texture("bom.png")
+        self.particle_batches = {
+            BLAST: QuadBatch(self.canvas.after, bom_tex),
+            HIT: QuadBatch(self.canvas.after, None, capacity=512, color=(1, 0.6, 0.1, 1)),
+            SPARKLE: QuadBatch(self.canvas.after, None, capacity=256, color=(1, 1, 0.6, 0.9)),
+        }
+
+        # サウンド
+        self.bgm = load_sound("bgm.ogg")
+        self.fever_sound = load_sound("fever_bg.mp3")
+        self.sfx = App.get_running_app().sfx
+
+        self.reset(settings, seed)
+
+    def reset(self, settings, seed=None):
+        # ウィジェット・テクスチャ・音は残したまま、1回分のプレイ状態だけを作り直す
+        self._cancel_events()
+        self.world = FuguWorld.from_settings(settings, width=Window.width, height=Window.height, seed=seed)
+        # 時計は1つだけ：固定ステップで world を進め、出現などのタイマーも world 内で回る
+        self.loop = FixedStepLoop(self.world.step, self.world.dt)
+
+        # 前回のプレイで出ていたものは全部消す
+        for batch in self.entity_batches: batch.clear()
+        self.kirimi_batch.clear()
+        for batch in self.particle_batches.values(): batch.clear()
+        if self.boss is not None and self.boss.parent: self.remove_widget(self.boss)
+
+        self.fugu.reset()
+        self.bg.reset("stage1_bg.png")
+        self.score_label.text = "Score: 0"
+        self.hp_label.text = ""
+
+        if self.fever_sound: self.fever_sound.stop()
+        if self.bgm: self.bgm.stop(); self.bgm.loop = True; self.bgm.play()
+
+        self.tick_event = Clock.schedule_interval(self.tick, 0)
+
+    def _cancel_events(self):
+        for ev in (self.tick_event, self._end_ev):
+            if ev is not None: ev.cancel()
+        self.tick_event = self._end_ev = None
+
+    # 画面やボットから見える状態は world のものをそのまま返す
+    @property
+    def score(self): return self.world.score
+    @property
+    def is_cleared(self): return self.world.is_cleared
+    @property
+    def is_game_over(self): return self.world.is_game_over
+    @property
+    def replay(self): return self.world.replay
+
+    def _on_resize(self, *args):
+        self.bg.size = Window.size
+        self.bg.pos = (0,0)
+        if self.world: self.world.width, self.world.height = Window.size
+        self._update_ui_pos()
+
+    def _update_ui_pos(self):
+        # スコアを左端に
+        self.score_label.x = 50
+        self.score_label.top = Window.height - 20
+        # HPバーを中央上に
+        self.hp_label.center_x = Window.width / 2
+        self.hp_label.top = Window.height - 20
+
+    def on_touch_down(self, touch):
+        if self.world.is_over(): return super().on_touch_down(touch)
+        # ボス戦中は world 側で Kirimi を発射する
+        self.world.touch(touch.x, touch.y)
+        return super().on_touch_down(touch)
+
+    def jump(self):
+        self.world.jump()
+
+    def save_replay(self):
+        self.replay.steps = self.world.steps
+        try: self.replay.save(os.path.join(App.get_running_app().user_data_dir, "last_replay.json"))
+        except OSError: pass
+
+    def add_score(self, p):
+        self.world.add_score(p)
+
+    def trigger_special_event(self):
+        self.world.trigger_special()
+
+    # --- 毎フレーム ---
+    def tick(self, dt):
+        self.loop.advance(dt)
+        self._handle(self.world.drain())
+        self.sync(self.loop.alpha)
+
+    def _handle(self, events):
+        for name, value in events:
+            if name == SCORE:
+                self.score_label.text = f"Score: {value}"
+                stage = self.world.stage
+                if stage > 1: self.bg.show(STAGE_BGS[stage - 1], fade=0.5)
+            elif name == FEVER_START:
+                if self.bgm: self.bgm.stop()
+                if self.fever_sound: self.fever_sound.play()
+            elif name == FEVER_END:
+                if self.fever_sound: self.fever_sound.stop()
+                if self.bgm and not self.world.is_game_over: self.bgm.play()
+            elif name in (BOSS, BOSS_HIT):
+                self.hp_label.text = f"BOSS HP: {value}"
+            elif name == SPECIAL:
+                self.sfx.play("特殊演出.ogg")
+            elif name == SPECIAL2:
+                self.sfx.play("特殊演出2.ogg")
+            elif name == GAME_OVER:
+                self.pause_game()
+                self.save_replay()
+                self.sfx.play("GB__.ogg")
+                self._end_ev = Clock.schedule_once(lambda dt: setattr(App.get_running_app().sm, 'current', 'gameover'), 1.5)
+            elif name == CLEAR:
+                self.hp_label.text = "GAME CLEAR!"
+                if self.bgm: self.bgm.stop()
+                self.save_replay()
+                self._end_ev = Clock.schedule_once(lambda dt: setattr(App.get_running_app().sm, 'current', 'gameover'), 3.0)
+
+    def sync(self, alpha):
+        # world の状態をウィジェットへ書き写す（前ステップとの間を alpha で補間）
+        w = self.world
+        self.fugu.sync(w.fugu, alpha, w.is_fever)
+
+        if w.boss is not None:
+            # ボスも初回だけ作って使い回す
+            if self.boss is None: self.boss = Image(source=get_sprite("boss.png"), size=(400, 400), size_hint=(None, None))
+            if not self.boss.parent: self.add_widget(self.boss)
+            self.boss.pos = (lerp(w.boss.px, w.boss.x, alpha), lerp(w.boss.py, w.boss.y, alpha))
+        elif self.boss is not None and self.boss.parent:
+            self.remove_widget(self.boss)
+
+        for batch in self.entity_batches: batch.begin()
+        bom, block = self.entity_layers["bom"], self.entity_layers["block"]
+        for e in w.obstacles: bom.draw("bom", lerp(e.px, e.x, alpha), lerp(e.py, e.y, alpha), e.w, e.h)
+        for e in w.blocks: block.draw("block", lerp(e.px, e.x, alpha), lerp(e.py, e.y, alpha), e.w, e.h)
+        for batch in self.entity_batches: batch.end()
+        self.kirimi_batch.update(*w.projectiles.positions(alpha), w.projectiles.w, w.projectiles.h)
+        for kind, batch in self.particle_batches.items():
+            xs, ys, size, angle = w.particles.quads(kind, alpha)
+            batch.update(xs, ys, size, size, angle)
+
+    def pause_game(self):
+        if self.tick_event is not None: self.tick_event.cancel(); self.tick_event = None
+        if self.bgm: self.bgm.stop()
+        if self.fever_sound: self.fever_sound.stop()
+
+    def resume_game(self):
+        if self.tick_event is None: self.tick_event = Clock.schedule_interval(self.tick, 0)
+        if self.world.is_fever:
+            if self.fever_sound: self.fever_sound.play()
+        elif self.bgm: self.bgm.play()
+
+# --- 各種画面 ---
+class GameScreen(Screen):
+    def __init__(self, settings, **kwargs):
+        super().__init__(**kwargs); self.game = Game(settings=settings); self.add_widget(self.game)
+
+class GameOverScreen(Screen):
+    def on_enter(self):
+        self.clear_widgets(); l = BoxLayout(orientation='vertical', padding=100, spacing=30)
+        gs = App.get_running_app().sm.get_screen("game")
+        txt = "GAME CLEAR" if gs and getattr(gs.game, 'is_cleared', False) else "GAME OVER"
+        color = (0, 1, 0, 1) if txt == "GAME CLEAR" else (1, 0, 0, 1)
+        l.add_widget(Label(text=txt, font_size=80, font_name=get_font(), color=color))
+        btn = Button(text="ホームに戻る", font_name=get_font(), size_hint=(.4,.2), pos_hint={'center_x':.5})
+        btn.bind(on_press=lambda x: setattr(self.manager, 'current', 'home')); l.add_widget(btn)
+        self.add_widget(l)
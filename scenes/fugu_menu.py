@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+hugu.py の設定画面（OptionScreen）と管理者パネル（AdminPanel）
+- 初めて開くときに import される（タイトル画面の起動には要らない）
+"""
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.slider import Slider
+
+from scenes.fugu_common import ORANGE_COLOR, VideoBGScreen, get_font
+
+class OptionScreen(VideoBGScreen):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        l = BoxLayout(orientation='vertical', padding=40, spacing=5)
+        l.add_widget(Label(text="詳細設定", font_size=30, font_name=get_font()))
+        # 値は app.settings に持つ（この画面は初めて開くときに作られる）
+        settings = App.get_running_app().settings
+        self.s_f = Slider(min=0.5, max=5.0, value=settings[0]); self.s_g = Slider(min=-1.5, max=-0.1, value=settings[1]); self.s_w = Slider(min=50, max=500, value=settings[2])
+        for k, (s, t) in enumerate([(self.s_f, "出現間隔"), (self.s_g, "重力"), (self.s_w, "ブロック幅")]):
+            lbl = Label(text=f"{t}: {round(s.value, 2)}", font_name=get_font())
+            s.bind(value=lambda i, v, lb=lbl, tt=t: setattr(lb, 'text', f"{tt}: {round(v, 2)}"))
+            s.bind(value=lambda i, v, k=k: settings.__setitem__(k, v))
+            l.add_widget(lbl); l.add_widget(s)
+        l.add_widget(Button(text="戻る", font_name=get_font(), size_hint=(0.3, 0.15), pos_hint={'center_x':0.5}, on_press=lambda x: setattr(self.manager, 'current', 'home')))
+        self.add_widget(l)
+
+class AdminPanel(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        with self.canvas.before:
+            Color(0, 0, 0, 0); self.r1 = Rectangle(size=Window.size)
+        main = BoxLayout(orientation='vertical', padding=20, spacing=10, size_hint=(0.5, 0.6), pos_hint={'center_x': 0.5, 'center_y': 0.5})
+        with main.canvas.before:
+            Color(0.1, 0.1, 0.1, 0.85); self.r2 = Rectangle(size=main.size, pos=main.pos)
+        main.bind(pos=self._upd, size=self._upd)
+        main.add_widget(Label(text="ADMIN PANEL", font_name=get_font(), font_size=24, color=ORANGE_COLOR))
+        self.score_slider = Slider(min=0, max=31, value=0, step=1)
+        self.score_label = Label(text=f"設定スコア: {int(self.score_slider.value)}", font_name=get_font())
+        self.score_slider.bind(value=lambda i, v: setattr(self.score_label, 'text', f"設定スコア: {int(v)}"))
+        main.add_widget(self.score_label); main.add_widget(self.score_slider)
+        main.add_widget(Button(text="スコアを適用", font_name=get_font(), on_press=self._apply_score))
+        main.add_widget(Button(text="特殊演出 発動", font_name=get_font(), background_color=(1, 0, 0, 1), on_press=self._trigger_special))
+        main.add_widget(Button(text="閉じる", font_name=get_font(), on_press=self.close))
+        self.add_widget(main)
+
+    def _upd(self, i, v): self.r1.size=Window.size; self.r2.pos, self.r2.size = i.pos, i.size
+    def _apply_score(self, instance):
+        gs = App.get_running_app().sm.get_screen("game")
+        if gs: gs.game.add_score(int(self.score_slider.value) - gs.game.score)
+    def _trigger_special(self, instance):
+        gs = App.get_running_app().sm.get_screen("game")
+        if gs: gs.game.trigger_special_event()
+        self.close()
+    def close(self, *args):
+        App.get_running_app().sm.current = 'game'
+        gs = App.get_running_app().sm.get_screen("game")
+        if gs: gs.game.resume_game()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+素材の目録（asset_manifest.json）を作る：PyInstaller 版が起動時にフォルダを走査しないように
+- utils/paths.py の AssetManifest.scan() と同じ走査（assets/ → 直下 → asset/）をして JSON に保存する
+- --datas で、spec の datas に渡す [元, 同梱先] の組を JSON で出す（目録ファイル自身も含む）
+- 素材を足したり消したりしたら作り直す（ビルドの直前に1回）
+- アセットパック（tools/pack_assets.py）で配るときは --skip asset で asset/ を外す
+  （パック assets.fpk は直下のファイルとして目録と datas に入る）
+- --root で別のフォルダの目録を作れる。目録と datas のパスはそのフォルダから
+  （ふぐ刺し完全版！ の spec は、パックの出力先 build/assetpack/ を --root にしてビルドのたびに作る）
+
+使い方（リポジトリ直下で）：
+    python -m tools.asset_manifest
+    python -m tools.asset_manifest --datas datas.json
+    python -m tools.asset_manifest --skip asset --datas datas.json
+    python -m tools.asset_manifest --root ふぐ刺し完全版！/build/assetpack --dirs ""
+
+spec 側（datas.json はコミットせず、ビルドの前に作る）：
+    import json
+    datas = [tuple(d) for d in json.load(open("datas.json", encoding="utf-8"))]
+    a = Analysis(["FuguRunnerApp.py"], datas=datas, ...)
+"""
+import argparse
+import json
+from pathlib import Path
+
+from utils.paths import ASSET_DIRS, MANIFEST_NAME, REPO_ROOT, AssetManifest
+
+
+def pyinstaller_datas(manifest: AssetManifest, manifest_file: Path, dirs=ASSET_DIRS):
+    """サブフォルダはフォルダごと、直下のファイルは1つずつ。"""
+    datas = []
+    for d in dirs:
+        if d and (manifest.root / d).is_dir():
+            datas.append([d, d])
+    for e in manifest.entries.values():
+        if "/" not in e.path:
+            datas.append([e.path, "."])
+    datas.append([manifest_file.name, "."])
+    return datas
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--root", default=str(REPO_ROOT), help="素材を探すフォルダ（既定はリポジトリ直下）")
+    ap.add_argument("--dirs", nargs="+", default=list(ASSET_DIRS), help="探す順（\"\" は --root の直下）")
+    ap.add_argument("--out", help=f"既定は <root>/{MANIFEST_NAME}")
+    ap.add_argument("--datas", help="spec の datas を JSON で保存する")
+    ap.add_argument("--skip", nargs="*", default=[], help="同梱しないフォルダ（パックに入れたもの）")
+    args = ap.parse_args()
+
+    root = Path(args.root)
+    dirs = tuple(d for d in args.dirs if d not in args.skip)
+    manifest = AssetManifest.scan(root=root, dirs=dirs)
+    out = Path(args.out) if args.out else root / MANIFEST_NAME
+    manifest.save(out)
+    kinds = {}
+    for e in manifest.entries.values():
+        kinds[e.kind] = kinds.get(e.kind, 0) + 1
+    print(f"saved {out}: {len(manifest)} assets "
+          + ", ".join(f"{k} {n}" for k, n in sorted(kinds.items())))
+
+    if args.datas:
+        with open(args.datas, "w", encoding="utf-8") as f:
+            json.dump(pyinstaller_datas(manifest, out, dirs), f, ensure_ascii=False, indent=1)
+        print(f"saved {args.datas}")
+
+
+if __name__ == "__main__":
+    main()
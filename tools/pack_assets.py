@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+asset/ をアセットパック（assets.fpk、形式は utils/assetpack.py）にまとめる
+- 名前は utils/paths.py の目録と同じ（フォルダからの相対パス）。get_path("bom.png") のまま引ける
+- wav は ogg（Vorbis）に変換して入れる。ffmpeg が無い・変換に失敗したときは止める
+  （wav のまま入れてよければ --no-transcode、要らない原盤なら --exclude で外す）
+- --exclude のパターン（fnmatch。名前に対して）に合うものは入れない
+- png・ogg・mp4 はもともと圧縮されているのでそのまま。縮むものだけ zlib
+- 同じ中身のファイルは1回だけ入れる
+- 終わったら、元の合計サイズ・パックのサイズ・変換した数などを表示する
+
+使い方（リポジトリ直下で）：
+    python -m tools.pack_assets
+    python -m tools.pack_assets --dirs asset assets --out dist/assets.fpk
+    python -m tools.pack_assets --no-transcode
+    python -m tools.pack_assets --root ふぐ刺し完全版！ --dirs assets --exclude "*.wav" --out build/assets.fpk
+
+配布するとき：パックを同梱して asset/ を外す（目録は python -m tools.asset_manifest --skip asset）
+ふぐ刺し完全版！ の PyInstaller 版は、spec がビルドのたびにパックと目録を作って同梱する（FuguRunnerApp.spec）
+"""
+import argparse
+import fnmatch
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from utils.assetpack import PACK_NAME, AssetPack, write_pack
+from utils.paths import REPO_ROOT, AssetManifest
+
+# 変換してから入れる音（元の拡張子 → 変換後）
+TRANSCODE = {".wav": ".ogg"}
+
+
+def transcode(src: str, ext: str, ffmpeg: str, quality: int):
+    """ffmpeg で ogg に変換した中身を返す。失敗したら None。"""
+    fd, out = tempfile.mkstemp(suffix=ext)
+    os.close(fd)
+    try:
+        r = subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-i", src,
+                            "-c:a", "libvorbis", "-q:a", str(quality), out],
+                           capture_output=True)
+        if r.returncode != 0:
+            return None
+        with open(out, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(out)
+
+
+def collect(dirs, ffmpeg, quality: int, root: Path = REPO_ROOT, exclude=()):
+    """
+    (名前, 中身, 中身の拡張子, 種類) を並べる。
+    変換した名前と、変換するはずが元のまま入れた名前（ffmpeg が無い・失敗）のリストも返す。
+    """
+    manifest = AssetManifest.scan(root=root, dirs=dirs)
+    items, converted, kept = [], [], []
+    for name, e in manifest.entries.items():
+        if any(fnmatch.fnmatch(name, pat) for pat in exclude):
+            continue
+        src = os.path.join(root, e.path)
+        ext = os.path.splitext(name)[1].lower()
+        data = None
+        if ext in TRANSCODE:
+            if ffmpeg:
+                data = transcode(src, TRANSCODE[ext], ffmpeg, quality)
+            if data is not None:
+                ext = TRANSCODE[ext]
+                converted.append(name)
+            else:
+                kept.append(name)
+        if data is None:
+            with open(src, "rb") as f:
+                data = f.read()
+        items.append((name, data, ext, e.kind))
+    return manifest, items, converted, kept
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--root", default=str(REPO_ROOT), help="--dirs の起点（既定はリポジトリ直下）")
+    ap.add_argument("--dirs", nargs="+", default=["asset"], help="まとめるフォルダ（先に書いたものが優先）")
+    ap.add_argument("--out", help=f"既定は <root>/{PACK_NAME}")
+    ap.add_argument("--no-transcode", action="store_true", help="wav を変換せずにそのまま入れる")
+    ap.add_argument("--exclude", nargs="*", default=[], help="入れない名前のパターン（例：\"*.wav\"）")
+    ap.add_argument("--quality", type=int, default=5, help="Vorbis の品質（0〜10）")
+    ap.add_argument("--level", type=int, default=9, help="zlib の圧縮レベル")
+    args = ap.parse_args()
+
+    ffmpeg = None if args.no_transcode else shutil.which("ffmpeg")
+
+    root = Path(args.root)
+    manifest, items, converted, kept = collect(args.dirs, ffmpeg, args.quality, root, args.exclude)
+    if not items:
+        raise SystemExit(f"素材が見つかりません: {args.dirs}")
+    if kept and not args.no_transcode:
+        # 黙って wav の原盤を詰めると、パックが何 MB も膨らむ
+        why = "ffmpeg が見つかりません" if ffmpeg is None else "ffmpeg での変換に失敗しました"
+        raise SystemExit(f"{why}。変換できない wav があります:\n  " + "\n  ".join(kept)
+                         + "\nそのまま入れるなら --no-transcode、要らないものなら --exclude で外してください")
+    out = Path(args.out) if args.out else root / PACK_NAME
+    out.parent.mkdir(parents=True, exist_ok=True)
+    write_pack(out, items, level=args.level)
+
+    pack = AssetPack(out)
+    src_bytes = sum(manifest.entries[name].size for name in pack.entries)
+    blobs = {e.hash for e in pack.entries.values()}
+    zipped = sum(1 for e in pack.entries.values() if e.codec == "zlib")
+    print(f"{'file':<40} {'source':>10} {'packed':>10} codec")
+    for name, e in pack.entries.items():
+        print(f"{name:<40} {manifest.entries[name].size:>10} {e.length:>10} {e.codec}{e.ext if name in converted else ''}")
+    print(f"saved {out}: {len(pack)} files ({len(blobs)} unique), "
+          f"{src_bytes / 1e6:.2f} MB -> {out.stat().st_size / 1e6:.2f} MB, "
+          f"{len(converted)} transcoded, {zipped} zlib")
+
+
+if __name__ == "__main__":
+    main()
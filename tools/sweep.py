@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+難易度スイープ：FuguWorld（描画なし）をボットで何千回も遊ばせて MODE_PRESETS を評価する
+- 1回のプレイ = (設定, seed, ボット) → 生存時間・スコア・ボス到達・クリア・ステップ/秒
+- seed ごとに独立なので multiprocessing.Pool で並列に回す（コア数にほぼ比例して速くなる）
+- ボット：
+    random   : 一定確率でジャンプ、ボス戦中はボスをタップ
+    scripted : 障害物が近づいたらジャンプ、ボス戦中は一定間隔でボスをタップ
+
+使い方（リポジトリ直下で）：
+    python -m tools.sweep --seeds 2000
+    python -m tools.sweep --modes Hard --policy random --seeds 500 --json hard.json
+    python -m tools.sweep --spawn 1.0 1.2 1.5 --gravity -0.5 --block 120 --seeds 1000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+from itertools import product
+from multiprocessing import Pool
+from time import perf_counter
+
+from game.fugu_world import FuguWorld, MODE_PRESETS, JUMP_VY, SCROLL
+
+POLICIES = ("scripted", "random")
+
+
+def _random_bot(w: FuguWorld, rng: random.Random):
+    if rng.random() < 0.03:
+        w.jump()
+    if w.boss is not None and rng.random() < 0.2:
+        w.touch(w.boss.x + w.boss.w / 2, w.boss.y + w.boss.h / 2)
+
+
+def _scripted_bot(w: FuguWorld, rng: random.Random):
+    f = w.fugu
+    if w.boss is not None:
+        if w.steps % 6 == 0:
+            w.touch(w.boss.x + w.boss.w / 2, w.boss.y + w.boss.h / 2)
+        return
+    # 滞空時間の半分で進む距離まで近づいたら跳ぶ
+    lead = SCROLL * JUMP_VY / max(0.05, abs(w.gravity)) * 0.5
+    for o in w.obstacles:
+        gap = o.x - f.right
+        if 0 < gap < lead:
+            w.jump()
+            break
+
+
+_BOTS = dict(random=_random_bot, scripted=_scripted_bot)
+
+
+def play(job):
+    """1回分のプレイ。Pool から呼ばれるのでトップレベル関数・引数はタプル。"""
+    name, settings, seed, policy, max_seconds = job
+    w = FuguWorld.from_settings(settings, seed=seed, effects=False)
+    bot, rng = _BOTS[policy], random.Random(seed ^ 0x5EED)
+    max_steps = int(max_seconds / w.dt)
+    t0 = perf_counter()
+    while not w.is_over() and w.steps < max_steps:
+        bot(w, rng)
+        w.step()
+    wall = perf_counter() - t0
+    return dict(mode=name, seed=seed, steps=w.steps, survival_s=w.t, score=w.score,
+                boss=w.boss_spawned, cleared=w.is_cleared, over=w.is_game_over,
+                steps_per_s=w.steps / wall if wall > 0 else 0.0)
+
+
+def _pct(vals, p):
+    vals = sorted(vals)
+    return vals[min(len(vals) - 1, int(p * len(vals)))] if vals else 0.0
+
+
+def summarize(rows):
+    """モードごとに集計する。"""
+    out = {}
+    for r in rows:
+        out.setdefault(r["mode"], []).append(r)
+    report = {}
+    for name, rs in out.items():
+        surv = [r["survival_s"] for r in rs]
+        score = [r["score"] for r in rs]
+        report[name] = dict(
+            runs=len(rs),
+            survival_mean=statistics.fmean(surv),
+            survival_p10=_pct(surv, 0.10), survival_p50=_pct(surv, 0.50), survival_p90=_pct(surv, 0.90),
+            score_mean=statistics.fmean(score),
+            score_p10=_pct(score, 0.10), score_p50=_pct(score, 0.50), score_p90=_pct(score, 0.90),
+            score_hist={str(k): sum(1 for s in score if s == k) for k in sorted(set(score))},
+            boss_rate=sum(r["boss"] for r in rs) / len(rs),
+            clear_rate=sum(r["cleared"] for r in rs) / len(rs),
+            steps_per_s=statistics.fmean(r["steps_per_s"] for r in rs),
+        )
+    return report
+
+
+def jobs_for(args):
+    if args.spawn or args.gravity or args.block:
+        # 自由な組み合わせ（指定しなかった軸は Normal の値）
+        base = MODE_PRESETS["Normal"]
+        grid = product(args.spawn or [base[0]], args.gravity or [base[1]], args.block or [base[2]])
+        configs = {f"s={s:g} g={g:g} b={b:g}": [s, g, b] for s, g, b in grid}
+    else:
+        configs = {m: MODE_PRESETS[m] for m in args.modes}
+    seeds = range(args.start_seed, args.start_seed + args.seeds)
+    return [(name, settings, seed, args.policy, args.max_seconds)
+            for name, settings in configs.items() for seed in seeds]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--modes", nargs="+", default=list(MODE_PRESETS), choices=list(MODE_PRESETS))
+    ap.add_argument("--spawn", nargs="+", type=float, help="出現間隔のリスト（グリッド）")
+    ap.add_argument("--gravity", nargs="+", type=float, help="重力のリスト（グリッド）")
+    ap.add_argument("--block", nargs="+", type=float, help="ブロック幅のリスト（グリッド）")
+    ap.add_argument("--seeds", type=int, default=200)
+    ap.add_argument("--start-seed", type=int, default=0)
+    ap.add_argument("--policy", choices=POLICIES, default="scripted")
+    ap.add_argument("--max-seconds", type=float, default=300.0, help="1回のプレイの上限（ゲーム内時間）")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--json", help="集計と全結果を JSON で保存")
+    args = ap.parse_args()
+
+    jobs = jobs_for(args)
+    t0 = perf_counter()
+    if args.workers > 1:
+        with Pool(args.workers) as pool:
+            rows = pool.map(play, jobs, chunksize=max(1, len(jobs) // (args.workers * 8)))
+    else:
+        rows = [play(j) for j in jobs]
+    wall = perf_counter() - t0
+    report = summarize(rows)
+
+    print(f"{len(rows)} runs / {args.workers} workers / {wall:.1f}s "
+          f"({sum(r['steps'] for r in rows) / wall:,.0f} steps/s total)")
+    print(f"{'mode':<24} {'surv p10/50/90 (s)':>20} {'score p10/50/90':>16} {'boss':>6} {'clear':>6} {'steps/s':>9}")
+    for name, r in report.items():
+        print(f"{name:<24} {r['survival_p10']:>6.1f}/{r['survival_p50']:>5.1f}/{r['survival_p90']:>6.1f}"
+              f" {r['score_p10']:>6}/{r['score_p50']:>3}/{r['score_p90']:>4}"
+              f" {r['boss_rate']:>6.1%} {r['clear_rate']:>6.1%} {r['steps_per_s']:>9,.0f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(dict(policy=args.policy, report=report, runs=rows), f, ensure_ascii=False, indent=1)
+        print(f"saved {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
+"""
+[E] HUD: score/hp/speed/paused
+- 表示する値を丸めて（score は整数、speed は 0.1 刻み）前回と比べ、
+  見た目が変わるときだけ Label.text を書き換える（毎フレームの再ラスタライズを防ぐ）
+"""
 from kivy.uix.label import Label
 from kivy.properties import BooleanProperty
 
 class HUD(Label):
     visible = BooleanProperty(True)
 
-    def __init__(self, **kwargs):
+    def __init__(self, score_step: float = 1.0, speed_step: float = 0.1, **kwargs):
         super().__init__(**kwargs)
+        self.score_step = score_step
+        self.speed_step = speed_step
+        self._last_key = None
         self.markup = True
         self.font_size = "16sp"
         self.halign = "left"
@@ -15,9 +23,20 @@ class HUD(Label):
         self.text = ""
 
     def set_info(self, info: dict):
-        self.text = (
-            "[b]HUD[/b]\\n"
-            f"score={int(info.get('score',0))}  hp={info.get('hp',0)}\\n"
-            f"speed={info.get('speed',0):.1f}  paused={info.get('paused',False)}"
-        )
+        score = int(info.get('score',0) // self.score_step * self.score_step)
+        speed_q = round(info.get('speed',0) / self.speed_step)
+        key = (score, info.get('hp',0), speed_q, info.get('paused',False), info.get('profile'))
+        if key != self._last_key:
+            self._last_key = key
+            text = (
+                "[b]HUD[/b]\n"
+                f"score={score}  hp={key[1]}\n"
+                f"speed={speed_q * self.speed_step:.1f}  paused={key[3]}"
+            )
+            # プロファイラ表示（p50/p95/p99 + スパークライン）
+            if key[4]:
+                text += "\n" + key[4]
+            self.text = text
+
+    def on_visible(self, *_):
         self.opacity = 1.0 if self.visible else 0.0
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+PlayRenderer: 描画命令を毎フレーム作り直さない（retained mode）
+- 背景・レーンライン・地面は最初に1回だけ InstructionGroup に積む
+- プレイヤー/障害物は Rectangle を使い回し、pos だけ書き換える
+- 障害物の Rectangle は数が増えた/減ったときだけ追加/削除（プールから出し入れ）
+- self.allocated: 作った命令の総数（定常状態で増えなければOK）
+- sync(world, alpha): 固定ステップの間を alpha（0〜1）で補間して置く
+"""
+from kivy.graphics import Color, Rectangle, InstructionGroup
+
+import config
+
+class PlayRenderer:
+    def __init__(self, canvas, size=(config.WIDTH, config.HEIGHT)):
+        self.canvas = canvas
+        self.allocated = 0
+
+        # 静的レイヤー（1回だけ作る）
+        self.static = InstructionGroup()
+        self._add(self.static, Color(0.05, 0.06, 0.10, 1.0))
+        self._add(self.static, Rectangle(pos=(0, 0), size=size))
+        self._add(self.static, Color(0.18, 0.20, 0.30, 1.0))
+        for i in range(config.LANES):
+            x = config.lane_x(i) - 2
+            self._add(self.static, Rectangle(pos=(x, 0), size=(4, config.HEIGHT)))
+        self._add(self.static, Color(0.12, 0.14, 0.22, 1.0))
+        self._add(self.static, Rectangle(pos=(0, 0), size=(config.WIDTH, config.PLAYER_GROUND_Y - 8)))
+
+        # プレイヤー
+        self.player_layer = InstructionGroup()
+        self.player_color = self._add(self.player_layer, Color(0.90, 0.95, 1.0, 1.0))
+        self.player_rect = self._add(self.player_layer, Rectangle(pos=(0, 0), size=(config.PLAYER_W, config.PLAYER_H)))
+
+        # 障害物（Color は共通、Rectangle はプール）
+        self.obstacle_layer = InstructionGroup()
+        self._add(self.obstacle_layer, Color(0.95, 0.35, 0.45, 1.0))
+        self._active = []   # obstacle_layer に入っている Rectangle
+        self._free = []     # 使っていない Rectangle
+
+        canvas.add(self.static)
+        canvas.add(self.player_layer)
+        canvas.add(self.obstacle_layer)
+
+    def _add(self, group, instr):
+        group.add(instr)
+        self.allocated += 1
+        return instr
+
+    def _grow(self, n: int):
+        while len(self._active) < n:
+            if self._free:
+                r = self._free.pop()
+            else:
+                r = Rectangle()
+                self.allocated += 1
+            self.obstacle_layer.add(r)
+            self._active.append(r)
+
+    def _shrink(self, n: int):
+        while len(self._active) > n:
+            r = self._active.pop()
+            self.obstacle_layer.remove(r)
+            self._free.append(r)
+
+    def sync(self, world, alpha: float = 1.0):
+        """World の状態を既存の描画命令へ書き写す。"""
+        p = world.player
+        self.player_color.a = 0.4 if world.is_invincible() else 1.0
+        y = world.prev_y + (p.y - world.prev_y) * alpha
+        self.player_rect.pos = (p.x - p.w/2, y - p.h/2)
+        self.player_rect.size = (p.w, p.h)
+
+        obstacles = world.obstacles
+        n = len(obstacles)
+        if n > len(self._active):
+            self._grow(n)
+        elif n < len(self._active):
+            self._shrink(n)
+        # 障害物は等速で下がるので、1ステップ前の位置 = y + speed*dt
+        back = world.speed * world.dt * (1.0 - alpha)
+        if world.vectorized:
+            for r, (x, y, w, h) in zip(self._active, obstacles.boxes()):
+                r.pos = (x, y + back)
+                r.size = (w, h)
+        else:
+            for r, o in zip(self._active, obstacles):
+                r.pos = (o.x - o.w/2, o.y - o.h/2 + back)
+                r.size = (o.w, o.h)
+
+    def clear(self):
+        self.canvas.remove(self.static)
+        self.canvas.remove(self.player_layer)
+        self.canvas.remove(self.obstacle_layer)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+アセットパック：asset/ の素材を1つのファイル（assets.fpk）にまとめて配る
+目的：
+- 配布物の中のばらばらのファイル（wav の原盤・png・ogg…）を1つにして小さくする
+- 起動時に何百回もファイルを開く代わりに、パックを1回 mmap するだけにする
+- 同じ中身のファイルは1回だけ入れる（中身のハッシュで重複をまとめる）
+
+ファイルの形（リトルエンディアン）：
+    0   : MAGIC(8) + 索引の長さ(u32) + 予約(u32)
+    16  : 索引（UTF-8 の JSON。名前 → hash, offset, length, size, codec, ext, kind）
+    ... : 中身（索引のあとの 16 バイト境界から。offset はそこからの位置で、これも 16 バイト境界）
+codec：
+    raw  : そのまま（png・ogg・mp4 など、もともと圧縮されているもの）
+    zlib : zlib で縮めたもの（縮んだときだけ）
+ext は「入っている中身」の拡張子（wav を ogg に変換して入れたら .ogg）。
+
+作り方（リポジトリ直下で）：
+    python -m tools.pack_assets          # asset/ → assets.fpk
+
+使い方（例）：
+    pack = asset_pack()                  # assets.fpk が無ければ None
+    pack.view("fugu.png")                # mmap の一部をそのまま見る memoryview（コピーなし）
+    pack.texture("fugu.png")             # Kivy の Texture（デコーダに渡すときに1回コピーする）
+    SoundLoader.load(pack.extract("bgm.ogg"))   # ファイル名が要るもの（音・動画・フォント）は
+                                                # 一度だけキャッシュに書き出してそのパスを返す
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from typing import Dict, Iterable, Optional, Tuple
+
+from utils.paths import REPO_ROOT
+
+MAGIC = b"FUGUPAK1"
+HEADER = struct.Struct("<8sII")
+ALIGN = 16
+PACK_NAME = "assets.fpk"
+# 書き出し先（既定は一時フォルダ）。中身のハッシュで名前を付けるので、作り直しても混ざらない
+CACHE_ENV = "FUGU_PACK_CACHE"
+
+
+@dataclass(frozen=True, slots=True)
+class PackEntry:
+    hash: str       # 中身（圧縮前）の blake2b
+    offset: int
+    length: int     # パックの中での長さ（圧縮後）
+    size: int       # 元の長さ（圧縮前）
+    codec: str      # "raw" / "zlib"
+    ext: str        # 中身の拡張子（".png" など）
+    kind: str       # utils/paths.py の KINDS と同じ分類
+
+
+def content_hash(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _pad(n: int) -> int:
+    return -n % ALIGN
+
+
+# ------------------------------------------
+# 書き込み（tools/pack_assets.py から使う）
+# ------------------------------------------
+def write_pack(path, items: Iterable[Tuple[str, bytes, str, str]], level: int = 9,
+               min_saving: float = 0.1) -> Dict[str, PackEntry]:
+    """
+    items: (名前, 中身, 中身の拡張子, 種類)。
+    zlib で min_saving 以上縮むときだけ zlib にする。同じ中身は1回だけ書く。
+    """
+    blobs = []                      # (hash, 書く中身, codec, 元の長さ)
+    by_hash: Dict[str, int] = {}
+    names = []
+    for name, data, ext, kind in items:
+        h = content_hash(data)
+        if h not in by_hash:
+            packed = zlib.compress(data, level)
+            if len(packed) <= len(data) * (1.0 - min_saving):
+                blobs.append((h, packed, "zlib", len(data)))
+            else:
+                blobs.append((h, data, "raw", len(data)))
+            by_hash[h] = len(blobs) - 1
+        names.append((name, h, ext, kind))
+
+    offsets, pos = {}, 0
+    for h, data, _, _ in blobs:
+        offsets[h] = pos
+        pos += len(data) + _pad(len(data))
+    entries = {}
+    for name, h, ext, kind in names:
+        _, data, codec, size = blobs[by_hash[h]]
+        entries[name] = PackEntry(h, offsets[h], len(data), size, codec, ext, kind)
+    index = json.dumps({n: asdict(e) for n, e in entries.items()}, ensure_ascii=False).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(index), 0))
+        f.write(index)
+        f.write(b"\0" * _pad(HEADER.size + len(index)))
+        for _, data, _, _ in blobs:
+            f.write(data)
+            f.write(b"\0" * _pad(len(data)))
+    return entries
+
+
+# ------------------------------------------
+# 読み込み
+# ------------------------------------------
+class AssetPack:
+    def __init__(self, path, cache_dir: Optional[str] = None):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"アセットパックではありません: {self.path}")
+        index = json.loads(self._mm[HEADER.size:HEADER.size + n].decode("utf-8"))
+        self.entries: Dict[str, PackEntry] = {name: PackEntry(**e) for name, e in index.items()}
+        self.base = HEADER.size + n + _pad(HEADER.size + n)
+        self.cache_dir = cache_dir or os.environ.get(CACHE_ENV) or os.path.join(tempfile.gettempdir(), "fugu_pack")
+        self._extracted: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def entry(self, name: str) -> PackEntry:
+        return self.entries[name]
+
+    def view(self, name: str) -> memoryview:
+        """パックの中の生のバイト列（圧縮されていれば圧縮されたまま）。mmap をそのまま見る。"""
+        e = self.entries[name]
+        start = self.base + e.offset
+        return memoryview(self._mm)[start:start + e.length]
+
+    def data(self, name: str):
+        """中身。raw ならコピーなしの memoryview、zlib なら展開した bytes。"""
+        e = self.entries[name]
+        v = self.view(name)
+        return zlib.decompress(v) if e.codec == "zlib" else v
+
+    # --- Kivy 向け ---
+    def image_loader(self, name: str, keep_data: bool = False):
+        """
+        画像をデコードする（ワーカースレッドから呼んでよい。テクスチャはまだ作らない）。
+        Kivy の ImageLoader は BytesIO しか受け取らないので、中身はここで1回コピーされる。
+        """
+        from kivy.core.image import ImageLoader
+        e = self.entries[name]
+        fake = os.path.splitext(name)[0] + e.ext
+        return ImageLoader.load(fake, rawdata=BytesIO(self.data(name)), inline=True,
+                                ext=e.ext.lstrip("."), keep_data=keep_data)
+
+    def texture(self, name: str):
+        return self.image_loader(name).texture
+
+    def extract(self, name: str) -> str:
+        """ファイル名が必要な読み込み（音・動画・フォント）用。キャッシュに1回だけ書き出す。"""
+        path = self._extracted.get(name)
+        if path is not None:
+            return path
+        e = self.entries[name]
+        path = os.path.join(self.cache_dir, e.hash + e.ext)
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(self.data(name))
+            os.replace(tmp, path)
+        self._extracted[name] = path
+        return path
+
+
+_pack: Optional[AssetPack] = None
+_pack_opened = False
+
+
+def asset_pack() -> Optional[AssetPack]:
+    """REPO_ROOT の assets.fpk（最初の1回だけ開く）。無ければ None。"""
+    global _pack, _pack_opened
+    if not _pack_opened:
+        _pack_opened = True
+        try:
+            _pack = AssetPack(REPO_ROOT / PACK_NAME)
+        except FileNotFoundError:
+            _pack = None
+    return _pack
+
+
+def packed_path(name: str) -> Optional[str]:
+    """パックに入っていれば書き出したパス、無ければ None。"""
+    pack = asset_pack()
+    return pack.extract(name) if pack is not None and name in pack else None
+
+
+def packed_image(name: str, keep_data: bool = True):
+    """パックに入っていればデコード済みの画像（ImageLoader の結果）、無ければ None。"""
+    pack = asset_pack()
+    return pack.image_loader(name, keep_data=keep_data) if pack is not None and name in pack else None
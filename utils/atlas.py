@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+スプライトを1枚のテクスチャ（Kivy .atlas）にまとめるユーティリティ
+目的：
+- fugu.png / bom.png / block.png ... を別々のテクスチャで読むのをやめる
+  （起動時のファイルオープンとテクスチャ切り替えを減らす）
+- まとめた1枚から切り出して描けるので、あとでバッチ描画もできる
+
+作り方（オフライン・1回だけ。Pillow が必要）：
+    python -m utils.atlas            # asset/ → assets/sprites.atlas + sprites-0.png
+
+使い方（例）：
+    from utils.atlas import sprite_source
+    Image(source=sprite_source("fugu.png") or get_path("fugu.png"))
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.paths import ASSETS_DIR, REPO_ROOT
+
+# 元画像の置き場所と、まとめる対象
+SPRITE_DIR: Path = REPO_ROOT / "asset"
+SPRITES = (
+    "fugu.png", "bom.png", "block.png", "boss.png", "hammer.png", "Kirimi.png",
+    "stage1_bg.png", "stage2_bg.png", "stage3_bg.png",
+)
+
+# 出力（拡張子なし。Kivy の atlas:// はこの形で指定する）
+ATLAS_BASE: Path = ASSETS_DIR / "sprites"
+ATLAS_FILE: Path = ATLAS_BASE.with_suffix(".atlas")
+ATLAS_SIZE = 2048
+
+
+def sprite_id(filename: str) -> str:
+    """"fugu.png" → "fugu"（atlas 内の名前）"""
+    return Path(filename).stem
+
+
+def build_atlas(src_dir: Path = SPRITE_DIR, out_base: Path = ATLAS_BASE,
+                size: int = ATLAS_SIZE, padding: int = 2):
+    """
+    src_dir の SPRITES を1枚（入りきらなければ複数枚）にまとめる。
+    戻り値は Kivy の Atlas.create と同じ (atlas ファイル名, 中身の辞書)。
+    """
+    from kivy.atlas import Atlas
+
+    files = [str(src_dir / name) for name in SPRITES if (src_dir / name).exists()]
+    if not files:
+        raise FileNotFoundError(f"スプライトが見つかりません: {src_dir}")
+    out_base.parent.mkdir(parents=True, exist_ok=True)
+    res = Atlas.create(str(out_base), files, size, padding=padding)
+    if not res:
+        raise ValueError(f"{size}x{size} に入りきりません。size を大きくしてください。")
+    return res
+
+
+_ids: Optional[Dict[str, str]] = None
+_atlas = None
+
+
+def _load_ids() -> Dict[str, str]:
+    """atlas ファイルの JSON だけ読んで、入っている名前を覚える（テクスチャは読まない）"""
+    global _ids
+    if _ids is None:
+        _ids = {}
+        if ATLAS_FILE.exists():
+            with open(ATLAS_FILE, encoding="utf-8") as f:
+                for page in json.load(f).values():
+                    for sid in page:
+                        _ids[sid] = f"atlas://{ATLAS_BASE.as_posix()}/{sid}"
+    return _ids
+
+
+def sprite_source(filename: str) -> Optional[str]:
+    """
+    Image(source=...) に渡せる atlas:// の URI を返す。
+    atlas が無い / 入っていない場合は None（呼ぶ側で通常のパスにフォールバック）。
+    """
+    return _load_ids().get(sprite_id(filename))
+
+
+def sprite_texture(filename: str):
+    """
+    atlas から切り出したテクスチャ（領域）を返す。無ければ None。
+    Rectangle(texture=...) やバッチ描画用。
+    """
+    global _atlas
+    if sprite_source(filename) is None:
+        return None
+    if _atlas is None:
+        from kivy.atlas import Atlas
+        _atlas = Atlas(str(ATLAS_FILE))
+    return _atlas[sprite_id(filename)]
+
+
+if __name__ == "__main__":
+    outfn, meta = build_atlas()
+    print(outfn)
+    for page, sprites in meta.items():
+        print(f"  {page}: {', '.join(sorted(sprites))}")
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+ステージ背景マネージャ：背景の切り替えを「テクスチャの差し替え」だけで行う
+目的：
+- ステージ画像は最初に全部テクスチャにしておき（常駐）、途中でファイルを読まない
+- 切り替え時に Image / Video ウィジェットを作らない
+- fade > 0 なら、次の背景を上に重ねて透明度を上げていく（GPU 側のクロスフェード）
+
+使い方（例）：
+    bg = StageBackground(size=Window.size)
+    bg.add("stage1_bg.png", texture)      # 先読み済みテクスチャを登録
+    bg.show("stage1_bg.png")
+    bg.show("stage2_bg.png", fade=0.5)    # 0.5 秒でクロスフェード
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional
+
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
+from kivy.uix.widget import Widget
+
+
+class StageBackground(Widget):
+    def __init__(self, load: Optional[Callable[[str], object]] = None, **kwargs):
+        """load: 未登録の名前を頼まれたときにテクスチャを作る関数（1回だけ呼ばれる）"""
+        super().__init__(**kwargs)
+        self.load = load
+        self.textures: Dict[str, object] = {}
+        self.current: Optional[str] = None
+        self._fade_ev = None
+        self._fade_time = 0.0
+        self._fade_len = 0.0
+        self._next: Optional[str] = None
+
+        with self.canvas:
+            self.front_color = Color(1, 1, 1, 1)
+            self.front = Rectangle(pos=self.pos, size=self.size)
+            self.back_color = Color(1, 1, 1, 0)
+            self.back = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._layout, size=self._layout)
+
+    def _layout(self, *_):
+        self.front.pos = self.back.pos = self.pos
+        self.front.size = self.back.size = self.size
+
+    # --- 登録 ---
+    def add(self, name: str, texture):
+        if texture is not None:
+            self.textures[name] = texture
+
+    def _texture(self, name: str):
+        tex = self.textures.get(name)
+        if tex is None and self.load is not None:
+            tex = self.load(name)
+            self.add(name, tex)
+        return tex
+
+    # --- 切り替え ---
+    def show(self, name: str, fade: float = 0.0):
+        if name == self.current or name == self._next:
+            return
+        tex = self._texture(name)
+        if tex is None:
+            return
+        if fade <= 0.0 or self.current is None:
+            self._finish_fade()
+            self.front.texture = tex
+            self.current = name
+            return
+        # 途中のフェードは即完了させてから次を重ねる
+        self._finish_fade()
+        self.back.texture = tex
+        self.back_color.a = 0.0
+        self._next = name
+        self._fade_time, self._fade_len = 0.0, fade
+        self._fade_ev = Clock.schedule_interval(self._fade_step, 0)
+
+    def reset(self, name: str):
+        """フェード途中でも止めて name を即表示する（リトライ用）。"""
+        self._finish_fade()
+        self.show(name)
+
+    def _fade_step(self, dt):
+        self._fade_time += dt
+        a = min(1.0, self._fade_time / self._fade_len)
+        self.back_color.a = a
+        if a >= 1.0:
+            self._finish_fade()
+            return False
+
+    def _finish_fade(self):
+        if self._fade_ev is not None:
+            self._fade_ev.cancel()
+            self._fade_ev = None
+        if self._next is not None:
+            self.front.texture = self.back.texture
+            self.current = self._next
+            self._next = None
+        self.back_color.a = 0.0
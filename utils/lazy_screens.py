@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+LazyScreenManager: 画面を「初めて開くとき」に作る ScreenManager
+目的：
+- 起動時に全部の画面（設定・管理者パネル・ゲームオーバー…）を作らない
+  → その画面のためのモジュールの import も、ウィジェットの生成も、開くときまで遅らせる
+- register(name, factory) しておけば、current = name / get_screen(name) で自動的に作られる
+- has_screen(name) は「もう作ったか」を返す（register しただけでは False）
+
+使い方（例）：
+    sm = LazyScreenManager(transition=NoTransition())
+    sm.register("options", lambda name: import_module("scenes.fugu_menu").OptionScreen(name=name))
+    sm.current = "options"     # ここで初めて import して作る
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict
+
+from kivy.uix.screenmanager import Screen, ScreenManager
+
+
+class LazyScreenManager(ScreenManager):
+    def __init__(self, **kwargs):
+        self._factories: Dict[str, Callable[[str], Screen]] = {}
+        super().__init__(**kwargs)
+
+    def register(self, name: str, factory: Callable[[str], Screen]):
+        self._factories[name] = factory
+
+    def get_screen(self, name: str) -> Screen:
+        # current を変えたときも Kivy はここを通る
+        factory = self._factories.get(name)
+        if factory is not None and not self.has_screen(name):
+            self.add_widget(factory(name))
+        return super().get_screen(name)
@@ -5,15 +5,27 @@ Day6: パス矯正ユーティリティ
 - 実行場所（カレントディレクトリ）に依存せず、常に正しい assets / bgm を見つける
 - 「assets/...」の生文字列をコード中に散らさない
 
+- 素材の場所は起動時に1回だけ走査して目録（AssetManifest）にする
+  以後の resolve_asset は辞書を引くだけ（ファイルごとの exists/stat をしない）
+- PyInstaller 版は同梱の asset_manifest.json を読むだけ（フォルダを走査しない）
+  作り方：python -m tools.asset_manifest
+
 使い方（例）：
-    from utils.paths import sanity_check, asset_path, repo_path
+    from utils.paths import sanity_check, asset_path, repo_path, resolve_asset
     sanity_check()
     Image(source=asset_path("neon_banner.png"))
     SoundLoader.load(repo_path("bgm.ogg"))
+    resolve_asset("bom.png")        # assets/ → 直下 → asset/ の順。無ければ None
 """
 
 from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Dict, Iterable, Optional
 
 
 def _find_repo_root(start: Path) -> Path:
@@ -36,8 +48,9 @@ def _find_repo_root(start: Path) -> Path:
     return start.parent
 
 
-# repo_root/utils/paths.py を想定
-REPO_ROOT: Path = _find_repo_root(Path(__file__).resolve())
+# repo_root/utils/paths.py を想定（PyInstaller 版は展開先をそのまま使い、上に辿らない）
+FROZEN: bool = bool(getattr(sys, "frozen", False))
+REPO_ROOT: Path = Path(sys._MEIPASS) if FROZEN else _find_repo_root(Path(__file__).resolve())
 ASSETS_DIR: Path = REPO_ROOT / "assets"
 BGM_PATH: Path = REPO_ROOT / "bgm.ogg"
 
@@ -88,3 +101,124 @@ def sanity_check(require_bgm: bool = True) -> None:
             f"BGM_PATH={BGM_PATH}\n"
             "ヒント：音素材の置き場所を Day6 で『repo直下』に統一します。"
         )
+
+
+# ------------------------------------------
+# 素材の目録
+# ------------------------------------------
+MANIFEST_NAME = "asset_manifest.json"
+# 探す順（hugu.py の get_path と同じ assets/ → 直下、最後に asset/）。"" はリポジトリ直下
+ASSET_DIRS = ("assets", "", "asset")
+
+KINDS = {
+    ".png": "image", ".jpg": "image", ".jpeg": "image",
+    ".atlas": "atlas",
+    ".ogg": "sound", ".wav": "sound", ".mp3": "sound",
+    ".mp4": "video",
+    ".ttf": "font", ".otf": "font",
+    ".fpk": "pack",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class AssetEntry:
+    path: str       # REPO_ROOT からの相対パス（/ 区切り）
+    size: int
+    mtime: float
+    kind: str
+
+
+def _kind(name: str) -> str:
+    return KINDS.get(os.path.splitext(name)[1].lower(), "other")
+
+
+class AssetManifest:
+    """素材名（"bom.png" や "sprites/x.png"）→ AssetEntry。解決したパスは覚えておく。"""
+
+    def __init__(self, root: Path, entries: Dict[str, AssetEntry]):
+        self.root = root
+        self.entries = entries
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def scan(cls, root: Path = REPO_ROOT, dirs: Iterable[str] = ASSET_DIRS) -> "AssetManifest":
+        """
+        dirs を1回ずつ走査する。先に見つかった名前が優先。
+        直下（""）はサブフォルダを見ず、KINDS の拡張子のファイルだけ拾う。
+        """
+        entries: Dict[str, AssetEntry] = {}
+        for d in dirs:
+            base = os.path.join(root, d) if d else str(root)
+            if not os.path.isdir(base):
+                continue
+            if d:
+                walk = os.walk(base)
+            else:
+                walk = [(base, [], [e.name for e in os.scandir(base)
+                                    if e.is_file() and os.path.splitext(e.name)[1].lower() in KINDS])]
+            for dirpath, _, files in walk:
+                for fn in files:
+                    full = os.path.join(dirpath, fn)
+                    name = os.path.relpath(full, base).replace(os.sep, "/")
+                    if name in entries:
+                        continue
+                    st = os.stat(full)
+                    rel = os.path.relpath(full, root).replace(os.sep, "/")
+                    entries[name] = AssetEntry(rel, st.st_size, st.st_mtime, _kind(fn))
+        return cls(root, entries)
+
+    @classmethod
+    def load(cls, path, root: Path = REPO_ROOT) -> "AssetManifest":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(root, {name: AssetEntry(**e) for name, e in data["assets"].items()})
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(version=1, assets={n: asdict(e) for n, e in self.entries.items()}),
+                      f, ensure_ascii=False, indent=1)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name.replace("\\", "/") in self.entries
+
+    def entry(self, name: str) -> Optional[AssetEntry]:
+        return self.entries.get(name.replace("\\", "/"))
+
+    def resolve(self, name: str) -> Optional[str]:
+        """絶対パス（str）。目録に無ければ None。"""
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+        e = self.entry(name)
+        path = None if e is None else os.path.join(self.root, e.path)
+        self._resolved[name] = path
+        return path
+
+
+_manifest: Optional[AssetManifest] = None
+
+
+def asset_manifest() -> AssetManifest:
+    """
+    目録を返す（最初の1回だけ作る）。
+    PyInstaller 版は同梱の asset_manifest.json を読む。無ければ（開発時も）走査する。
+    """
+    global _manifest
+    if _manifest is None:
+        if FROZEN:
+            try:
+                _manifest = AssetManifest.load(REPO_ROOT / MANIFEST_NAME)
+            except FileNotFoundError:
+                pass
+        if _manifest is None:
+            _manifest = AssetManifest.scan()
+    return _manifest
+
+
+def resolve_asset(name: str) -> Optional[str]:
+    """素材名 → 絶対パス（assets/ → 直下 → asset/ の順）。無ければ None。"""
+    return asset_manifest().resolve(name)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+アセットの先読み（プリロード）：タイトル画面のうちに画像と音を準備しておく
+目的：
+- ゲーム開始時やステージ切り替え時に PNG のデコードで固まらないようにする
+- 画像のデコードと音のファイル読み（ディスクから OS のキャッシュへ）は別スレッド（ワーカー）で行う
+- テクスチャ（GPU への転送）と Sound の生成はメインスレッドで、1フレームに少しずつ行う
+  （Kivy の音声プロバイダ、とくに gstreamer はスレッドセーフではない）
+
+使い方（例）：
+    pre = Preloader(images=["stage1_bg.png"], sounds=["bgm.ogg"], resolve=get_path,
+                    on_progress=lambda done, total: ..., on_ready=lambda: ...)
+    pre.start()
+    ...
+    pre.texture("stage1_bg.png")   # 準備できていれば Texture、まだなら None
+    pre.sound("bgm.ogg")
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+from kivy.clock import Clock
+
+
+class Preloader:
+    def __init__(self, images: Iterable[str] = (), sounds: Iterable[str] = (),
+                 resolve: Callable[[str], Optional[str]] = lambda name: name,
+                 open_image: Optional[Callable[[str], object]] = None,
+                 tasks: Iterable[Callable[[], None]] = (),
+                 main_tasks: Iterable[Callable[[], None]] = (),
+                 on_progress: Optional[Callable[[int, int], None]] = None,
+                 on_ready: Optional[Callable[[], None]] = None,
+                 uploads_per_frame: int = 1):
+        """
+        images / sounds: ファイル名のリスト（resolve でパスにする）
+        open_image: パスを経由せずに画像をデコードする関数（アセットパックなど）。None を返したら resolve で読む
+        tasks: ワーカーで一緒に実行したい処理（Kivy のオブジェクトを作らないもの）
+        main_tasks: メインスレッドで1フレームに1つずつ実行する処理（効果音バンクの preload など）
+        on_progress(done, total) / on_ready() はメインスレッドで呼ばれる
+        """
+        self.images = list(images)
+        self.sounds_to_load = list(sounds)
+        self.tasks = list(tasks)
+        self.main_tasks = deque(main_tasks)
+        self.resolve = resolve
+        self.open_image = open_image
+        self.on_progress = on_progress
+        self.on_ready = on_ready
+        self.uploads_per_frame = max(1, uploads_per_frame)
+
+        self.textures: Dict[str, object] = {}
+        self.sounds: Dict[str, object] = {}
+        # 画像と音は「ワーカー」と「メインスレッド」の2段階なので2回数える
+        self.total = (2 * len(self.images) + 2 * len(self.sounds_to_load) + len(self.tasks)
+                      + len(self.main_tasks))
+        self.done = 0
+        self.ready = threading.Event()
+
+        self._decoded = deque()       # ワーカー → メインスレッドへ渡す (name, loader)
+        self._sound_paths = deque()   # ワーカー → メインスレッドへ渡す (name, path)
+        self._lock = threading.Lock()
+        self._worker_done = False
+        self._thread: Optional[threading.Thread] = None
+        self._upload_ev = None
+
+    # --- 開始 ---
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._work, name="preloader", daemon=True)
+        self._thread.start()
+        self._upload_ev = Clock.schedule_interval(self._upload, 0)
+
+    # --- ワーカー ---
+    def _work(self):
+        from kivy.core.image import ImageLoader
+
+        for name in self.images:
+            loader = None
+            try:
+                if self.open_image is not None:
+                    loader = self.open_image(name)
+                if loader is None:
+                    path = self.resolve(name)
+                    # keep_data=True: テクスチャはまだ作らず、デコード結果だけ持つ
+                    loader = ImageLoader.load(path, keep_data=True) if path else None
+            except Exception:
+                loader = None
+            self._decoded.append((name, loader))
+            self._advance()
+
+        for name in self.sounds_to_load:
+            path = self.resolve(name)
+            if path:
+                try:
+                    # 中身を1回読んでおく（メインスレッドの SoundLoader.load がディスクを待たない）
+                    with open(path, "rb") as f:
+                        while f.read(1 << 20):
+                            pass
+                except OSError:
+                    path = None
+            self._sound_paths.append((name, path))
+            self._advance()
+
+        for task in self.tasks:
+            try:
+                task()
+            except Exception:
+                pass
+            self._advance()
+
+        self._worker_done = True
+
+    def _advance(self):
+        with self._lock:
+            self.done += 1
+
+    # --- メインスレッド ---
+    def _upload(self, dt):
+        for _ in range(self.uploads_per_frame):
+            if self._decoded:
+                name, loader = self._decoded.popleft()
+                if loader is not None:
+                    self.textures[name] = loader.texture   # ここで GPU に転送
+            elif self._sound_paths:
+                from kivy.core.audio import SoundLoader
+                name, path = self._sound_paths.popleft()
+                snd = SoundLoader.load(path) if path else None
+                if snd:
+                    self.sounds[name] = snd
+            elif self.main_tasks:
+                try:
+                    self.main_tasks.popleft()()
+                except Exception:
+                    pass
+            else:
+                break
+            self._advance()
+
+        if self.on_progress:
+            self.on_progress(self.done, self.total)
+
+        if self._worker_done and not self._decoded and not self._sound_paths and not self.main_tasks:
+            self.ready.set()
+            if self.on_ready:
+                self.on_ready()
+            return False
+
+    # --- 取り出し ---
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    def texture(self, name: str):
+        return self.textures.get(name)
+
+    def sound(self, name: str):
+        return self.sounds.get(name)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+フレームプロファイラ：1フレームの中で「どこに何ms使ったか」を記録する
+目的：
+- 外部プロファイラ無しで、カクつきの原因（物理？生成？当たり判定？描画？HUD？）を探す
+- 直近 N フレームだけをリングバッファに持つ（メモリは増えない）
+
+使い方（例）：
+    prof = FrameProfiler()
+    prof.begin_frame()
+    ... ; prof.lap("step")
+    ... ; prof.lap("draw")
+    prof.end_frame()
+    prof.percentiles()      # → (p50, p95, p99) [ms]
+    prof.dump_csv("profile.csv")
+"""
+
+from __future__ import annotations
+
+import csv
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SECTIONS = ("step", "spawn", "collision", "draw", "hud")
+_SPARK = "▁▂▃▄▅▆▇█"
+
+
+class FrameProfiler:
+    def __init__(self, capacity: int = 600, sections: Sequence[str] = SECTIONS):
+        self.capacity = capacity
+        self.sections = tuple(sections)
+        self._col: Dict[str, int] = {s: i for i, s in enumerate(self.sections)}
+        # 各行 = [section..., total]（ms）。最初に全部作っておき、書き換えて使う
+        self._rows: List[List[float]] = [[0.0] * (len(self.sections) + 1) for _ in range(capacity)]
+        self._i = 0          # 次に書く行
+        self.count = 0       # 記録済みフレーム数（capacity で頭打ち）
+        self._row = self._rows[0]
+        self._t0 = 0.0
+        self._last = 0.0
+        self.enabled = True
+
+    # --- 計測 ---
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        row = self._rows[self._i]
+        for k in range(len(row)):
+            row[k] = 0.0
+        self._row = row
+        self._t0 = self._last = perf_counter()
+
+    def lap(self, section: str):
+        """前回の lap（または begin_frame）から今までを section に足す。"""
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self._row[self._col[section]] += (now - self._last) * 1000.0
+        self._last = now
+
+    def skip(self):
+        """計測しない区間（lap の区切りだけ進める）。"""
+        if self.enabled:
+            self._last = perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self._row[-1] = (perf_counter() - self._t0) * 1000.0
+        self._i = (self._i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    # --- 集計 ---
+    def frames(self) -> List[List[float]]:
+        """古い順に並べた記録。"""
+        if self.count < self.capacity:
+            return self._rows[:self.count]
+        return self._rows[self._i:] + self._rows[:self._i]
+
+    def column(self, section: Optional[str] = None) -> List[float]:
+        k = -1 if section is None else self._col[section]
+        return [r[k] for r in self.frames()]
+
+    def percentiles(self, section: Optional[str] = None) -> Tuple[float, float, float]:
+        vals = sorted(self.column(section))
+        if not vals:
+            return (0.0, 0.0, 0.0)
+        last = len(vals) - 1
+        return tuple(vals[min(last, int(p * len(vals)))] for p in (0.50, 0.95, 0.99))
+
+    def sparkline(self, width: int = 40, section: Optional[str] = None) -> str:
+        vals = self.column(section)[-width:]
+        if not vals:
+            return ""
+        hi = max(vals) or 1.0
+        n = len(_SPARK) - 1
+        return "".join(_SPARK[min(n, int(v / hi * n))] for v in vals)
+
+    def summary(self) -> str:
+        p50, p95, p99 = self.percentiles()
+        parts = []
+        for s in self.sections:
+            parts.append(f"{s}={self.percentiles(s)[0]:.2f}")
+        return (f"frame ms p50={p50:.2f} p95={p95:.2f} p99={p99:.2f}\n"
+                f"{'  '.join(parts)}\n"
+                f"{self.sparkline()}")
+
+    def dump_csv(self, path: str) -> str:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["frame", *self.sections, "total"])
+            for i, row in enumerate(self.frames()):
+                w.writerow([i, *(f"{v:.4f}" for v in row)])
+        return path
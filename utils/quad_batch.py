@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+QuadBatch: 同じテクスチャの四角形（弾など）を1つの Mesh でまとめて描く
+目的：
+- 弾1個 = Image ウィジェット1個、をやめる（ウィジェットの生成・プロパティ更新・描画命令が弾の数だけ要る）
+- 頂点は NumPy の配列に書き込み、Mesh にそのまま渡す → 何個あっても描画命令は1つ
+- テクスチャ座標は texture.tex_coords を使う（アトラスの一部でも、上下反転したテクスチャでもそのまま使える）
+
+使い方（例）：
+    batch = QuadBatch(widget.canvas.after, texture)
+    batch.update(xs, ys, 80, 80)     # xs, ys: 左下座標の配列
+    batch.update(xs, ys, sizes, sizes, angles)   # 大きさ・角度（度）も配列で渡せる
+    batch.update_rects([(o.x, o.y, o.w, o.h) for o in obstacles])   # 状態オブジェクトの並びから
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from kivy.graphics import Color, Mesh
+
+MAX_QUADS = 65536 // 4 - 1     # indices は 16bit なので頂点は 65535 個まで
+_CORNERS = np.array([0, 1, 2, 2, 3, 0], dtype=np.uint16)
+
+
+class QuadBatch:
+    def __init__(self, canvas, texture, capacity: int = 64, color=(1, 1, 1, 1)):
+        self.texture = texture
+        self.count = 0
+        self._alloc(min(max(1, capacity), MAX_QUADS))
+        with canvas:
+            self.color = Color(*color)
+            self.mesh = Mesh(mode="triangles", texture=texture)
+
+    def _alloc(self, cap: int):
+        self.capacity = cap
+        # 1頂点 = (x, y, u, v)。並びは Rectangle と同じ 左下→右下→右上→左上
+        self.verts = np.zeros((cap * 4, 4), dtype=np.float32)
+        uv = np.array(self.texture.tex_coords if self.texture else (0, 0, 1, 0, 1, 1, 0, 1),
+                      dtype=np.float32).reshape(4, 2)
+        self.verts[:, 2:] = np.tile(uv, (cap, 1))
+        self.indices = (np.arange(cap, dtype=np.uint16)[:, None] * 4 + _CORNERS).ravel()
+
+    def update(self, xs, ys, w, h, angles=None):
+        """w, h はスカラーか配列。angles（度）を渡すと各四角形を中心で回す。"""
+        n = min(len(xs), MAX_QUADS)
+        if n > self.capacity:
+            self._alloc(min(max(n, self.capacity * 2), MAX_QUADS))
+        v = self.verts[:n * 4].reshape(n, 4, 4)
+        xs, ys = xs[:n], ys[:n]
+        w = w[:n] if np.ndim(w) else w
+        h = h[:n] if np.ndim(h) else h
+        if angles is None:
+            v[:, 0, 0] = v[:, 3, 0] = xs
+            v[:, 1, 0] = v[:, 2, 0] = xs + w
+            v[:, 0, 1] = v[:, 1, 1] = ys
+            v[:, 2, 1] = v[:, 3, 1] = ys + h
+        else:
+            hw, hh = np.multiply(w, 0.5), np.multiply(h, 0.5)
+            cx, cy = xs + hw, ys + hh
+            rad = np.radians(angles[:n])
+            c, s = np.cos(rad), np.sin(rad)
+            for k, (sx, sy) in enumerate(((-1, -1), (1, -1), (1, 1), (-1, 1))):
+                ox, oy = sx * hw, sy * hh
+                v[:, k, 0] = cx + ox * c - oy * s
+                v[:, k, 1] = cy + ox * s + oy * c
+        # 連続した float32 / uint16 の配列はコピーなしで Mesh に渡せる
+        self.mesh.vertices = self.verts[:n * 4].reshape(-1)
+        self.mesh.indices = self.indices[:n * 6]
+        self.count = n
+
+    def update_rects(self, rects):
+        """(x, y, w, h) の並びから描く（配列を持っていない呼び出し元用）。"""
+        a = np.array(rects, dtype=np.float32).reshape(-1, 4)
+        self.update(a[:, 0], a[:, 1], a[:, 2], a[:, 3])
+
+    def clear(self):
+        self.update(np.zeros(0), np.zeros(0), 0.0, 0.0)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+効果音バンク：効果音を毎回ディスクから読み直さない
+目的：
+- SoundLoader.load は鳴らすたびではなく、起動時（または初回）に1回だけ
+- 1つの音に数本の「ボイス」を用意して、連打しても前の音が途切れない
+- 読み込んだ音が増えすぎないよう、max_sounds で古いものから捨てる（LRU）
+
+使い方（例）：
+    from utils.sound import SoundBank
+    sfx = SoundBank(get_path, voices=3)
+    sfx.preload(["hit.ogg", "GB__.ogg"])
+    sfx.play("hit.ogg", volume=0.5)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional
+
+
+class SoundBank:
+    def __init__(self, resolve: Callable[[str], Optional[str]] = lambda name: name,
+                 voices: int = 2, max_sounds: Optional[int] = None, volume: float = 1.0):
+        """
+        resolve: ファイル名 → パス（get_path など）。None/空文字なら「無い音」扱い
+        voices: 1つの音を同時に何本まで重ねて鳴らせるか
+        max_sounds: 保持する音の種類の上限（None なら無制限）
+        """
+        self.resolve = resolve
+        self.voices = max(1, voices)
+        self.max_sounds = max_sounds
+        self.volume = volume
+        self._bank: "OrderedDict[str, List]" = OrderedDict()
+        self._next: dict = {}
+
+    def _load(self, name: str) -> List:
+        if name in self._bank:
+            self._bank.move_to_end(name)
+            return self._bank[name]
+
+        from kivy.core.audio import SoundLoader
+
+        path = self.resolve(name)
+        voices = []
+        if path:
+            for _ in range(self.voices):
+                snd = SoundLoader.load(path)
+                if not snd:
+                    break
+                voices.append(snd)
+        # 見つからなかった音も空リストで覚えておく（毎回ディスクを探さない）
+        self._bank[name] = voices
+        self._next[name] = 0
+        if self.max_sounds is not None:
+            while len(self._bank) > self.max_sounds:
+                old, snds = self._bank.popitem(last=False)
+                self._next.pop(old, None)
+                for s in snds:
+                    s.unload()
+        return voices
+
+    def preload(self, names: Iterable[str]):
+        for name in names:
+            self._load(name)
+
+    def get(self, name: str):
+        """1本目のボイスを返す（length を知りたい時など）。無ければ None。"""
+        voices = self._load(name)
+        return voices[0] if voices else None
+
+    def play(self, name: str, volume: Optional[float] = None):
+        """空いているボイスで鳴らす。全部鳴っていれば一番古いものを鳴らし直す。"""
+        # 音量 0 なら何もしない（鳴っている音を止めてしまわないよう、ボイスを選ぶ前に見る）
+        vol = self.volume if volume is None else volume
+        if vol <= 0.0:
+            return None
+        voices = self._load(name)
+        if not voices:
+            return None
+        snd = None
+        for v in voices:
+            if v.state != "play":
+                snd = v
+                break
+        if snd is None:
+            i = self._next[name]
+            self._next[name] = (i + 1) % len(voices)
+            snd = voices[i]
+            snd.stop()
+        try:
+            snd.volume = vol
+            snd.play()
+        except Exception:
+            return None
+        return snd
+
+    def stop_all(self):
+        for voices in self._bank.values():
+            for v in voices:
+                if v.state == "play":
+                    v.stop()
+
+    def unload(self):
+        self.stop_all()
+        for voices in self._bank.values():
+            for v in voices:
+                v.unload()
+        self._bank.clear()
+        self._next.clear()
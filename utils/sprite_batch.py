@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+SpriteBatch: 1つのレイヤーの動くもの（障害物・ブロックなど）を Mesh 1つでまとめて描く
+目的：
+- 障害物1個 = Image ウィジェット1個（キャンバス・プロパティ・ツリー走査つき）をやめる
+- 毎フレーム、スプライトを float の配列（x, y, w, h, 角度, 領域, 色）に書き込み、
+  そこから頂点を配列演算で作り直して Mesh に渡す → 何個あっても描画命令は1つ
+- 絵柄は atlas（utils/atlas.py）の領域で選ぶ。同じページの領域なら1つのバッチに混ぜられる
+- 色（tint）はスプライトごと。頂点に色を持たせ、小さなシェーダーで掛ける
+QuadBatch（utils/quad_batch.py）は「1テクスチャ・1色」の簡易版。
+
+使い方（例）：
+    batch = SpriteBatch(widget.canvas, {"bom": bom_tex, "block": block_tex})
+    batch.begin()
+    batch.draw("bom", x, y, 100, 100)
+    batch.draw("block", x, y, 250, 50, tint=(1, 0.5, 0.5, 1), angle=15)
+    batch.draw_many("bom", xs, ys, 80, 80, angles=angles)   # 配列でまとめて
+    batch.end()                                             # ここで Mesh を更新
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+from kivy.graphics import Mesh, RenderContext
+
+from utils.quad_batch import MAX_QUADS
+
+# スプライト配列の列
+X, Y, W, H, ANGLE, REGION, R, G, B, A = range(10)
+SPRITE_FIELDS = 10
+
+# 1頂点 = 位置(2) + テクスチャ座標(2) + 色(4)
+VERTEX_FORMAT = [(b"vPosition", 2, "float"), (b"vTexCoords0", 2, "float"), (b"vTint", 4, "float")]
+_CORNERS = np.array([0, 1, 2, 2, 3, 0], dtype=np.uint16)
+_SIGNS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+
+_VS = """
+$HEADER$
+attribute vec4 vTint;
+void main(void) {
+    frag_color = vTint * color * vec4(1.0, 1.0, 1.0, opacity);
+    tex_coord0 = vTexCoords0;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition.xy, 0.0, 1.0);
+}
+"""
+_FS = """
+$HEADER$
+void main(void) {
+    gl_FragColor = frag_color * texture2D(texture0, tex_coord0);
+}
+"""
+
+
+def _page(texture):
+    # atlas の領域は親テクスチャと同じ GL テクスチャを指す
+    return None if texture is None else texture.id
+
+
+class SpriteBatch:
+    def __init__(self, canvas, regions: Optional[Dict[str, object]] = None, capacity: int = 64):
+        self.texture = None
+        self.regions: Dict[str, int] = {}
+        self.uvs = np.zeros((0, 4, 2), dtype=np.float32)
+        self.n = 0
+        self.count = 0
+        self._alloc(min(max(1, capacity), MAX_QUADS))
+        for name, tex in (regions or {}).items():
+            self.add_region(name, tex)
+
+        self.context = RenderContext(use_parent_projection=True, use_parent_modelview=True,
+                                     use_parent_frag_modelview=True)
+        self.context.shader.vs = _VS
+        self.context.shader.fs = _FS
+        with self.context:
+            self.mesh = Mesh(fmt=VERTEX_FORMAT, mode="triangles", texture=self.texture)
+        canvas.add(self.context)
+
+    def _alloc(self, cap: int):
+        old = getattr(self, "sprites", None)
+        self.capacity = cap
+        self.sprites = np.zeros((cap, SPRITE_FIELDS), dtype=np.float32)
+        if old is not None:
+            self.sprites[:self.n] = old[:self.n]
+        self.verts = np.zeros((cap * 4, 8), dtype=np.float32)
+        self.indices = (np.arange(cap, dtype=np.uint16)[:, None] * 4 + _CORNERS).ravel()
+
+    # --- 絵柄 ---
+    def add_region(self, name: str, texture):
+        """atlas の領域（または普通のテクスチャ）を登録する。違うテクスチャは混ぜられない。"""
+        if self.regions and _page(texture) != _page(self.texture):
+            raise ValueError(f"{name}: 同じテクスチャ（atlas の同じページ）の領域だけを1つのバッチに入れられます")
+        if not self.regions:
+            self.texture = texture
+            if getattr(self, "mesh", None) is not None:
+                self.mesh.texture = texture
+        uv = np.array(texture.tex_coords if texture is not None else (0, 0, 1, 0, 1, 1, 0, 1),
+                      dtype=np.float32).reshape(1, 4, 2)
+        self.regions[name] = len(self.uvs)
+        self.uvs = np.concatenate([self.uvs, uv])
+
+    def accepts(self, texture) -> bool:
+        return not self.regions or _page(texture) == _page(self.texture)
+
+    # --- 1フレーム分を書き込む ---
+    def begin(self):
+        self.n = 0
+
+    def _reserve(self, k: int) -> slice:
+        need = min(self.n + k, MAX_QUADS)
+        if need > self.capacity:
+            self._alloc(min(max(need, self.capacity * 2), MAX_QUADS))
+        s = slice(self.n, need)
+        self.n = need
+        return s
+
+    def draw(self, region: str, x: float, y: float, w: float, h: float, angle: float = 0.0, tint=None):
+        s = self._reserve(1)
+        if s.start == s.stop:
+            return
+        row = self.sprites[s.start]
+        row[X], row[Y], row[W], row[H], row[ANGLE] = x, y, w, h, angle
+        row[REGION] = self.regions[region]
+        row[R:A + 1] = tint if tint is not None else 1.0
+
+    def draw_many(self, region: str, xs, ys, w, h, angles=None, tints=None):
+        """xs, ys は配列。w, h, angles はスカラーか配列。tints は (n, 4) か色1つ。"""
+        s = self._reserve(len(xs))
+        k = s.stop - s.start
+        if k == 0:
+            return
+        rows = self.sprites[s]
+        rows[:, X], rows[:, Y] = xs[:k], ys[:k]
+        rows[:, W] = w[:k] if np.ndim(w) else w
+        rows[:, H] = h[:k] if np.ndim(h) else h
+        rows[:, ANGLE] = 0.0 if angles is None else (angles[:k] if np.ndim(angles) else angles)
+        rows[:, REGION] = self.regions[region]
+        rows[:, R:A + 1] = 1.0 if tints is None else (tints[:k] if np.ndim(tints) == 2 else tints)
+
+    def end(self):
+        """書き込んだスプライトから頂点を作り、Mesh を更新する。"""
+        n = self.n
+        s = self.sprites[:n]
+        v = self.verts[:n * 4].reshape(n, 4, 8)
+        hw, hh = s[:, W] * 0.5, s[:, H] * 0.5
+        ox, oy = _SIGNS[:, 0] * hw[:, None], _SIGNS[:, 1] * hh[:, None]   # (n, 4) 中心からのずれ
+        cx, cy = (s[:, X] + hw)[:, None], (s[:, Y] + hh)[:, None]
+        if s[:, ANGLE].any():
+            rad = np.radians(s[:, ANGLE])[:, None]
+            c, sn = np.cos(rad), np.sin(rad)
+            v[:, :, 0] = cx + ox * c - oy * sn
+            v[:, :, 1] = cy + ox * sn + oy * c
+        else:
+            v[:, :, 0] = cx + ox
+            v[:, :, 1] = cy + oy
+        v[:, :, 2:4] = self.uvs[s[:, REGION].astype(np.intp)]
+        v[:, :, 4:8] = s[:, None, R:A + 1]
+        self.mesh.vertices = self.verts[:n * 4].reshape(-1)
+        self.mesh.indices = self.indices[:n * 6]
+        self.count = n
+
+    def clear(self):
+        self.begin()
+        self.end()
+
+
+def sprite_layers(canvas, regions: Dict[str, object], capacity: int = 64) -> Dict[str, SpriteBatch]:
+    """
+    領域名 → SpriteBatch。同じテクスチャ（atlas の同じページ）の領域は1つのバッチにまとめる。
+    atlas が無く画像がばらばらのときは、テクスチャごとに1つずつ作る。
+    """
+    layers: Dict[str, SpriteBatch] = {}
+    batches = []
+    for name, tex in regions.items():
+        batch = next((b for b in batches if b.accepts(tex)), None)
+        if batch is None:
+            batch = SpriteBatch(canvas, capacity=capacity)
+            batches.append(batch)
+        batch.add_region(name, tex)
+        layers[name] = batch
+    return layers
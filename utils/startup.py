@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+起動時間の計測：import ごとの時間と、最初のフレームが出るまでの時間
+目的：
+- タイトル画面に要らないもの（ゲーム本体・設定画面・動画など）を最初のフレームの前に読まない
+- どの import に何秒かかったか・最初のフレームまで何秒かかったかを数字で見る
+
+使い方（例）：
+    from time import perf_counter
+    T0 = perf_counter()                      # エントリポイントの一番上
+    ...
+    STARTUP = StartupReport(T0)
+    with STARTUP.importing("kivy"):
+        from kivy.app import App ...
+    mod = STARTUP.load("scenes.fugu_menu")   # 初めて使うときの import（かかった時間も記録）
+    STARTUP.watch_first_frame()              # build() の中で
+    STARTUP.after_first_frame(start_video)   # 重い処理は最初のフレームのあと
+
+レポート：
+- 最初のフレームが出た時点で Logger に1行出す
+- 環境変数 FUGU_STARTUP_REPORT=1 なら終了時に表の形で表示、=xxx.json なら JSON で保存
+- 1モジュールずつ細かく見たいときは python -X importtime hugu.py 2> importtime.txt
+（計測の起点は T0。Python 本体や PyInstaller のブートローダの時間は含まない）
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+
+REPORT_ENV = "FUGU_STARTUP_REPORT"
+
+
+class StartupReport:
+    def __init__(self, t0: Optional[float] = None):
+        self.t0 = perf_counter() if t0 is None else t0
+        self.imports: List[Tuple[str, float, float]] = []    # (名前, 起点からの時刻, かかった秒)
+        self.marks: List[Tuple[str, float]] = []             # (名前, 起点からの時刻)
+        self.first_frame: Optional[float] = None
+        self._pending: List[Callable[[], None]] = []
+
+    # --- 計測 ---
+    def now(self) -> float:
+        return perf_counter() - self.t0
+
+    def mark(self, label: str):
+        self.marks.append((label, self.now()))
+
+    @contextmanager
+    def importing(self, label: str):
+        t = perf_counter()
+        try:
+            yield
+        finally:
+            self.imports.append((label, t - self.t0, perf_counter() - t))
+
+    def load(self, module: str):
+        """初めて使うときの import。2回目からは sys.modules から返すだけ（記録もしない）。"""
+        mod = sys.modules.get(module)
+        if mod is None:
+            with self.importing(module):
+                mod = importlib.import_module(module)
+        return mod
+
+    # --- 最初のフレーム ---
+    def watch_first_frame(self):
+        from kivy.core.window import Window
+        Window.bind(on_flip=self._on_flip)
+
+    def _on_flip(self, window):
+        window.unbind(on_flip=self._on_flip)
+        self.first_frame = self.now()
+        from kivy.logger import Logger
+        Logger.info(f"Startup: first frame {1000 * self.first_frame:.0f} ms")
+        pending, self._pending = self._pending, []
+        if pending:
+            from kivy.clock import Clock
+            Clock.schedule_once(lambda dt: [cb() for cb in pending], 0)
+
+    def after_first_frame(self, callback: Callable[[], None]):
+        """最初のフレームが出たあとで callback を呼ぶ（もう出ていれば次のフレームで）。"""
+        if self.first_frame is None:
+            self._pending.append(callback)
+        else:
+            from kivy.clock import Clock
+            Clock.schedule_once(lambda dt: callback(), 0)
+
+    # --- レポート ---
+    def report(self) -> dict:
+        return dict(
+            first_frame_ms=None if self.first_frame is None else 1000 * self.first_frame,
+            imports=[dict(name=n, at_ms=1000 * at, ms=1000 * dt,
+                          before_first_frame=self.first_frame is None or at < self.first_frame)
+                     for n, at, dt in self.imports],
+            marks=[dict(name=n, at_ms=1000 * at) for n, at in self.marks],
+        )
+
+    def format(self) -> str:
+        r = self.report()
+        lines = [f"{'import':<36} {'at ms':>8} {'ms':>8}"]
+        for i in r["imports"]:
+            flag = "" if i["before_first_frame"] else "  (lazy)"
+            lines.append(f"{i['name']:<36} {i['at_ms']:>8.1f} {i['ms']:>8.1f}{flag}")
+        for m in r["marks"]:
+            lines.append(f"{m['name']:<36} {m['at_ms']:>8.1f}")
+        ff = r["first_frame_ms"]
+        lines.append(f"{'first frame':<36} {'-' if ff is None else f'{ff:.1f}':>8}")
+        return "\n".join(lines)
+
+    def dump(self, target: Optional[str] = None):
+        """FUGU_STARTUP_REPORT（か target）が指定されていれば表示・保存する。"""
+        target = target or os.environ.get(REPORT_ENV)
+        if not target:
+            return
+        if target.endswith(".json"):
+            with open(target, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=1)
+        else:
+            print(self.format())
+
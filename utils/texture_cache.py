@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+テクスチャキャッシュ：PNG をデコードした結果（生の RGBA など）をディスクに置いておく
+目的：
+- 起動のたびに stage1_bg.png などの PNG をデコードしない（起動時間でいちばん大きい項目）
+- 2回目以降の起動は、キャッシュのファイルを mmap して、そのまま GPU に送る（デコードもコピーもなし）
+- キーは元ファイルの中身のハッシュ。画像を差し替えればハッシュが変わるので自然に作り直される
+  （同じ名前の古いキャッシュはそのとき消す）
+
+ファイルの形（1枚1ファイル、<名前>-<ハッシュ>.tex、リトルエンディアン）：
+    MAGIC(8) + 色の形式(8, "rgba" など) + 幅 + 高さ + 1行のバイト数 + フラグ(上下反転) (u32 x4)
+    そのあとにピクセル（Kivy の ImageData.data そのまま）
+
+使い方（例）：
+    cache = texture_cache()
+    img = cache.load("stage1_bg.png", content_hash(png_bytes), lambda: decode_image("stage1_bg.png", png_bytes))
+    img.texture      # キャッシュからなら mmap → blit_buffer、無ければデコードしてキャッシュに書く
+
+置き場所：環境変数 FUGU_TEXTURE_CACHE（無ければ一時フォルダの fugu_textures/）
+"""
+
+from __future__ import annotations
+
+import glob
+import mmap
+import os
+import struct
+import tempfile
+from io import BytesIO
+from typing import Callable, Optional
+
+MAGIC = b"FUGUTEX1"
+HEADER = struct.Struct("<8s8sIIII")
+FLIP_VERTICAL = 1
+CACHE_ENV = "FUGU_TEXTURE_CACHE"
+
+
+def decode_image(name: str, data, keep_data: bool = True):
+    """PNG などのバイト列を Kivy の ImageLoader でデコードする（テクスチャはまだ作らない）。"""
+    from kivy.core.image import ImageLoader
+    ext = os.path.splitext(name)[1].lstrip(".").lower()
+    return ImageLoader.load(name, rawdata=BytesIO(data), inline=True, ext=ext, keep_data=keep_data)
+
+
+class CachedImage:
+    """キャッシュの1枚。texture を初めて読んだときに mmap から GPU に送り、mmap を閉じる。"""
+
+    __slots__ = ("fmt", "width", "height", "rowlength", "flip", "_mm", "_texture")
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            # ACCESS_COPY：書き込み可能なバッファとして渡せる（Kivy の blit_buffer は読み取り専用を受け付けない）
+            # 書かない限りページはファイルと共有のまま
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, fmt, self.width, self.height, self.rowlength, flags = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"テクスチャキャッシュではありません: {path}")
+        self.fmt = fmt.rstrip(b"\0").decode("ascii")
+        self.flip = bool(flags & FLIP_VERTICAL)
+        self._texture = None
+
+    @property
+    def texture(self):
+        if self._texture is None:
+            from kivy.graphics.texture import Texture
+            tex = Texture.create(size=(self.width, self.height), colorfmt=self.fmt)
+            with memoryview(self._mm) as mv:
+                tex.blit_buffer(mv[HEADER.size:], colorfmt=self.fmt, bufferfmt="ubyte",
+                                rowlength=self.rowlength)
+            self._mm.close()
+            if self.flip:
+                tex.flip_vertical()
+            self._texture = tex
+        return self._texture
+
+
+class TextureCache:
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = (cache_dir or os.environ.get(CACHE_ENV)
+                          or os.path.join(tempfile.gettempdir(), "fugu_textures"))
+
+    def _stem(self, name: str) -> str:
+        return name.replace("/", "_").replace("\\", "_")
+
+    def path(self, name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{self._stem(name)}-{key}.tex")
+
+    def get(self, name: str, key: str) -> Optional[CachedImage]:
+        try:
+            return CachedImage(self.path(name, key))
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def put(self, name: str, key: str, image) -> bool:
+        """ImageLoader の結果（keep_data=True で読んだもの）を書く。書けなければ False。"""
+        frames = getattr(image, "_data", None)
+        if not frames:
+            return False
+        im = frames[0]
+        path = self.path(name, key)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, im.fmt.encode("ascii"), im.width, im.height,
+                                im.rowlength or 0, FLIP_VERTICAL if im.flip_vertical else 0))
+            f.write(im.data)
+        os.replace(tmp, path)
+        # 同じ名前の古いキャッシュ（元の画像が変わる前のもの）を消す
+        for old in glob.glob(os.path.join(glob.escape(self.cache_dir), glob.escape(self._stem(name)) + "-*.tex")):
+            if old != path:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+        return True
+
+    def load(self, name: str, key: str, decode: Callable[[], object]):
+        """キャッシュにあればそれを、無ければ decode() してキャッシュに書いた結果を返す。"""
+        hit = self.get(name, key)
+        if hit is not None:
+            return hit
+        image = decode()
+        if image is not None:
+            try:
+                self.put(name, key, image)
+            except (OSError, AttributeError, UnicodeError):
+                pass
+        return image
+
+
+_cache: Optional[TextureCache] = None
+
+
+def texture_cache() -> TextureCache:
+    global _cache
+    if _cache is None:
+        _cache = TextureCache()
+    return _cache
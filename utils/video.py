@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+背景動画：デコードを別スレッドに逃がし、ゲームのフレームを邪魔しない
+目的：
+- 動画のデコードはワーカースレッド（ffpyplayer）で行い、結果を小さなキューに入れる
+- キューがあふれたら古いフレームから捨てる（ゲームが重い時は動画がコマ落ちするだけ）
+- メインスレッドは1フレームに最大1回、最新のフレームをテクスチャに書き込むだけ
+- デコード解像度はウィンドウサイズまでに抑える
+- 低スペック機向けに「連番画像（事前に書き出したもの）」のループ再生に切り替えられる
+- ffpyplayer も連番画像も無いときは kivy の Video（gstreamer など）で再生する
+
+使い方（例）：
+    bg = VideoBackground(get_path("background.mp4"), size=Window.size)
+    bg.play() / bg.stop()
+
+連番画像の書き出し（オフライン・ffmpeg が必要）：
+    python -m utils.video background.mp4            # → background_frames/0001.jpg ...
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from glob import glob
+from typing import Optional
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
+from kivy.uix.widget import Widget
+
+SEQUENCE_FPS = 12
+
+
+def sequence_dir(video_path: str) -> str:
+    """background.mp4 → background_frames/"""
+    return os.path.splitext(video_path)[0] + "_frames"
+
+
+class VideoBackground(Widget):
+    def __init__(self, source: str, queue_size: int = 3, low_end: bool = False,
+                 volume: float = 0.0, **kwargs):
+        """
+        queue_size: デコード済みフレームを何枚まで溜めるか（少ないほど遅延もメモリも小さい）
+        low_end: True なら動画をデコードせず連番画像を流す
+        volume: 0 なら音声トラックはデコードしない
+        """
+        super().__init__(**kwargs)
+        self.source = source
+        self.low_end = low_end
+        self.volume = volume
+        self.frames = deque(maxlen=max(1, queue_size))   # あふれたら古いものが消える
+        self._lock = threading.Lock()   # frames の出し入れと数え上げをまとめて行う
+        self.decoded = 0
+        self.shown = 0
+        self.dropped = 0        # デコードしたが表示しなかったフレーム数
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._tick_ev = None
+        self._seq = []          # 連番画像モードのテクスチャ
+        self._seq_i = 0
+        self._video = None      # どちらも使えないときの kivy の Video
+
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self.rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._layout, size=self._layout)
+
+    def _layout(self, *_):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
+        if self._video is not None:
+            self._video.pos = self.pos
+            self._video.size = self.size
+
+    # --- 再生制御 ---
+    def play(self):
+        if self._running:
+            return
+        self._running = True
+        if not self.low_end and self._start_decoder():
+            self._tick_ev = Clock.schedule_interval(self._tick_video, 0)
+            return
+        # ffpyplayer が無い等 → 連番画像、それも無ければ kivy の Video
+        self._load_sequence()
+        if self._seq:
+            self._tick_ev = Clock.schedule_interval(self._tick_sequence, 1.0 / SEQUENCE_FPS)
+        else:
+            self._start_kivy_video()
+
+    def stop(self):
+        self._running = False
+        if self._tick_ev is not None:
+            self._tick_ev.cancel()
+            self._tick_ev = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.frames.clear()
+        if self._video is not None:
+            self._video.state = "stop"
+            self._video.unload()
+            self.remove_widget(self._video)
+            self._video = None
+
+    def _start_kivy_video(self):
+        if not self.source or not os.path.exists(self.source):
+            return
+        from kivy.uix.video import Video
+
+        self._video = Video(source=self.source, state="play", options={"eos": "loop"}, volume=self.volume,
+                            allow_stretch=True, keep_ratio=False, pos=self.pos, size=self.size)
+        self.add_widget(self._video)
+
+    # --- ワーカー（動画デコード） ---
+    def _start_decoder(self) -> bool:
+        try:
+            from ffpyplayer.player import MediaPlayer  # noqa: F401
+        except ImportError:
+            return False
+        if not self.source or not os.path.exists(self.source):
+            return False
+        self._thread = threading.Thread(target=self._decode, name="video-decode", daemon=True)
+        self._thread.start()
+        return True
+
+    def _decode(self):
+        from ffpyplayer.player import MediaPlayer
+
+        # loop=0: 無限ループ、an: 音声なし
+        # rgba：1画素 4 バイトなので、行の詰め物（linesize）も画素数で表せる
+        opts = {"out_fmt": "rgba", "loop": 0, "an": self.volume <= 0}
+        player = MediaPlayer(self.source, ff_opts=opts)
+        if self.volume > 0:
+            player.set_volume(self.volume)
+        capped = False
+        try:
+            while self._running:
+                frame, val = player.get_frame()
+                if val == "eof":
+                    break
+                if frame is None:
+                    time.sleep(0.005)
+                    continue
+                img, _pts = frame
+                w, h = img.get_size()
+                if not capped:
+                    # ウィンドウより大きい動画は縮小してデコードさせる
+                    cap_w, cap_h = Window.size
+                    if w > cap_w or h > cap_h:
+                        scale = min(cap_w / w, cap_h / h)
+                        player.set_size(int(w * scale), int(h * scale))
+                    capped = True
+                item = (img.to_bytearray()[0], (w, h), img.get_linesizes()[0] // 4)
+                # val はこのフレームを出すまでの待ち時間。待ってから渡す（先に渡すと早く表示されてしまう）
+                wait = val if val and val > 0 else 0.0
+                while wait > 0 and self._running:
+                    time.sleep(min(wait, 0.1))
+                    wait -= 0.1
+                with self._lock:
+                    if len(self.frames) == self.frames.maxlen:
+                        self.dropped += 1       # いちばん古いものが押し出される
+                    self.frames.append(item)
+                    self.decoded += 1
+        finally:
+            player.close_player()
+
+    # --- メインスレッド ---
+    def _tick_video(self, dt):
+        # 最新の1枚だけ使う（残りは捨てる）。取り出しと捨てるのは、ワーカーが割り込まないようにまとめて
+        with self._lock:
+            if not self.frames:
+                return
+            buf, size, rowlength = self.frames.pop()
+            self.dropped += len(self.frames)
+            self.frames.clear()
+        tex = self.rect.texture
+        if tex is None or tuple(tex.size) != size:
+            tex = Texture.create(size=size, colorfmt="rgba")
+            tex.flip_vertical()
+            self.rect.texture = tex
+        # 行の終わりに詰め物があっても斜めにずれないよう、1行の画素数（rowlength）を渡す
+        tex.blit_buffer(buf, colorfmt="rgba", bufferfmt="ubyte", rowlength=rowlength)
+        self.canvas.ask_update()
+        self.shown += 1
+
+    def _load_sequence(self):
+        if self._seq:
+            return
+        from kivy.core.image import Image as CoreImage
+
+        d = sequence_dir(self.source)
+        for path in sorted(glob(os.path.join(d, "*.jpg")) + glob(os.path.join(d, "*.png"))):
+            self._seq.append(CoreImage(path).texture)
+
+    def _tick_sequence(self, dt):
+        if not self._seq:
+            return False
+        self.rect.texture = self._seq[self._seq_i]
+        self._seq_i = (self._seq_i + 1) % len(self._seq)
+        self.shown += 1
+
+
+def bake_sequence(video_path: str, width: int = 960, fps: int = SEQUENCE_FPS) -> str:
+    """低スペック機用の連番画像を書き出す（ffmpeg を使う）。出力フォルダを返す。"""
+    out = sequence_dir(video_path)
+    os.makedirs(out, exist_ok=True)
+    subprocess.run(["ffmpeg", "-y", "-i", video_path, "-vf", f"fps={fps},scale={width}:-2",
+                    "-q:v", "4", os.path.join(out, "%04d.jpg")], check=True)
+    return out
+
+
+if __name__ == "__main__":
+    for src in sys.argv[1:]:
+        print(bake_sequence(src))
@@ -1,12 +1,22 @@
+from time import perf_counter
+T0 = perf_counter()  # 起動時間の計測の起点（最初のフレームまでの時間をログに出す）
+
 import os
 import sys
+import json
 import random
 import math
 
 # Kivyのビデオエンジン
 os.environ['KIVY_VIDEO'] = 'ffpyplayer'
 
+# リポジトリ直下の utils/ を使う（障害物の Mesh は utils/quad_batch.py、動画は utils/video.py、パックは utils/assetpack.py）
+# PyInstaller 版は spec の pathex で同梱される
+if not getattr(sys, 'frozen', False):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from kivy.app import App
+from kivy.logger import Logger
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.clock import Clock
@@ -18,26 +28,117 @@ from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.togglebutton import ToggleButton
-from kivy.uix.slider import Slider
 from kivy.graphics import Color, Rectangle, PushMatrix, PopMatrix, Rotate
-from kivy.uix.video import Video
+from kivy.core.image import Image as CoreImage
+# kivy.uix.video（動画プロバイダの読み込み）と Slider は、使う画面を初めて作るときに読む
+
+from utils.assetpack import PACK_NAME, AssetPack
+from utils.quad_batch import QuadBatch
+from utils.video import VideoBackground
 
 # ------------------------------------------
 # パス関連
 # ------------------------------------------
-def get_path(filename):
+# 素材の場所は最初の1回だけ調べて目録にする（get_path のたびにファイルの有無を調べない）
+# PyInstaller 版は同梱の asset_manifest.json を読むだけ（作り方は FuguRunnerApp.spec の先頭）
+# 素材を assets.fpk にまとめて配るときは、目録に無い名前をパックから引く
+# （画像は get_texture でパックから直接。get_path が書き出すのは音・動画・フォントだけ）
+ASSET_DIRS = ("", "assets")   # 探す順（直下 → assets/）
+MANIFEST_NAME = "asset_manifest.json"
+_assets = None
+_names = None
+
+def get_base_path():
     if getattr(sys, 'frozen', False):
-        base = sys._MEIPASS
-    else:
-        base = os.path.dirname(os.path.abspath(__file__))
-    paths = [
-        os.path.join(base, filename),
-        os.path.join(base, "assets", filename)
-    ]
-    for p in paths:
-        if os.path.exists(p):
-            return p
-    return None
+        return sys._MEIPASS
+    return os.path.dirname(os.path.abspath(__file__))
+
+def _scan_assets(base):
+    found = {}
+    for d in ASSET_DIRS:
+        folder = os.path.join(base, d) if d else base
+        if not os.path.isdir(folder):
+            continue
+        for entry in os.scandir(folder):
+            if entry.is_file():
+                found.setdefault(entry.name, os.path.join(d, entry.name) if d else entry.name)
+    return found
+
+def _asset_index():
+    global _assets
+    if _assets is None:
+        base = get_base_path()
+        found = None
+        if getattr(sys, 'frozen', False):
+            try:
+                with open(os.path.join(base, MANIFEST_NAME), encoding="utf-8") as f:
+                    found = {name: e["path"] for name, e in json.load(f)["assets"].items()}
+            except (OSError, ValueError, KeyError):
+                pass
+        if found is None:
+            found = _scan_assets(base)
+        _assets = {name: os.path.join(base, rel) for name, rel in found.items()}
+    return _assets
+
+def asset_name(filename):
+    """
+    素材の本当の名前（"kirimi.png" → "Kirimi.png"）。大文字・小文字は区別しない。
+    以前の os.path.exists（Windows）と同じく、名前の書き方が違っても見つかるように。
+    """
+    global _names
+    if _names is None:
+        pack = asset_pack()
+        names = list(pack.entries) if pack is not None else []
+        names += list(_asset_index())   # バラのファイルを優先
+        _names = {name.lower(): name for name in names}
+    return _names.get(filename.lower(), filename)
+
+def get_path(filename):
+    filename = asset_name(filename)
+    index = _asset_index()
+    path = index.get(filename)
+    if path is None:
+        # バラのファイルに無ければアセットパックから（書き出したパスを覚えておく）
+        # 画像はファイル名が要らないので書き出さない（get_texture を使う）
+        pack = asset_pack()
+        if pack is not None and filename in pack and pack.entry(filename).kind != "image":
+            path = index[filename] = pack.extract(filename)
+    return path
+
+# ------------------------------------------
+# アセットパック（assets.fpk。形式・読み込みは utils/assetpack.py、作り方は FuguRunnerApp.spec）
+# ------------------------------------------
+_pack = None
+_pack_opened = False
+_textures = {}
+
+def asset_pack():
+    """目録にある assets.fpk（最初の1回だけ開く）。無ければ None。"""
+    global _pack, _pack_opened
+    if not _pack_opened:
+        _pack_opened = True
+        path = _asset_index().get(PACK_NAME)
+        try:
+            _pack = AssetPack(path) if path else None
+        except (OSError, ValueError):
+            _pack = None
+    return _pack
+
+def get_texture(filename):
+    """画像の Texture（1回だけ読む）。パックの画像は一時ファイルに書き出さず、mmap の中身からデコードする。"""
+    filename = asset_name(filename)
+    tex = _textures.get(filename)
+    if tex is None:
+        path = _asset_index().get(filename)
+        if path is not None:
+            tex = CoreImage(path).texture
+        else:
+            pack = asset_pack()
+            if pack is None or filename not in pack:
+                return None
+            tex = pack.texture(filename)
+        _textures[filename] = tex
+    return tex
 
 def get_font():
     f = get_path("GenShinGothic-Regular.ttf")
@@ -51,7 +152,7 @@ ORANGE = (1, 0.5, 0, 1)
 class Kirimi(Image):
     def __init__(self, start_pos, target_pos, **kwargs):
         super().__init__(**kwargs)
-        self.source = get_path("kirimi.png")
+        self.texture = get_texture("kirimi.png")
         self.size = (60, 60)
         self.size_hint = (None, None)
         self.center = start_pos
@@ -68,7 +169,7 @@ class Boss(Image):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.source = get_path("boss.png")
+        self.texture = get_texture("boss.png")
         self.size = (350, 350)
         self.size_hint = (None, None)
         self.x, self.y = Window.width, Window.height/2
@@ -88,7 +189,7 @@ class Fugu(Image):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.source = get_path("fugu.png")
+        self.texture = get_texture("fugu.png")
         self.size = (110, 110)
         self.size_hint = (None, None)
         self.pos = (150, 110)
@@ -119,37 +220,63 @@ class Fugu(Image):
     def jump(self):
         if self.y <= 115:
             self.vy = 18
+
+    def reset(self):
+        # ★ リトライ用：位置と状態だけ戻す（画像は読み直さない）
+        self.pos = (150, 110)
+        self.vy = 0
+        self.invincible = False
+        self.opacity = 1.0
+        self.rot.angle = 0
+        self.rot.origin = self.center
+# ------------------------------------------
+# 障害物（ウィジェットではなく、ただの箱）
+# ------------------------------------------
+class Box:
+    # collide_widget に渡せるように x / y / right / top を持つ
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x, y, width, height):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def top(self):
+        return self.y + self.height
+
 # ------------------------------------------
 # メインゲーム
 # ------------------------------------------
 class Game(Widget):
     def __init__(self, diff_mode="NORMAL", **kwargs):
         super().__init__(**kwargs)
-        self.paused = False
-        self.score = 0
-        self.is_game_over = False
-        self.is_boss = False
-        self.is_michael = False
-        self.fever_triggered = False  # ★ 追加：10以上で1回だけFEVER
-
-        modes = {
-            "EASY":   (10, 3.2),
-            "NORMAL": (14, 2.4),
-            "HARD":   (20, 1.6)
-        }
-        self.scroll_speed, self.spawn_interval = modes.get(diff_mode, modes["NORMAL"])
-        self.gravity = -0.4
-
+        # ★ ここでは「1回だけ作るもの」（ウィジェット・テクスチャ・音）を用意する。
+        #    プレイ状態は reset() で作るので、リトライ時は作り直さない
+        self.events = []  # reset 時に止める Clock イベント
+        self.spawn_ev = None  # 生成ループは毎回付け替わるので別に持つ
         self.obstacles = []
         self.bullets = []
         self.boss = None
         self.active_video = None  # ★ video の現在再生中オブジェクト
 
         # 背景コンテナ
+        # ★ 背景ウィジェットは最初に1回だけ作る。ステージ画像はテクスチャで常駐させる
         self.bg_container = Widget()
         self.add_widget(self.bg_container)
+        self.bg_image = Image(size=Window.size, allow_stretch=True, keep_ratio=False)
+        self.bg_container.add_widget(self.bg_image)
+
+        fever_path = get_path("fever_bg.mp4")
+        # 動画のデコードは utils/video.py の VideoBackground（別スレッド。ffpyplayer が無ければ kivy の Video）
+        self.fever_video = VideoBackground(fever_path, volume=1.0, size=Window.size) if fever_path else None
         self.set_bg_image("stage1_bg.png")
 
+        # ★ 障害物は背景のすぐ上に Mesh 1つで描く（1個ずつ Image を作らない）
+        self.obstacle_layer = QuadBatch(self.bg_container.canvas.after, get_texture("bom.png"))
+
         self.fugu = Fugu()
         self.add_widget(self.fugu)
 
@@ -174,26 +301,75 @@ class Game(Widget):
             self.fade_rect = Rectangle(size=Window.size, pos=(0,0))
 
         self.bgm = SoundLoader.load(get_path("bgm.ogg"))
+        self.michael_sounds = None  # 特殊演出の音は初回に読み込んで持ち続ける
+
+        self.reset(diff_mode)
+
+    # ------------------------------------------
+    # リトライ（状態だけ初期化）
+    # ------------------------------------------
+    def reset(self, diff_mode="NORMAL"):
+        self.stop_events()
+        self.paused = False
+        self.score = 0
+        self.is_game_over = False
+        self.is_boss = False
+        self.is_michael = False
+        self.fever_triggered = False  # ★ 追加：10以上で1回だけFEVER
+
+        modes = {
+            "EASY":   (10, 3.2),
+            "NORMAL": (14, 2.4),
+            "HARD":   (20, 1.6)
+        }
+        self.scroll_speed, self.spawn_interval = modes.get(diff_mode, modes["NORMAL"])
+        self.gravity = -0.4
+
+        # 前回の障害物・弾・ボスは画面から外す
+        for w in self.bullets:
+            self.remove_widget(w)
+        self.obstacles.clear()
+        self.obstacle_layer.update_rects([(b.x, b.y, b.width, b.height) for b in self.obstacles])
+        self.bullets.clear()
+        if self.boss:
+            self.remove_widget(self.boss)
+            self.boss = None
+
+        self.fugu.reset()
+        self.score_label.text = "Score: 0"
+        self.msg_label.text = ""
+        self.msg_label.color = (1,1,1,0)
+        self.fade_color.a = 0
+        self.set_bg_image("stage1_bg.png")
+
         if self.bgm:
+            self.bgm.stop()
             self.bgm.loop = True
             self.bgm.play()
 
-        self.update_ev = Clock.schedule_interval(self.update, 1/60.0)
+        self.update_ev = self.schedule(Clock.schedule_interval(self.update, 1/60.0))
         self.spawn_ev = Clock.schedule_once(self.spawn_loop, self.spawn_interval)
-        self.michael_trigger = Clock.schedule_once(
+        self.michael_trigger = self.schedule(Clock.schedule_once(
             lambda dt: self.start_michael(), 60.0
-        )
+        ))
+
+    def schedule(self, ev):
+        self.events.append(ev)
+        return ev
+
+    def stop_events(self):
+        for ev in self.events:
+            ev.cancel()
+        self.events.clear()
+        if self.spawn_ev:
+            self.spawn_ev.cancel()
 
     # ------------------------------------------
     # Video停止（完全破棄）
     # ------------------------------------------
     def stop_active_video(self):
         if self.active_video:
-            try:
-                self.active_video.state = 'stop'
-                self.active_video.unload()
-            except:
-                pass
+            self.active_video.stop()
             if self.active_video.parent:
                 self.bg_container.remove_widget(self.active_video)
             self.active_video = None
@@ -202,33 +378,27 @@ class Game(Widget):
     # 背景設定
     # ------------------------------------------
     def set_bg_image(self, filename):
-        # 既存動画を停止
-        self.stop_active_video()
-
-        self.bg_container.clear_widgets()
-        path = get_path(filename)
-        if not path:
+        # ★ ウィジェットは作り直さない：画像はテクスチャ差し替え、動画は再生/一時停止だけ
+        if filename.endswith(".mp4"):
+            if not self.fever_video:
+                return
+            self.bg_image.opacity = 0
+            if not self.fever_video.parent:
+                self.bg_container.add_widget(self.fever_video)
+            self.fever_video.play()
+            self.active_video = self.fever_video
             return
 
-        if filename.endswith(".mp4"):
-            vid = Video(
-                source=path,
-                state='play',
-                options={'eos': 'loop'},
-                allow_stretch=True,
-                keep_ratio=False,
-                size=Window.size
-            )
-            self.active_video = vid
-            self.bg_container.add_widget(vid)
-        else:
-            img = Image(
-                source=path,
-                size=Window.size,
-                allow_stretch=True,
-                keep_ratio=False
-            )
-            self.bg_container.add_widget(img)
+        if self.active_video:
+            self.active_video.stop()
+            self.bg_container.remove_widget(self.active_video)
+            self.active_video = None
+
+        tex = get_texture(filename)
+        if tex is None:
+            return
+        self.bg_image.texture = tex
+        self.bg_image.opacity = 1
     # ------------------------------------------
     # 入力
     # ------------------------------------------
@@ -267,7 +437,7 @@ class Game(Widget):
     def start_fever(self):
         self.fugu.invincible = True
         self.set_bg_image("fever_bg.mp4")
-        Clock.schedule_once(self.stop_fever, 6.0)
+        self.schedule(Clock.schedule_once(self.stop_fever, 6.0))
 
     def stop_fever(self, dt):
         self.fugu.invincible = False
@@ -286,11 +456,10 @@ class Game(Widget):
         self.fugu.invincible = False
         self.set_bg_image("stage1_bg.png")
 
-        Clock.unschedule(self.spawn_ev)
+        self.spawn_ev.cancel()
 
-        for o in list(self.obstacles):
-            self.remove_widget(o)
         self.obstacles.clear()
+        self.obstacle_layer.update_rects([(b.x, b.y, b.width, b.height) for b in self.obstacles])
 
         self.boss = Boss()
         self.add_widget(self.boss)
@@ -308,29 +477,27 @@ class Game(Widget):
         if self.bgm:
             self.bgm.stop()
 
-        s1 = SoundLoader.load(get_path("特殊演出.ogg"))
+        if self.michael_sounds is None:
+            self.michael_sounds = (SoundLoader.load(get_path("特殊演出.ogg")),
+                                   SoundLoader.load(get_path("特殊演出2.ogg")))
+        s1 = self.michael_sounds[0]
         if s1:
             s1.play()
-            Clock.schedule_once(self.michael_step2, s1.length or 3.0)
+            self.schedule(Clock.schedule_once(self.michael_step2, s1.length or 3.0))
         else:
             self.michael_step2(0)
 
     def michael_step2(self, dt):
-        s2 = SoundLoader.load(get_path("特殊演出2.ogg"))
+        s2 = self.michael_sounds[1]
         if s2:
             s2.play()
 
-        wall = Image(
-            source=get_path("bom.png"),
-            size=(600,600),
-            pos=(Window.width*0.7, 0),
-            size_hint=(None,None)
-        )
-        self.add_widget(wall)
+        wall = Box(Window.width*0.7, 0, 600, 600)
         self.obstacles.append(wall)
+        self.obstacle_layer.update_rects([(b.x, b.y, b.width, b.height) for b in self.obstacles])
 
-        Clock.schedule_interval(self.fade_out, 1/30.0)
-        Clock.schedule_once(lambda d: self.die(), 4.0)
+        self.schedule(Clock.schedule_interval(self.fade_out, 1/30.0))
+        self.schedule(Clock.schedule_once(lambda d: self.die(), 4.0))
 
     def fade_out(self, dt):
         self.fade_color.a = min(1.0, self.fade_color.a + 0.015)
@@ -369,13 +536,13 @@ class Game(Widget):
             for o in list(self.obstacles):
                 o.x -= self.scroll_speed
 
-                if o.collide_widget(self.fugu) and not self.fugu.invincible:
+                if self.fugu.collide_widget(o) and not self.fugu.invincible:
                     self.die()
 
                 if o.right < 0:
-                    self.remove_widget(o)
                     self.obstacles.remove(o)
                     self.set_score(self.score + 1)
+            self.obstacle_layer.update_rects([(b.x, b.y, b.width, b.height) for b in self.obstacles])
 
     # ------------------------------------------
     # 障害物の生成
@@ -385,14 +552,7 @@ class Game(Widget):
             self.spawn_ev = Clock.schedule_once(self.spawn_loop, 1)
             return
 
-        o = Image(
-            source=get_path("bom.png"),
-            size=(100,100),
-            size_hint=(None,None),
-            pos=(Window.width, 110)
-        )
-        self.add_widget(o)
-        self.obstacles.append(o)
+        self.obstacles.append(Box(Window.width, 110, 100, 100))
 
         self.spawn_ev = Clock.schedule_once(self.spawn_loop, self.spawn_interval)
 
@@ -403,26 +563,33 @@ class Game(Widget):
         self.is_game_over = True
         self.msg_label.text = "VICTORY!"
         self.msg_label.color = (1,1,0,1)
-        Clock.schedule_once(lambda dt: self.die(), 2.5)
+        self.schedule(Clock.schedule_once(lambda dt: self.die(), 2.5))
 
     def die(self):
         self.is_game_over = True
-        self.cleanup()
+        self.halt()
         App.get_running_app().sm.current = 'gameover'
 
     # ------------------------------------------
-    # 終了処理（動画完全破棄）
+    # 停止（ウィジェット・音・テクスチャは残す。次は reset() で再開）
     # ------------------------------------------
-    def cleanup(self):
-        Clock.unschedule(self.update_ev)
-        Clock.unschedule(self.spawn_ev)
-        Clock.unschedule(self.michael_trigger)
-
+    def halt(self):
+        self.stop_events()
         if self.bgm:
             self.bgm.stop()
+        if self.active_video:
+            self.active_video.stop()
+
+    # ------------------------------------------
+    # 終了処理（動画完全破棄）
+    # ------------------------------------------
+    def cleanup(self):
+        self.halt()
 
         # Video完全停止
         self.stop_active_video()
+        if self.fever_video:
+            self.fever_video.stop()
 
         self.bg_container.clear_widgets()
         self.clear_widgets()
@@ -471,26 +638,16 @@ class HomeScreen(Screen):
         self.stop_home_video()
         path = get_path("background.mp4")
         if path:
-            self.hv = Video(
-                source=path,
-                state='play',
-                options={'eos': 'loop'},
-                allow_stretch=True,
-                keep_ratio=False,
-                size=Window.size
-            )
+            self.hv = VideoBackground(path, volume=1.0, size=Window.size)
             self.add_widget(self.hv, index=10)
+            self.hv.play()
 
     def on_leave(self):
         self.stop_home_video()
 
     def stop_home_video(self):
         if hasattr(self, 'hv') and self.hv:
-            try:
-                self.hv.state = 'stop'
-                self.hv.unload()
-            except:
-                pass
+            self.hv.stop()
             if self.hv.parent:
                 self.remove_widget(self.hv)
             self.hv = None
@@ -562,6 +719,7 @@ class SettingsScreen(Screen):
             color=ORANGE
         ))
 
+        from kivy.uix.slider import Slider
         layout.add_widget(Label(text="音量設定 (Slider)", font_name=get_font()))
         layout.add_widget(Slider(min=0, max=1, value=0.6))
 
@@ -609,6 +767,7 @@ class AdminPanel(Screen):
         self.info = Label(text="Score: 0", font_size=40, font_name=get_font())
         layout.add_widget(self.info)
 
+        from kivy.uix.slider import Slider
         self.sc = Slider(min=0, max=100, value=0, step=1)
         self.sc.bind(value=lambda inst, v: setattr(self.info, "text", f"Score: {int(v)}"))
         layout.add_widget(self.sc)
@@ -637,16 +796,14 @@ class GameInitScreen(Screen):
         app = App.get_running_app()
         sm = self.manager
 
+        # ★ 2回目以降は同じ Game を reset して使い回す（リトライを即開始）
         if sm.has_screen('game_play'):
-            old_screen = sm.get_screen('game_play')
-            old_screen.game.cleanup()
-            sm.remove_widget(old_screen)
-
-        new_screen = Screen(name='game_play')
-        new_screen.game = Game(diff_mode=app.selected_diff)
-        new_screen.add_widget(new_screen.game)
-
-        sm.add_widget(new_screen)
+            sm.get_screen('game_play').game.reset(app.selected_diff)
+        else:
+            new_screen = Screen(name='game_play')
+            new_screen.game = Game(diff_mode=app.selected_diff)
+            new_screen.add_widget(new_screen.game)
+            sm.add_widget(new_screen)
         sm.current = 'game_play'
 
 
@@ -674,22 +831,48 @@ class GameOverScreen(Screen):
         self.add_widget(layout)
 
 
+class LazyScreenManager(ScreenManager):
+    """register した画面は、初めて開く（get_screen される）ときに作る。"""
+    def __init__(self, **kwargs):
+        self.factories = {}
+        super().__init__(**kwargs)
+
+    def register(self, name, factory):
+        self.factories[name] = factory
+
+    def get_screen(self, name):
+        # current を変えたときも Kivy はここを通る
+        if name in self.factories and not self.has_screen(name):
+            self.add_widget(self.factories[name](name=name))
+        return super().get_screen(name)
+
+
 class FuguRunnerApp(App):
     def build(self):
         self.selected_diff = "NORMAL"
 
-        self.sm = ScreenManager(transition=NoTransition())
+        # 起動時は解説とホームだけ作る。ほかの画面は初めて開くときに作る
+        self.sm = LazyScreenManager(transition=NoTransition())
         self.sm.add_widget(TutorialScreen(name='tutorial'))
         self.sm.add_widget(HomeScreen(name='home'))
-        self.sm.add_widget(SettingsScreen(name='settings'))
-        self.sm.add_widget(GameInitScreen(name='game_init'))
-        self.sm.add_widget(AdminPanel(name='admin'))
-        self.sm.add_widget(GameOverScreen(name='gameover'))
+        self.sm.register('settings', SettingsScreen)
+        self.sm.register('game_init', GameInitScreen)
+        self.sm.register('admin', AdminPanel)
+        self.sm.register('gameover', GameOverScreen)
 
         Window.bind(on_key_down=self._on_key)
+        Window.bind(on_flip=self._on_first_flip)
 
         return self.sm
 
+    def _on_first_flip(self, window):
+        window.unbind(on_flip=self._on_first_flip)
+        Logger.info(f"Startup: first frame {1000 * (perf_counter() - T0):.0f} ms")
+
+    def on_stop(self):
+        if self.sm.has_screen('game_play'):
+            self.sm.get_screen('game_play').game.cleanup()
+
     def _on_key(self, window, key, *args):
         # K key (107)
         if key == 107 and self.sm.current == 'game_play':
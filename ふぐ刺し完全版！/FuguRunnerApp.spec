@@ -1,11 +1,33 @@
 # -*- mode: python ; coding: utf-8 -*-
+# 素材はアセットパック（assets.fpk）1つにまとめ、目録（asset_manifest.json）と一緒に同梱する
+# （assets/ のばらばらのファイルは入れない。起動時に素材フォルダを走査しないように）
+# パックと目録はビルドのたびにここで build/assetpack/ に作る（生成物なのでコミットしない）。中身は：
+#   python -m tools.pack_assets --root ふぐ刺し完全版！ --dirs assets --exclude ... --out .../assets.fpk
+#   python -m tools.asset_manifest --root .../build/assetpack --dirs ""
+# wav を足したら ffmpeg が要る（ogg に変換して入れる。変換できなければ pack_assets がビルドを止める）
+import os
+import subprocess
+import sys
 
+REPO_ROOT = os.path.abspath(os.path.join(SPECPATH, '..'))
+PACK_OUT = os.path.join(SPECPATH, 'build', 'assetpack')
+# どこからも読まない素材は入れない（wav の原盤。ゲームが鳴らすのは 特殊演出.ogg / 特殊演出2.ogg）
+PACK_EXCLUDE = ['三分の位置脂肪_directed-by-michael-bay*.wav']
+
+subprocess.run([sys.executable, '-m', 'tools.pack_assets', '--root', SPECPATH, '--dirs', 'assets',
+                '--out', os.path.join(PACK_OUT, 'assets.fpk'), '--exclude', *PACK_EXCLUDE],
+               cwd=REPO_ROOT, check=True)
+subprocess.run([sys.executable, '-m', 'tools.asset_manifest', '--root', PACK_OUT, '--dirs', ''],
+               cwd=REPO_ROOT, check=True)
+datas = [(os.path.join(PACK_OUT, 'assets.fpk'), '.'),
+         (os.path.join(PACK_OUT, 'asset_manifest.json'), '.')]
 
 a = Analysis(
     ['FuguRunnerApp.py'],
-    pathex=[],
+    # リポジトリ直下の utils/（動画・サウンド・アセットパック）を同梱する
+    pathex=[REPO_ROOT],
     binaries=[],
-    datas=[('assets', 'assets')],
+    datas=datas,
     hiddenimports=['kivy', 'kivy.uix', 'kivy.graphics'],
     hookspath=[],
     hooksconfig={},